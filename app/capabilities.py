@@ -0,0 +1,428 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2026 Michael Gasche
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+
+# File:        capabilities.py
+# Version:     1.0
+# Author:      Michael Gasche
+# Created:     2026-10
+# Product:     Phosphor
+# Description: Cached, asynchronous hardware and libmpv capability probe.
+
+
+import os
+import re
+import sys
+import glob
+import json
+import shutil
+import hashlib
+import platform
+import threading
+import subprocess
+
+from settings_store import write_json_atomic
+
+
+# Bump when the probe logic changes so cached results are re-probed
+PROBE_VERSION = 2
+
+# Seconds allowed per external command (system_profiler can be slow)
+COMMAND_TIMEOUT = 30.0
+
+
+def run_command(args) -> str:
+    """Output of a command, or "" if it is missing or fails."""
+    try:
+        return subprocess.check_output(
+            args, stderr=subprocess.DEVNULL, timeout=COMMAND_TIMEOUT
+        ).decode("utf-8", errors="replace")
+    except Exception:
+        return ""
+
+
+def metal_supported(system: str, machine: str, gpus) -> bool:
+    """Metal-based rendering check for macOS (always True elsewhere)."""
+    if system != "Darwin" or machine == "arm64":
+        return True
+    if not gpus:
+        return False
+
+    for gpu in gpus:
+        gpu_lower = gpu.lower()
+        if "nvidia" in gpu_lower and any(gen in gpu_lower for gen in ["gtx 6", "gtx 7", "kepler"]):
+            return False
+        if "intel" in gpu_lower and any(gen in gpu_lower for gen in ["hd 4", "hd 5"]):
+            return False
+        # AMD -> Polaris, Vega, Navi OK
+        # possible to add more checks here if needed
+
+    return True
+
+
+# Where libmpv is looked up for the fingerprint (besides the library path variables)
+LIBMPV_PATTERNS = {
+    "Darwin": ["libmpv*.dylib"],
+    "Linux": ["libmpv.so*"],
+    "Windows": ["libmpv-2.dll", "mpv-2.dll", "mpv-1.dll"],
+}
+LIBMPV_DIRS = {
+    "Darwin": ["/opt/homebrew/opt/mpv/lib", "/opt/homebrew/lib", "/usr/local/lib"],
+    "Linux": ["/usr/local/lib", "/usr/lib64", "/usr/lib/*-linux-gnu", "/usr/lib"],
+    "Windows": [os.path.dirname(os.path.abspath(sys.argv[0] or "."))],
+}
+LIBRARY_PATH_VARS = ("DYLD_LIBRARY_PATH", "LD_LIBRARY_PATH", "PATH")
+
+
+def file_identity(path: str):
+    """Resolved path, size and mtime of a file (changes with every upgrade), or None."""
+    if not path:
+        return None
+    try:
+        real = os.path.realpath(path)
+        st = os.stat(real)
+    except OSError:
+        return None
+    return {"path": real, "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
+def find_libmpv(system: str):
+    """Path of the libmpv that python-mpv would most likely load (stat/glob only, no dlopen)."""
+    dirs = []
+    for var in LIBRARY_PATH_VARS:
+        dirs += [d for d in os.environ.get(var, "").split(os.pathsep) if d]
+    for pattern in LIBMPV_DIRS.get(system, []):
+        dirs += sorted(glob.glob(pattern))
+    for directory in dirs:
+        for pattern in LIBMPV_PATTERNS.get(system, ["libmpv*"]):
+            matches = sorted(glob.glob(os.path.join(glob.escape(directory), pattern)))
+            if matches:
+                return matches[0]
+    return None
+
+
+def parse_help_list(output: str):
+    """Names from mpv's --vo=help / --hwdec=help listings (indented first column)."""
+    names = []
+    for line in output.splitlines():
+        if line.startswith("  ") and line.strip():
+            names.append(line.split()[0])
+    return names
+
+
+# -------------------------------
+# Probe backends
+# -------------------------------
+
+class ProbeBackend:
+    """
+    System specific part of the probe. fingerprint() must be cheap (it runs
+    on every launch); gpus() and mpv_info() may be slow (background only).
+    The fingerprint includes the mpv executable and libmpv files, so a
+    cached probe is redone after mpv is upgraded.
+    """
+
+    def fingerprint(self) -> dict:
+        uname = platform.uname()
+        return {
+            "system": uname.system,
+            "release": uname.release,
+            "version": uname.version,
+            "machine": uname.machine,
+            "mpv": file_identity(shutil.which("mpv")),
+            "libmpv": file_identity(find_libmpv(uname.system)),
+        }
+
+    def gpus(self):
+        return []
+
+    def mpv_info(self) -> dict:
+        """libmpv/FFmpeg versions and the VOs and hwdec backends mpv offers."""
+        info = {"mpv_version": None, "ffmpeg_version": None, "vos": [], "hwdecs": []}
+        try:
+            from player.libmpv import load_mpv
+            player = load_mpv().MPV(vo="null", ao="null", idle=True, loglevel="error")
+            try:
+                info["mpv_version"] = player["mpv-version"]
+                info["ffmpeg_version"] = player["ffmpeg-version"]
+            finally:
+                player.terminate()
+        except Exception as e:
+            print(f"Capability probe: libmpv unavailable ({e})", flush=True)
+
+        # Listings are only printed by the mpv executable
+        exe = shutil.which("mpv")
+        if exe:
+            info["vos"] = parse_help_list(run_command([exe, "--no-config", "--vo=help"]))
+            info["hwdecs"] = parse_help_list(run_command([exe, "--no-config", "--hwdec=help"]))
+        return info
+
+
+class MacProbeBackend(ProbeBackend):
+
+    def fingerprint(self) -> dict:
+        data = super().fingerprint()
+        data["model"] = run_command(["sysctl", "-n", "hw.model"]).strip()
+        return data
+
+    def gpus(self):
+        output = run_command(["system_profiler", "SPDisplaysDataType"])
+        return re.findall(r'^\s*Chipset Model:\s*(.+)$', output, re.MULTILINE)
+
+
+class LinuxProbeBackend(ProbeBackend):
+
+    def __init__(self, sysfs_root: str = "/sys"):
+        self.sysfs_root = sysfs_root
+
+    def _drm_ids(self):
+        """vendor:device PCI ids of the DRM cards (cheap sysfs reads)."""
+        ids = []
+        for device in sorted(glob.glob(os.path.join(self.sysfs_root, "class", "drm", "card[0-9]*", "device"))):
+            try:
+                with open(os.path.join(device, "vendor")) as f:
+                    vendor = f.read().strip()
+                with open(os.path.join(device, "device")) as f:
+                    ids.append(f"{vendor}:{f.read().strip()}")
+            except OSError:
+                continue
+        return sorted(set(ids))
+
+    def fingerprint(self) -> dict:
+        data = super().fingerprint()
+        data["gpu_ids"] = self._drm_ids()
+        return data
+
+    def gpus(self):
+        output = run_command(["lspci", "-mm"])
+        names = []
+        for line in output.splitlines():
+            fields = re.findall(r'"([^"]*)"', line)
+            if len(fields) >= 3 and any(c in fields[0] for c in ("VGA", "3D", "Display")):
+                names.append(f"{fields[1]} {fields[2]}")
+        return names or self._drm_ids()
+
+
+class WindowsProbeBackend(ProbeBackend):
+
+    def fingerprint(self) -> dict:
+        data = super().fingerprint()
+        data["processor"] = platform.processor()
+        return data
+
+    def gpus(self):
+        output = run_command([
+            "powershell", "-NoProfile", "-Command",
+            "(Get-CimInstance Win32_VideoController).Name",
+        ])
+        return [line.strip() for line in output.splitlines() if line.strip()]
+
+
+class FakeProbeBackend(ProbeBackend):
+    """Canned results, for exercising the probe and cache without real hardware."""
+
+    def __init__(self, fingerprint=None, gpus=None, mpv_info=None, system="Linux", machine="x86_64"):
+        self._fingerprint = fingerprint or {"system": system, "machine": machine, "fake": True}
+        self._gpus = list(gpus or ["Fake GPU"])
+        self._mpv_info = mpv_info or {
+            "mpv_version": "mpv 0.0.0-fake",
+            "ffmpeg_version": "0.0-fake",
+            "vos": ["gpu", "gpu-next", "null"],
+            "hwdecs": ["no", "auto-copy"],
+        }
+        self.system = system
+        self.machine = machine
+        self.probe_count = 0
+
+    def fingerprint(self) -> dict:
+        return dict(self._fingerprint)
+
+    def gpus(self):
+        self.probe_count += 1
+        return list(self._gpus)
+
+    def mpv_info(self) -> dict:
+        return dict(self._mpv_info)
+
+
+def backend_for(system: str = None) -> ProbeBackend:
+    """Probe backend of the running (or given) OS."""
+    system = system or platform.system()
+    if system == "Darwin":
+        return MacProbeBackend()
+    if system == "Linux":
+        return LinuxProbeBackend()
+    if system == "Windows":
+        return WindowsProbeBackend()
+    return ProbeBackend()
+
+
+# -------------------------------
+# CapabilityProbe class
+# -------------------------------
+
+class CapabilityProbe:
+    """
+    Probes GPU, libmpv version, VOs and hwdec backends once in the background
+    and caches the result in a JSON file keyed by a hardware/OS fingerprint,
+    so later launches read it without running any slow system tools.
+    The Metal check (the only part opening a file waits for) is answered
+    first, and at once where it cannot fail (everything but Intel Macs).
+    """
+
+    def __init__(self, cache_file: str = None, backend: ProbeBackend = None):
+        self.cache_file = cache_file
+        self.backend = backend or backend_for()
+        self.key = None
+        self._result = None
+        self._ready = threading.Event()
+        self._metal = None
+        self._metal_ready = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+
+
+    # -------------------------------
+    # Public API
+    # -------------------------------
+
+    def start(self):
+        """Use the cached result or start probing in the background; never blocks long."""
+        with self._lock:
+            if self._thread is not None or self._ready.is_set():
+                return
+
+            if not self._metal_check_needed():
+                self._set_metal(True)
+
+            self.key = self._fingerprint_key()
+            cached = self._load_cache().get(self.key)
+            if cached is not None:
+                self._result = cached
+                self._set_metal(cached.get("metal_supported", True))
+                self._ready.set()
+                print("Capabilities: cached", flush=True)
+                return
+
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def ready(self) -> bool:
+        return self._ready.is_set()
+
+    def wait(self, timeout: float = None):
+        """Capabilities dict, or None if the probe did not finish in time."""
+        self._ready.wait(timeout)
+        return self._result
+
+    @property
+    def result(self):
+        return self._result
+
+    def metal_ready(self) -> bool:
+        """True once metal_supported() is known (without waiting for the libmpv part)."""
+        return self._metal_ready.is_set()
+
+    def metal_supported(self):
+        """Whether Phosphor's Metal rendering works here; None until metal_ready()."""
+        return self._metal
+
+    def _metal_check_needed(self) -> bool:
+        system = getattr(self.backend, "system", platform.system())
+        machine = getattr(self.backend, "machine", platform.machine())
+        return system == "Darwin" and machine != "arm64"
+
+    def _set_metal(self, supported: bool):
+        if not self._metal_ready.is_set():
+            self._metal = supported
+            self._metal_ready.set()
+
+
+    # -------------------------------
+    # Probe
+    # -------------------------------
+
+    def probe(self, on_gpus=None) -> dict:
+        """Run the (slow) probe synchronously; on_gpus(result) gets the GPU part before libmpv is probed."""
+        system = getattr(self.backend, "system", platform.system())
+        machine = getattr(self.backend, "machine", platform.machine())
+        gpus = self.backend.gpus()
+        result = {
+            "system": system,
+            "machine": machine,
+            "gpus": gpus,
+            "metal_supported": metal_supported(system, machine, gpus),
+        }
+        if on_gpus is not None:
+            on_gpus(result)
+        result.update(self.backend.mpv_info())
+        return result
+
+    def _run(self):
+        try:
+            result = self.probe(on_gpus=lambda gpu: self._set_metal(gpu["metal_supported"]))
+        except Exception as e:
+            print(f"Capability probe failed: {e}", flush=True)
+            result = None
+
+        if result is not None:
+            print(f"Capabilities: {', '.join(result['gpus']) or 'no GPU found'}; "
+                  f"{result['mpv_version'] or 'libmpv missing'}", flush=True)
+            self._save_cache(result)
+
+        self._result = result
+        self._set_metal(True)  # failed probe: do not block opening files (no-op once known)
+        self._ready.set()
+
+
+    # -------------------------------
+    # Cache
+    # -------------------------------
+
+    def _fingerprint_key(self) -> str:
+        data = {"probe": PROBE_VERSION, **self.backend.fingerprint()}
+        return hashlib.sha1(json.dumps(data, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def _load_cache(self) -> dict:
+        if not self.cache_file:
+            return {}
+        try:
+            with open(self.cache_file, "r") as f:
+                return json.load(f)
+        except Exception:
+            return {}
+
+    def _save_cache(self, result: dict):
+        if not self.cache_file:
+            return
+        # Keep entries of other fingerprints (e.g. external GPU, dual boot)
+        cache = self._load_cache()
+        cache[self.key] = result
+        try:
+            write_json_atomic(self.cache_file, cache)
+        except Exception as e:
+            print(f"Capability cache write failed: {e}", flush=True)
+
+
+if __name__ == "__main__":
+    # python capabilities.py [--fake]: probe once (uncached) and print the result
+    backend = FakeProbeBackend() if "--fake" in sys.argv else None
+    print(json.dumps(CapabilityProbe(backend=backend).probe(), indent=2))
@@ -0,0 +1,336 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2026 Michael Gasche
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+
+# File:        control_server.py
+# Version:     1.0
+# Author:      Michael Gasche
+# Created:     2026-10
+# Product:     Phosphor
+# Description: Local JSON-RPC 2.0 control server (asyncio, Unix socket or loopback TCP) and client.
+
+
+import os
+import re
+import sys
+import json
+import socket
+import asyncio
+import inspect
+import tempfile
+import threading
+
+from concurrent.futures import Future
+
+
+# Environment variable enabling the control server ("1") without changing the app constants
+CONTROL_ENV = "PHOSPHOR_CONTROL"
+
+# Loopback TCP port where Unix domain sockets are unavailable (Windows)
+DEFAULT_PORT = 47800
+
+# Longest accepted request line (bytes)
+MAX_LINE = 1024 * 1024
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+
+class RpcError(Exception):
+    """Error raised by a method; sent to the client with its code."""
+
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+
+
+def parse_address(address: str):
+    """("tcp", host, port) for "host:port", otherwise ("unix", path)."""
+    match = re.fullmatch(r"([\w.\-]+):(\d+)", address)
+    if match:
+        return "tcp", match.group(1), int(match.group(2))
+    return "unix", address
+
+
+def default_address(settings_dir: str) -> str:
+    """Unix socket in the settings folder, or a loopback port where Unix sockets are unavailable."""
+    if hasattr(socket, "AF_UNIX") and sys.platform != "win32":
+        return os.path.join(settings_dir, "control.sock")
+    return f"127.0.0.1:{DEFAULT_PORT}"
+
+
+def _direct(fn) -> Future:
+    """Default dispatcher: run in the server thread."""
+    future = Future()
+    try:
+        future.set_result(fn())
+    except BaseException as e:
+        future.set_exception(e)
+    return future
+
+
+def _error(request_id, code: int, message: str) -> dict:
+    return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
+
+
+# -------------------------------
+# ControlServer class
+# -------------------------------
+
+class ControlServer:
+    """
+    Newline-delimited JSON-RPC 2.0 over a Unix domain socket (mode 0600) or,
+    on Windows, loopback TCP. Each line is one request or a batch (array);
+    a batch runs as one dispatch, so e.g. a preset change plus a seek is
+    applied together in one round trip. Requests without id are
+    notifications (no response).
+
+    methods maps names to callables taking the params as keywords.
+    dispatch(fn) runs fn where the methods may run (e.g. the Qt thread)
+    and returns a concurrent Future; the asyncio loop never blocks on it.
+    """
+
+    def __init__(self, methods: dict, address: str, dispatch=None):
+        self.methods = dict(methods)
+        self._address = parse_address(address)
+        self.path = self._address[1] if self._address[0] == "unix" else None
+        self.address = None
+        self.stats = {"clients": 0, "connections": 0, "requests": 0, "errors": 0}
+        self._dispatch = dispatch or _direct
+        self._loop = None
+        self._server = None
+        self._connections = {}  # handler task -> writer
+        self._thread = None
+        self._started = threading.Event()
+
+    def start(self):
+        """Serve in a background thread; returns once listening (address is set)."""
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        self._started.wait(5)
+        return self.address
+
+    def stop(self):
+        """Close the listener and all client connections, then end the loop thread."""
+        if self._loop is not None and self._server is not None and self._loop.is_running():
+            asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop)
+        if self._thread is not None:
+            self._thread.join(2)
+        if self.path:
+            try:
+                os.unlink(self.path)
+            except OSError:
+                pass
+
+
+    # -------------------------------
+    # Event loop
+    # -------------------------------
+
+    def _run(self):
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._server = self._loop.run_until_complete(self._listen())
+        except OSError as e:
+            print(f"Control server unavailable: {e}", flush=True)
+            self._started.set()
+            return
+        self._started.set()
+        print(f"Control server listening on {self.address}", flush=True)
+        try:
+            self._loop.run_forever()
+        finally:
+            self._loop.close()
+
+    async def _shutdown(self):
+        # wait_closed() waits for live connections: close them (and their pending dispatches) first
+        self._server.close()
+        for task, writer in list(self._connections.items()):
+            writer.close()
+            task.cancel()
+        await asyncio.gather(*self._connections, return_exceptions=True)
+        await self._server.wait_closed()
+        self._loop.stop()
+
+    def _bind_private(self) -> socket.socket:
+        """
+        Unix socket that is never reachable by other users: bound inside a
+        fresh 0700 folder, set to 0600, then renamed to its final path.
+        """
+        private = tempfile.mkdtemp(prefix=".control-", dir=os.path.dirname(os.path.abspath(self.path)))
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            bound = os.path.join(private, "control.sock")
+            sock.bind(bound)
+            os.chmod(bound, 0o600)
+            os.replace(bound, self.path)  # replaces a stale socket of a previous run
+        except OSError:
+            sock.close()
+            raise
+        finally:
+            try:
+                os.rmdir(private)
+            except OSError:
+                pass
+        return sock
+
+    async def _listen(self):
+        if self.path:
+            sock = self._bind_private()
+            server = await asyncio.start_unix_server(self._client, sock=sock, limit=MAX_LINE)
+            self.address = self.path
+        else:
+            _, host, port = self._address
+            server = await asyncio.start_server(self._client, host, port, limit=MAX_LINE)
+            self.address = "%s:%d" % server.sockets[0].getsockname()[:2]
+        return server
+
+    async def _client(self, reader, writer):
+        self._connections[asyncio.current_task()] = writer
+        self.stats["clients"] += 1
+        self.stats["connections"] += 1
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    writer.write((json.dumps(_error(None, INVALID_REQUEST, "Request too long")) + "\n").encode())
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                response = await self._handle_line(line)
+                if response is not None:
+                    writer.write((json.dumps(response, default=str) + "\n").encode("utf-8"))
+                    await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._connections.pop(asyncio.current_task(), None)
+            self.stats["clients"] -= 1
+            writer.close()
+
+
+    # -------------------------------
+    # JSON-RPC
+    # -------------------------------
+
+    async def _handle_line(self, line: bytes):
+        try:
+            message = json.loads(line)
+        except ValueError as e:
+            self.stats["errors"] += 1
+            return _error(None, PARSE_ERROR, f"Parse error: {e}")
+
+        batch = isinstance(message, list)
+        requests = message if batch else [message]
+        if not requests:
+            return _error(None, INVALID_REQUEST, "Empty batch")
+        self.stats["requests"] += len(requests)
+
+        # The whole batch runs in one dispatch (one hop to the target thread)
+        future = self._dispatch(lambda: [self._call(r) for r in requests])
+        responses = [r for r in await asyncio.wrap_future(future) if r is not None]
+        if batch:
+            return responses or None
+        return responses[0] if responses else None
+
+    def _call(self, request):
+        """Run one request (in the dispatch thread); response dict or None for notifications."""
+        if not isinstance(request, dict):
+            self.stats["errors"] += 1
+            return _error(None, INVALID_REQUEST, "Invalid request")
+        if request.get("jsonrpc") != "2.0" or not isinstance(request.get("method"), str):
+            self.stats["errors"] += 1
+            return _error(request.get("id"), INVALID_REQUEST, "Invalid request")
+
+        request_id = request.get("id")
+        method = self.methods.get(request["method"])
+        params = request.get("params") or {}
+        try:
+            if method is None:
+                raise RpcError(METHOD_NOT_FOUND, f"Method not found: {request['method']}")
+            args, kwargs = (params, {}) if isinstance(params, list) else ((), params)
+            # Checked against the signature first, so a TypeError inside the method stays an internal error
+            try:
+                inspect.signature(method).bind(*args, **kwargs)
+            except TypeError as e:
+                raise RpcError(INVALID_PARAMS, f"Invalid params: {e}")
+            result = method(*args, **kwargs)
+        except RpcError as e:
+            self.stats["errors"] += 1
+            response = _error(request_id, e.code, str(e))
+        except Exception as e:
+            self.stats["errors"] += 1
+            response = _error(request_id, INTERNAL_ERROR, f"Internal error: {e}")
+        else:
+            response = {"jsonrpc": "2.0", "id": request_id, "result": result}
+        return response if "id" in request else None
+
+
+# -------------------------------
+# ControlClient class
+# -------------------------------
+
+class ControlClient:
+    """Blocking client for scripts and the latency benchmark."""
+
+    def __init__(self, address: str):
+        parsed = parse_address(address)
+        if parsed[0] == "tcp":
+            self._sock = socket.create_connection(parsed[1:])
+            self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        else:
+            self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._sock.connect(parsed[1])
+        self._file = self._sock.makefile("rb")
+        self._next_id = 0
+
+    def _request(self, method: str, params) -> dict:
+        self._next_id += 1
+        return {"jsonrpc": "2.0", "id": self._next_id, "method": method, "params": params or {}}
+
+    def _send(self, message):
+        self._sock.sendall((json.dumps(message) + "\n").encode("utf-8"))
+        return json.loads(self._file.readline())
+
+    def call(self, method: str, **params):
+        """Result of one call; raises RpcError on an error response."""
+        response = self._send(self._request(method, params))
+        if "error" in response:
+            raise RpcError(response["error"]["code"], response["error"]["message"])
+        return response["result"]
+
+    def batch(self, calls):
+        """Responses of [(method, params), ...] sent as one batch, in order."""
+        responses = self._send([self._request(method, params) for method, params in calls])
+        return sorted(responses, key=lambda r: r.get("id") or 0)
+
+    def close(self):
+        self._file.close()
+        self._sock.close()
+
@@ -0,0 +1,306 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2026 Michael Gasche
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+
+# File:        export.py
+# Version:     1.0
+# Author:      Michael Gasche
+# Created:     2026-10
+# Product:     Phosphor
+# Description: Headless batch export of videos with the retro effects burned in.
+
+
+import os
+import platform
+if platform.machine() == "arm64":
+    os.environ["DYLD_LIBRARY_PATH"] = "/opt/homebrew/opt/mpv/lib/:" + os.environ.get("DYLD_LIBRARY_PATH", "")
+
+import locale
+locale.setlocale(locale.LC_NUMERIC, "C")
+
+import sys
+import json
+import time
+import queue
+import argparse
+import tempfile
+import threading
+import multiprocessing
+
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+from player.effects import fused_shader_files, get_audio_filter
+from player.playlist import collect_videos
+from player.shader_builder import EFFECTS
+
+# Seconds between progress messages per file
+PROGRESS_INTERVAL = 1.0
+
+# A file fails if it is not done within STARTUP_TIMEOUT + duration / MIN_SPEED seconds
+# (covers a stalled stream or a hanging libplacebo init; without a duration only the startup part)
+STARTUP_TIMEOUT = 60.0
+MIN_SPEED = 0.05  # times realtime
+
+# Seconds a timed-out player may take to shut down before its worker moves on
+TERMINATE_TIMEOUT = 10.0
+
+
+# -------------------------------
+# Jobs
+# -------------------------------
+
+def build_jobs(args, shader):
+    """One job dict per input file."""
+    out_dir = Path(args.output_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    jobs = []
+    for src in collect_videos(args.inputs):
+        jobs.append({
+            "input": str(src),
+            "output": str(out_dir / f"{src.stem}_phosphor.{args.format}"),
+            "shader": shader,
+            "retro_audio": args.retro_audio,
+            "ovc": args.ovc,
+            "ovcopts": args.ovcopts,
+            "oac": args.oac,
+        })
+    return jobs
+
+
+# -------------------------------
+# Worker
+# -------------------------------
+
+def export_file(job, progress=None):
+    """
+    Encode one file through mpv's encoding mode. User shaders only run in
+    vo=gpu(-next), so the shader is applied with FFmpeg's libplacebo filter
+    (same hook syntax, needs a Vulkan device; lavapipe works without GPU).
+    """
+    import mpv
+
+    result = {"input": job["input"], "output": job["output"], "ok": False, "error": None,
+              "frames": 0, "seconds": 0.0, "fps": 0.0, "realtime": 0.0}
+
+    kwargs = dict(
+        o=job["output"],
+        ovc=job["ovc"],
+        ovcopts=job["ovcopts"],
+        oac=job["oac"],
+        ytdl=False,
+        loglevel="error",
+    )
+    if job["shader"]:
+        kwargs["vf"] = f"lavfi=[libplacebo=custom_shader_path='{job['shader']}',format=yuv420p]"
+    if job["retro_audio"]:
+        kwargs["af"] = f"lavfi=[{get_audio_filter()}]"
+
+    try:
+        player = mpv.MPV(**kwargs)
+    except Exception as e:
+        result["error"] = f"MPV initialization failed: {e}"
+        return result
+
+    state = {"frames": 0, "pos": 0.0, "duration": None, "last": 0.0, "end": {}}
+
+    def on_frame(name, val):
+        if val is not None:
+            state["frames"] = val
+
+    def on_pos(name, val):
+        if val is None:
+            return
+        state["pos"] = val
+        now = time.perf_counter()
+        if progress is not None and now - state["last"] >= PROGRESS_INTERVAL:
+            state["last"] = now
+            progress.put((job["input"], val, state["duration"], state["frames"]))
+
+    def on_duration(name, val):
+        state["duration"] = val
+
+    player.observe_property("estimated-frame-number", on_frame)
+    player.observe_property("time-pos", on_pos)
+    player.observe_property("duration", on_duration)
+
+    finished = threading.Event()
+
+    @player.event_callback("end-file")
+    def on_end(event):
+        try:
+            state["end"] = event.as_dict(decoder=mpv.lazy_decoder)
+        except Exception:
+            pass
+        finished.set()
+
+    @player.event_callback("shutdown")
+    def on_shutdown(event):
+        finished.set()
+
+    start = time.perf_counter()
+    timed_out = False
+    try:
+        player.play(job["input"])
+        while not finished.wait(0.5):
+            limit = STARTUP_TIMEOUT + (state["duration"] or 0.0) / MIN_SPEED
+            if time.perf_counter() - start > limit:
+                result["error"] = f"timed out after {limit:.0f} s"
+                timed_out = True
+                break
+    except Exception as e:
+        result["error"] = str(e)
+    finally:
+        if timed_out:
+            # A stalled core may not shut down either: never let it block this worker
+            closer = threading.Thread(target=player.terminate, daemon=True)
+            closer.start()
+            closer.join(TERMINATE_TIMEOUT)
+        else:
+            player.terminate()
+    elapsed = time.perf_counter() - start
+
+    end = state["end"]
+    if result["error"] is None and end.get("reason") == "error":
+        result["error"] = end.get("file_error") or "playback error"
+    if result["error"] is None and state["frames"] == 0:
+        result["error"] = "no frames encoded"
+
+    result["ok"] = result["error"] is None
+    result["frames"] = state["frames"]
+    result["seconds"] = elapsed
+    result["fps"] = state["frames"] / elapsed if elapsed > 0 else 0.0
+    result["realtime"] = state["pos"] / elapsed if elapsed > 0 else 0.0
+    return result
+
+
+# -------------------------------
+# Batch
+# -------------------------------
+
+def print_progress(message):
+    name, pos, duration, frames = message
+    name = Path(name).name
+    if duration:
+        print(f"  {name}: {100.0 * pos / duration:5.1f}% ({frames} frames)", flush=True)
+    else:
+        print(f"  {name}: {pos:.1f}s ({frames} frames)", flush=True)
+
+
+def run_batch(jobs, workers: int):
+    """Encode all jobs on a process pool, reporting progress and throughput."""
+    results = []
+    start = time.perf_counter()
+
+    with multiprocessing.Manager() as manager:
+        progress = manager.Queue()
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(export_file, job, progress): job for job in jobs}
+            pending = set(futures)
+            while pending:
+                done, pending = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+                try:
+                    while True:
+                        print_progress(progress.get_nowait())
+                except queue.Empty:
+                    pass
+
+                for future in done:
+                    job = futures[future]
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        result = {"input": job["input"], "output": job["output"], "ok": False,
+                                  "error": f"worker failed: {e}", "frames": 0, "seconds": 0.0,
+                                  "fps": 0.0, "realtime": 0.0}
+                    results.append(result)
+
+                    name = Path(result["input"]).name
+                    if result["ok"]:
+                        print(f"Done   {name}: {result['frames']} frames in {result['seconds']:.1f}s "
+                              f"({result['fps']:.1f} fps, {result['realtime']:.2f}x realtime)", flush=True)
+                    else:
+                        print(f"Failed {name}: {result['error']}", flush=True)
+
+    elapsed = time.perf_counter() - start
+    frames = sum(r["frames"] for r in results)
+    failed = [r for r in results if not r["ok"]]
+    print(f"\nExported {len(results) - len(failed)}/{len(results)} files in {elapsed:.1f}s "
+          f"({frames / elapsed if elapsed > 0 else 0.0:.1f} frames/s overall)", flush=True)
+    for r in failed:
+        print(f"  FAILED {r['input']}: {r['error']}", flush=True)
+    return results
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Export videos with Phosphor's retro effects burned in.")
+    parser.add_argument("inputs", nargs="+", help="video files or folders")
+    parser.add_argument("-o", "--output-dir", required=True, help="folder for the exported files")
+    parser.add_argument("-j", "--jobs", type=int, default=max(1, (os.cpu_count() or 2) // 2),
+                        help="files encoded in parallel (default: half the CPU cores)")
+    parser.add_argument("--crt", action="store_true", help="enable CRT frame")
+    parser.add_argument("--scanlines", action="store_true", help="enable scanlines")
+    parser.add_argument("--vhs", action="store_true", help="enable VHS noise")
+    parser.add_argument("--crt-level", type=float, default=0.0, help="CRT strength (-5.0..5.0)")
+    parser.add_argument("--scanlines-level", type=float, default=0.0, help="scanline strength (-5.0..5.0)")
+    parser.add_argument("--vhs-level", type=float, default=0.0, help="VHS strength (-5.0..5.0)")
+    parser.add_argument("--lowres-lines", type=int, default=0,
+                        help="render scanlines/VHS at this height and upscale (0 = full resolution)")
+    parser.add_argument("--retro-audio", action="store_true", help="apply the Retro Audio filter")
+    parser.add_argument("--format", default="mp4", help="output container extension (default: mp4)")
+    parser.add_argument("--ovc", default="libx264", help="video encoder (default: libx264)")
+    parser.add_argument("--ovcopts", default="crf=18,preset=medium", help="video encoder options")
+    parser.add_argument("--oac", default="aac", help="audio encoder (default: aac)")
+    parser.add_argument("--report", help="write per-file results as JSON")
+    return parser.parse_args(argv)
+
+
+def run(argv=None):
+    args = parse_args(argv)
+
+    flags = {"crt": args.crt, "scanlines": args.scanlines, "vhs": args.vhs}
+    levels = {"crt": args.crt_level, "scanlines": args.scanlines_level, "vhs": args.vhs_level}
+    effects = tuple(e for e in EFFECTS if flags[e])
+
+    # Strengths are baked into the shader (the libplacebo filter has no shader options)
+    shader_dir = Path(tempfile.gettempdir()) / "Phosphor" / "export"
+    shaders = fused_shader_files(shader_dir, effects, levels, lowres_lines=args.lowres_lines)
+    shader = shaders[0] if shaders else None
+
+    jobs = build_jobs(args, shader)
+    if not jobs:
+        print("No video files found.", flush=True)
+        return 1
+
+    print(f"Exporting {len(jobs)} files with {args.jobs} workers "
+          f"(effects: {' + '.join(effects) or 'none'})", flush=True)
+    results = run_batch(jobs, args.jobs)
+
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump(results, f, indent=2)
+
+    return 0 if all(r["ok"] for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(run())
@@ -28,6 +28,8 @@
 # Description: Main application entry point for the Phosphor video player.
 
 
+from startup import STARTUP
+
 import os
 import platform
 if platform.machine() == "arm64":
@@ -38,14 +40,25 @@ locale.setlocale(locale.LC_NUMERIC, "C")
 
 import sys
 from PySide6.QtWidgets import QApplication
+from player.playlist import collect_videos
 from ui.main_window import MainWindow
+STARTUP.mark("imports")
 
 def run():
+    # Report once the window is up and libmpv is loaded (plus first frame if a file is given)
+    STARTUP.expect("first_window", "libmpv_loaded")
+
     app = QApplication(sys.argv)
+    STARTUP.mark("qapplication")
 
     window = MainWindow()
     window.show()
 
+    # Optional video files / folders (kiosk mode; several files loop as a playlist)
+    files = [str(f) for f in collect_videos(app.arguments()[1:])]
+    if files:
+        window.open_on_start(files)
+
     sys.exit(app.exec())
 
 if __name__ == "__main__":
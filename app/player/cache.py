@@ -0,0 +1,217 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2026 Michael Gasche
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+
+# File:        cache.py
+# Version:     1.0
+# Author:      Michael Gasche
+# Created:     2026-10
+# Product:     Phosphor
+# Description: Demuxer cache profiles and a process-wide cache memory budget.
+
+
+import os
+import sys
+import time
+import threading
+import subprocess
+
+
+MiB = 1024 * 1024
+
+# Named demuxer cache profiles (mpv option values)
+CACHE_PROFILES = {
+    # Small forward cache, hardly any back-buffer (many players, small boxes)
+    "low-memory": {
+        "cache": "auto",
+        "max_bytes": 32 * MiB,
+        "back_bytes": 8 * MiB,
+        "readahead_secs": 5,
+        "cache_secs": 10,
+    },
+    # mpv defaults: local files read fast, the cache only smooths seeks
+    "local-disk": {
+        "cache": "auto",
+        "max_bytes": 150 * MiB,
+        "back_bytes": 50 * MiB,
+        "readahead_secs": 1,
+        "cache_secs": 60,
+    },
+    # Forced cache for mounted NAS/SMB paths (mpv treats them as local files)
+    "network-share": {
+        "cache": "yes",
+        "max_bytes": 512 * MiB,
+        "back_bytes": 128 * MiB,
+        "readahead_secs": 60,
+        "cache_secs": 120,
+    },
+}
+
+# Filesystem types treated as network shares
+NETWORK_FILESYSTEMS = ("cifs", "smb", "smb2", "smb3", "smbfs", "nfs", "nfs4", "afpfs", "webdav", "fuse.sshfs")
+
+# Seconds the mount table is reused (shares mounted later are picked up after that)
+MOUNT_TABLE_TTL = 5.0
+
+# URL schemes that are streamed (mpv enables its cache by itself, the size still matters)
+NETWORK_SCHEMES = ("http://", "https://", "smb://", "nfs://", "ftp://", "sftp://")
+
+
+# -------------------------------
+# Profile selection
+# -------------------------------
+
+_mounts = {"time": None, "table": []}
+_mounts_lock = threading.Lock()
+
+
+def _mount_table():
+    """(mount point, fs type) pairs, longest mount point first; re-read after MOUNT_TABLE_TTL."""
+    with _mounts_lock:
+        now = time.monotonic()
+        if _mounts["time"] is None or now - _mounts["time"] > MOUNT_TABLE_TTL:
+            _mounts["table"] = _read_mount_table()
+            _mounts["time"] = now
+        return _mounts["table"]
+
+
+def _read_mount_table():
+    mounts = []
+    try:
+        if sys.platform.startswith("linux"):
+            with open("/proc/mounts") as f:
+                for line in f:
+                    fields = line.split()
+                    if len(fields) >= 3:
+                        mounts.append((fields[1].replace("\\040", " "), fields[2]))
+        elif sys.platform == "darwin":
+            # "//user@nas/share on /Volumes/share (smbfs, nodev, ...)"
+            output = subprocess.check_output(["mount"], stderr=subprocess.DEVNULL, timeout=5).decode("utf-8", "replace")
+            for line in output.splitlines():
+                if " on " in line and " (" in line:
+                    point = line.split(" on ", 1)[1].rsplit(" (", 1)
+                    mounts.append((point[0], point[1].split(",")[0].strip(")")))
+    except Exception:
+        pass
+    return sorted(mounts, key=lambda m: len(m[0]), reverse=True)
+
+
+def is_network_path(path: str) -> bool:
+    """URL, UNC path, network drive or file on a network filesystem mount."""
+    if path.lower().startswith(NETWORK_SCHEMES):
+        return True
+    if os.name == "nt":
+        if path.startswith("\\\\"):
+            return True
+        try:
+            import ctypes
+            DRIVE_REMOTE = 4
+            drive = os.path.splitdrive(os.path.abspath(path))[0] + "\\"
+            return ctypes.windll.kernel32.GetDriveTypeW(drive) == DRIVE_REMOTE
+        except Exception:
+            return False
+
+    real = os.path.realpath(path)
+    for point, fstype in _mount_table():
+        if real == point or real.startswith(point.rstrip("/") + "/"):
+            return fstype.lower() in NETWORK_FILESYSTEMS
+    return False
+
+
+def resolve_profile(name: str, path: str) -> str:
+    """Profile name for a file; "auto" picks network-share for network paths."""
+    if name != "auto":
+        if name not in CACHE_PROFILES:
+            raise ValueError(f"Unknown cache profile: {name}")
+        return name
+    return "network-share" if is_network_path(path) else "local-disk"
+
+
+def cache_options(profile: str, limit_bytes: int = None) -> dict:
+    """
+    mpv options of a profile. If the forward + back buffer exceed
+    limit_bytes, both are scaled down keeping their ratio.
+    """
+    p = CACHE_PROFILES[profile]
+    max_bytes, back_bytes = p["max_bytes"], p["back_bytes"]
+    if limit_bytes is not None and max_bytes + back_bytes > limit_bytes:
+        scale = limit_bytes / float(max_bytes + back_bytes)
+        max_bytes = max(MiB, int(max_bytes * scale))
+        back_bytes = int(back_bytes * scale)
+    return {
+        "cache": p["cache"],
+        "demuxer-max-bytes": max_bytes,
+        "demuxer-max-back-bytes": back_bytes,
+        "demuxer-readahead-secs": p["readahead_secs"],
+        "cache-secs": p["cache_secs"],
+    }
+
+
+# -------------------------------
+# CacheBudget class
+# -------------------------------
+
+class CacheBudget:
+    """
+    Process-wide demuxer cache memory budget shared by all players. Each
+    registered player gets an equal share; when players come and go the
+    others are told to re-apply their (now larger or smaller) limits.
+    """
+
+    def __init__(self, total_bytes: int = 1024 * MiB):
+        self.total_bytes = total_bytes
+        self._members = {}
+        self._lock = threading.Lock()
+
+    def set_total(self, total_bytes: int):
+        self.total_bytes = total_bytes
+        self._notify()
+
+    def register(self, owner, on_change=None):
+        """Add a player; on_change() is called whenever its share changes."""
+        with self._lock:
+            self._members[id(owner)] = on_change
+        self._notify(skip=id(owner))
+
+    def unregister(self, owner):
+        with self._lock:
+            removed = self._members.pop(id(owner), None) is not None
+        if removed:
+            self._notify()
+
+    def share(self) -> int:
+        """Bytes available to one player."""
+        with self._lock:
+            count = max(1, len(self._members))
+        return self.total_bytes // count
+
+    def _notify(self, skip=None):
+        with self._lock:
+            callbacks = [cb for key, cb in self._members.items() if cb is not None and key != skip]
+        for cb in callbacks:
+            try:
+                cb()
+            except Exception as e:
+                print(f"Cache budget update failed: {e}", flush=True)
+
+
+# Shared by all players of the process
+CACHE_BUDGET = CacheBudget()
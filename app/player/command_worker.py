@@ -0,0 +1,119 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2026 Michael Gasche
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+
+# File:        command_worker.py
+# Version:     1.0
+# Author:      Michael Gasche
+# Created:     2026-10
+# Product:     Phosphor
+# Description: Single worker thread owning all libmpv calls of a player.
+
+
+import queue
+import threading
+
+
+# -------------------------------
+# CommandWorker class
+# -------------------------------
+
+class CommandWorker:
+    """
+    Runs submitted commands one after another on a dedicated thread, so a
+    player's MPV instance is only ever touched from that thread and callers
+    never block on libmpv.
+
+    Commands submitted with a key are latest-wins: a queued command is
+    skipped if a newer one with the same key was submitted meanwhile, and a
+    running one can poll cancelled() to stop early.
+    """
+
+    def __init__(self, name: str = "mpv-worker"):
+        self._queue = queue.Queue()
+        self._latest = {}
+        self._lock = threading.Lock()
+        self._current = None
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+
+    # -------------------------------
+    # Public API
+    # -------------------------------
+
+    def submit(self, fn, *args, key: str = None):
+        """Queue fn(*args); returns immediately."""
+        token = None
+        if key is not None:
+            with self._lock:
+                token = self._latest.get(key, 0) + 1
+                self._latest[key] = token
+        self._queue.put((fn, args, key, token))
+
+    def cancelled(self) -> bool:
+        """Inside a keyed command: True once a newer command with the same key was submitted."""
+        current = self._current
+        if current is None or current[0] is None:
+            return False
+        return self._superseded(*current)
+
+    def in_worker(self) -> bool:
+        return threading.current_thread() is self._thread
+
+    def stop(self, timeout: float = None):
+        """
+        Finish the queued commands, then end the thread. With a timeout,
+        wait for that and return whether the thread really ended (False:
+        a command is still hanging, e.g. in libmpv). Without one (or from
+        the worker itself) nothing is awaited and the result is None.
+        """
+        self._queue.put(None)
+        if timeout is None or self.in_worker():
+            return None
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+
+    # -------------------------------
+    # Worker loop
+    # -------------------------------
+
+    def _superseded(self, key, token) -> bool:
+        with self._lock:
+            return self._latest.get(key) != token
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            fn, args, key, token = item
+            if key is not None and self._superseded(key, token):
+                continue
+
+            self._current = (key, token)
+            try:
+                fn(*args)
+            except Exception as e:
+                print(f"MPV command {getattr(fn, '__name__', fn)} failed: {e}", flush=True)
+            finally:
+                self._current = None
@@ -0,0 +1,275 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2026 Michael Gasche
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+
+# File:        decoder.py
+# Version:     1.0
+# Author:      Michael Gasche
+# Created:     2026-10
+# Product:     Phosphor
+# Description: Decoder strategies (hwdec, decoder threads) and measured auto-tuning.
+
+
+import os
+import json
+import platform
+import threading
+import time
+
+from pathlib import Path
+
+from player.libmpv import load_mpv
+from settings_store import write_json_atomic
+
+
+# -------------------------------
+# Strategies
+# -------------------------------
+
+# Strategy name -> mpv hwdec value ("auto" is resolved by DecoderTuner)
+DECODE_STRATEGIES = {
+    "software": "no",
+    "auto-copy": "auto-copy",
+    "videotoolbox": "videotoolbox",
+    "vaapi": "vaapi",
+    "nvdec": "nvdec",
+    "d3d11va": "d3d11va",
+    "dxva2": "dxva2",
+    "videotoolbox-copy": "videotoolbox-copy",
+    "vaapi-copy": "vaapi-copy",
+    "nvdec-copy": "nvdec-copy",
+    "d3d11va-copy": "d3d11va-copy",
+    "dxva2-copy": "dxva2-copy",
+}
+
+# Hardware backends worth measuring per platform. The measurement runs on vo=null, which has
+# no GPU interop, so only the copy-back variants can be timed (and are what auto selects)
+PLATFORM_BACKENDS = {
+    "Darwin": ["videotoolbox-copy"],
+    "Linux": ["vaapi-copy", "nvdec-copy"],
+    "Windows": ["d3d11va-copy", "nvdec-copy"],
+}
+
+# Bumped when measurements change meaning; older cache files are measured again
+CACHE_VERSION = 3
+
+# Seconds the whole auto measurement (probe + all candidates) may take
+TUNING_BUDGET = 4.0
+
+
+def playback_hwdec(strategy: str) -> str:
+    """
+    hwdec value for playback of a measured strategy: a copy-back winner
+    plays with its direct (zero-copy, gpu-next interop) variant first and
+    falls back to the measured copy-back variant.
+    """
+    hwdec = hwdec_for(strategy)
+    if not hwdec.endswith("-copy"):
+        return hwdec
+    direct = hwdec[:-len("-copy")]
+    return f"{direct},{hwdec}"
+
+
+def hwdec_for(strategy: str) -> str:
+    """mpv hwdec value of a (non-auto) strategy."""
+    if strategy not in DECODE_STRATEGIES:
+        raise ValueError(f"Unknown decode strategy: {strategy}")
+    return DECODE_STRATEGIES[strategy]
+
+
+# -------------------------------
+# DecoderTuner class
+# -------------------------------
+
+class DecoderTuner:
+    """
+    Picks the fastest working decoder for a file by timing a short,
+    untimed decode (vo=null) per candidate within one fixed time budget:
+    software with libavcodec's and one thread per core, and the copy-back
+    hardware decoders (direct hwdec needs the GPU interop of a real VO, so
+    a copy-back winner plays direct-first, see playback_hwdec()). A
+    candidate that runs out of its time slice is scored by the frames it
+    decoded. Results are cached per codec/resolution in a JSON file so
+    each class is measured once; failed probes are not cached.
+    """
+
+    def __init__(self, cache_file: str = None, frames: int = 120, budget: float = TUNING_BUDGET):
+        self.cache_file = Path(cache_file) if cache_file else None
+        self.frames = frames
+        self.budget = budget
+        self._lock = threading.Lock()
+        self._cache = self._load_cache()
+
+
+    # -------------------------------
+    # Selection
+    # -------------------------------
+
+    def candidates(self):
+        """(strategy, threads) pairs measured in auto mode: software (auto and per-core threads), then copy-back hwdec."""
+        cores = os.cpu_count() or 1
+        result = [("software", 0)]
+        if cores > 1:
+            result.append(("software", cores))
+        result.append(("auto-copy", 0))
+        for backend in PLATFORM_BACKENDS.get(platform.system(), []):
+            result.append((backend, 0))
+        return result
+
+    def select(self, path: str, cancelled=None) -> dict:
+        """
+        Return the cached or measured best strategy for this file, or None
+        if cancelled() turns True between measurements.
+        """
+        cancelled = cancelled or (lambda: False)
+        deadline = time.perf_counter() + self.budget
+        info = self.probe(path, timeout=self.budget / 2)
+        # A failed probe has no codec/resolution class: measure, but do not cache under it
+        key = None
+        if info["codec"] != "unknown" and info["width"] and info["height"]:
+            key = f"{info['codec']}:{info['width']}x{info['height']}"
+
+        with self._lock:
+            cached = self._cache.get(key) if key else None
+        if cached:
+            print(f"Decoder cache hit [{key}]: {cached['strategy']} ({cached['fps']:.1f} fps)", flush=True)
+            return cached
+
+        best = None
+        candidates = self.candidates()
+        for i, (strategy, threads) in enumerate(candidates):
+            if cancelled():
+                return None
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                print(f"Decoder [{key or path}] time budget spent, {len(candidates) - i} candidates skipped",
+                      flush=True)
+                break
+            result = self.measure(path, strategy, threads, timeout=remaining / (len(candidates) - i))
+            if result is None:
+                continue
+            print(f"Decoder [{key or path}] {strategy} threads={threads}: {result['fps']:.1f} fps", flush=True)
+            if best is None or result["fps"] > best["fps"]:
+                best = result
+
+        # No working configuration measured -> plain software decoding
+        if best is None:
+            best = {"strategy": "software", "hwdec": "no", "threads": 0, "fps": 0.0}
+        best["hwdec"] = playback_hwdec(best["strategy"])
+
+        if key:
+            with self._lock:
+                self._cache[key] = best
+                self._save_cache()
+        print(f"Decoder selected [{key or path}]: {best['strategy']} threads={best['threads']} "
+              f"({best['fps']:.1f} fps)", flush=True)
+        return best
+
+
+    # -------------------------------
+    # Measurement
+    # -------------------------------
+
+    def probe(self, path: str, timeout: float = 5.0) -> dict:
+        """Codec and resolution of the file's video stream."""
+        player = load_mpv().MPV(vo="null", ao="null", audio="no", pause=True, loglevel="error")
+        try:
+            player.play(path)
+            player.wait_for_property("width", lambda w: w, timeout=timeout)
+            return {
+                "codec": player.video_format or "unknown",
+                "width": player.width or 0,
+                "height": player.height or 0,
+            }
+        except Exception:
+            return {"codec": "unknown", "width": 0, "height": 0}
+        finally:
+            player.terminate()
+
+    def measure(self, path: str, strategy: str, threads: int = 0, timeout: float = 1.0):
+        """
+        Decode up to self.frames frames as fast as possible for at most
+        timeout seconds; a slow decoder is scored by the frames it managed.
+        Returns None if it failed or the requested hardware decoder was not
+        actually used (mpv fell back).
+        """
+        hwdec = hwdec_for(strategy)
+        try:
+            player = load_mpv().MPV(
+                vo="null", ao="null", audio="no", untimed=True,
+                hwdec=hwdec, vd_lavc_threads=threads,
+                frames=self.frames, loglevel="error",
+            )
+        except Exception:
+            return None
+
+        used = []
+        decoded = [0]
+        player.observe_property("hwdec-current", lambda name, val: used.append(val))
+        player.observe_property("estimated-frame-number", lambda name, val: decoded.__setitem__(0, val or 0))
+        try:
+            start = time.perf_counter()
+            player.play(path)
+            try:
+                player.wait_for_playback(timeout=timeout)
+                frames = self.frames
+            except TimeoutError:
+                frames = decoded[0]
+            elapsed = time.perf_counter() - start
+        except Exception:
+            return None
+        finally:
+            player.terminate()
+
+        if hwdec != "no" and not any(v and v != "no" for v in used):
+            return None
+        return {
+            "strategy": strategy,
+            "hwdec": hwdec,
+            "threads": threads,
+            "fps": frames / elapsed if elapsed > 0 else 0.0,
+        }
+
+
+    # -------------------------------
+    # Cache
+    # -------------------------------
+
+    def _load_cache(self):
+        if self.cache_file is None:
+            return {}
+        try:
+            with open(self.cache_file, "r") as f:
+                data = json.load(f)
+        except Exception:
+            return {}
+        # Version 1 (a plain dict) timed direct hwdec on vo=null, i.e. measured fallbacks
+        if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+            return {}
+        return data.get("entries", {})
+
+    def _save_cache(self):
+        if self.cache_file is None:
+            return
+        try:
+            write_json_atomic(str(self.cache_file), {"version": CACHE_VERSION, "entries": self._cache})
+        except Exception as e:
+            print(f"Decoder cache write failed: {e}", flush=True)
@@ -0,0 +1,91 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2026 Michael Gasche
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+
+# File:        effects.py
+# Version:     1.0
+# Author:      Michael Gasche
+# Created:     2026-10
+# Product:     Phosphor
+# Description: Qt-free shader selection and retro audio filter, shared by player and export.
+
+
+from pathlib import Path
+
+from helper import get_resource_path
+from player.shader_builder import EFFECT_PLACEMENTS, write_fused_shader, write_text_atomic
+
+
+# Stage file per effect (resources/shaders)
+STAGE_FILES = {
+    "crt": "crt_base.glsl",
+    "scanlines": "scanlines.glsl",
+    "vhs": "vhs_noise.glsl",
+}
+
+
+# -------------------------------
+# Shader selection
+# -------------------------------
+
+def chain_shader_files(effects, placement: str = "source", shader_dir=None):
+    """
+    One stage file per enabled effect (one render pass each). The stage
+    files hook MAIN; for another placement, re-hooked copies are written
+    to shader_dir.
+    """
+    hook = EFFECT_PLACEMENTS[placement]
+    shaders = []
+    for effect in effects:
+        f = Path(get_resource_path(f"shaders/{STAGE_FILES[effect]}"))
+        if not f.exists():
+            continue
+        if hook != "MAIN" and shader_dir is not None:
+            content = f.read_text().replace("//!HOOK MAIN", f"//!HOOK {hook}")
+            f = Path(shader_dir) / f"{f.stem}@{placement}.glsl"
+            f.parent.mkdir(parents=True, exist_ok=True)
+            if not f.exists() or f.read_text() != content:
+                write_text_atomic(f, content)
+        shaders.append(str(f))
+    return shaders
+
+
+def fused_shader_files(shader_dir, effects, levels: dict = None, placement: str = "source", lowres_lines: int = 0):
+    """Single fused shader for the enabled effects (one render pass, two with lowres_lines)."""
+    if not effects:
+        return []
+    return [str(write_fused_shader(shader_dir, effects, levels, placement, lowres_lines))]
+
+
+# -------------------------------
+# Retro Audio filter
+# -------------------------------
+
+def get_audio_filter():
+    """Retro Audio mit leichtem Mono, Kompressor + Make-up, Bitcrush und Echo."""
+    return ",".join([
+        "highpass=f=150",
+        "lowpass=f=6000",
+        "acompressor=threshold=0.2:ratio=3:makeup=2",
+        "acrusher=bits=8",
+        "pan=stereo|c0=0.7*c0+0.3*c1|c1=0.7*c1+0.3*c0"
+        # "aecho=0.05:0.3:1:0.3"
+    ])
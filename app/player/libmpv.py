@@ -0,0 +1,70 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2026 Michael Gasche
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+
+# File:        libmpv.py
+# Version:     1.0
+# Author:      Michael Gasche
+# Created:     2026-10
+# Product:     Phosphor
+# Description: Lazy loading of python-mpv / libmpv, optionally in the background.
+
+
+import threading
+
+
+_mpv = None
+_lock = threading.Lock()
+
+
+def load_mpv():
+    """
+    Import python-mpv (which loads libmpv) once and return the module.
+    Thread-safe; raises if libmpv cannot be loaded.
+    """
+    global _mpv
+    if _mpv is None:
+        with _lock:
+            if _mpv is None:
+                import mpv
+                _mpv = mpv
+    return _mpv
+
+
+def is_loaded() -> bool:
+    return _mpv is not None
+
+
+def prewarm(on_done=None) -> threading.Thread:
+    """Load libmpv on a background thread; on_done(error or None) when finished."""
+    def _run():
+        error = None
+        try:
+            load_mpv()
+        except Exception as e:
+            error = e
+            print(f"libmpv prewarm failed: {e}", flush=True)
+        if on_done is not None:
+            on_done(error)
+
+    thread = threading.Thread(target=_run, daemon=True)
+    thread.start()
+    return thread
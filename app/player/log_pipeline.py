@@ -0,0 +1,205 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2026 Michael Gasche
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+
+# File:        log_pipeline.py
+# Version:     1.0
+# Author:      Michael Gasche
+# Created:     2026-10
+# Product:     Phosphor
+# Description: Non-blocking MPV log pipeline (ring buffer, rate limit, rotating file).
+
+
+import os
+import time
+import atexit
+import logging
+import threading
+
+from collections import deque
+from logging.handlers import RotatingFileHandler
+
+
+# -------------------------------
+# LogPipeline class
+# -------------------------------
+
+class LogPipeline:
+    """
+    submit() only appends to a bounded ring buffer (the oldest message is
+    dropped and counted when full), so MPV's event thread never waits on
+    I/O. A background consumer collapses repeated messages, rate-limits
+    each component (token bucket) and writes to stdout and a rotating file.
+    """
+
+    def __init__(self, path: str = None, capacity: int = 4096, rate: float = 20.0, burst: int = 100,
+                 max_bytes: int = 2 * 1024 * 1024, backups: int = 3, echo: bool = True, interval: float = 0.1):
+        self.rate = rate
+        self.burst = burst
+        self.echo = echo
+        self.interval = interval
+
+        self._buffer = deque()
+        self._capacity = capacity
+        self._lock = threading.Lock()
+
+        self.stats = {"received": 0, "written": 0, "dropped": 0, "suppressed": 0, "collapsed": 0}
+        self._reported_dropped = 0
+
+        # Per component: [tokens, last refill time, suppressed since last report]
+        self._buckets = {}
+        # Last written message and how often it repeated since
+        self._last = None
+        self._repeats = 0
+
+        self._file = None
+        if path:
+            try:
+                os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+                handler = RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backups, encoding="utf-8")
+                handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+                self._file = logging.getLogger(f"phosphor.mpv.{id(self)}")
+                self._file.propagate = False
+                self._file.setLevel(logging.INFO)
+                self._file.addHandler(handler)
+            except OSError as e:
+                print(f"MPV log file unavailable: {e}", flush=True)
+
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+
+    # -------------------------------
+    # Producer (MPV event thread)
+    # -------------------------------
+
+    def submit(self, level, component, message):
+        """Enqueue one MPV log message; never blocks on I/O."""
+        with self._lock:
+            self.stats["received"] += 1
+            if len(self._buffer) >= self._capacity:
+                self._buffer.popleft()
+                self.stats["dropped"] += 1
+            self._buffer.append((level, component, message))
+
+
+    # -------------------------------
+    # Consumer
+    # -------------------------------
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._drain()
+        self._drain()
+
+    def _drain(self):
+        with self._lock:
+            batch = list(self._buffer)
+            self._buffer.clear()
+            dropped = self.stats["dropped"]
+
+        if dropped > self._reported_dropped:
+            self._emit(f"[log] {dropped - self._reported_dropped} messages dropped (buffer full)")
+            self._reported_dropped = dropped
+
+        for level, component, message in batch:
+            self._process(level, component, str(message).rstrip())
+
+        # Idle: report pending repeats and suppressions
+        if not batch:
+            self._flush_repeats()
+            for component, bucket in self._buckets.items():
+                if bucket[2]:
+                    self._emit(f"[log] {bucket[2]} messages from {component} suppressed (rate limit)")
+                    bucket[2] = 0
+
+    def _process(self, level, component, message):
+        key = (level, component, message)
+        if key == self._last:
+            self._repeats += 1
+            self.stats["collapsed"] += 1
+            return
+        self._flush_repeats()
+
+        if not self._allow(component):
+            self.stats["suppressed"] += 1
+            return
+        self._last = key
+        self._emit(f"[MPV {level}][{component}] {message}")
+
+    def _allow(self, component) -> bool:
+        """Token bucket per component: rate messages/s, bursts up to burst."""
+        now = time.monotonic()
+        bucket = self._buckets.setdefault(component, [float(self.burst), now, 0])
+        bucket[0] = min(float(self.burst), bucket[0] + (now - bucket[1]) * self.rate)
+        bucket[1] = now
+        if bucket[0] >= 1.0:
+            bucket[0] -= 1.0
+            if bucket[2]:
+                self._emit(f"[log] {bucket[2]} messages from {component} suppressed (rate limit)")
+                bucket[2] = 0
+            return True
+        bucket[2] += 1
+        return False
+
+    def _flush_repeats(self):
+        if self._repeats:
+            self._emit(f"[log] last message repeated {self._repeats} times")
+            self._repeats = 0
+        self._last = None
+
+    def _emit(self, line: str):
+        self.stats["written"] += 1
+        if self.echo:
+            print(line, flush=True)
+        if self._file is not None:
+            self._file.info(line)
+
+
+    # -------------------------------
+    # Shutdown
+    # -------------------------------
+
+    def close(self):
+        """Write what is buffered and stop the consumer."""
+        if self._stop.is_set():
+            return
+        self._stop.set()
+        self._thread.join(timeout=2.0)
+        self._flush_repeats()
+        if self._file is not None:
+            for handler in self._file.handlers:
+                handler.close()
+
+
+_pipeline = None
+_pipeline_lock = threading.Lock()
+
+
+def get_log_pipeline(path: str = None) -> LogPipeline:
+    """Process-wide pipeline shared by all players (created on first use)."""
+    global _pipeline
+    with _pipeline_lock:
+        if _pipeline is None:
+            _pipeline = LogPipeline(path)
+            atexit.register(_pipeline.close)
+        return _pipeline
@@ -28,14 +28,45 @@
 # Description: MPV video player wrapper with shader and audio effects.
 
 
-import mpv
+import os
+import ctypes
 import platform
+import tempfile
 import threading
+import time
 
+from contextlib import contextmanager
 from pathlib import Path
 from PySide6.QtCore import Signal, QObject
 
-from helper import get_resource_path
+from player.cache import CACHE_BUDGET, CACHE_PROFILES, MiB, cache_options, resolve_profile
+from player.command_worker import CommandWorker
+from player.decoder import DecoderTuner, hwdec_for
+from player.effects import chain_shader_files, fused_shader_files, get_audio_filter
+from player.libmpv import load_mpv
+from player.log_pipeline import get_log_pipeline
+from player.shader_builder import (
+    EFFECTS, EFFECT_PLACEMENTS, EFFECT_SETS, clamp_level, format_shader_opts, shader_opts
+)
+from player.telemetry import PlaybackTelemetry
+from player.thumbnails import ThumbnailCache, ThumbnailExtractor
+
+
+# Minimum seconds between shader option updates while a slider is dragged
+SHADER_OPTS_DEBOUNCE = 0.05
+
+# Label of the Retro Audio stage in MPV's audio filter chain
+RETRO_AUDIO_LABEL = "retro"
+
+# Seek-bar thumbnail overlay: MPV overlay id and the bottom part of the window treated as seek bar
+THUMBNAIL_OVERLAY_ID = 0
+THUMBNAIL_HOVER_ZONE = 0.12
+
+# Label of the frame-rate cap in MPV's video filter chain (video wall budget)
+FPS_CAP_LABEL = "budget"
+
+# Guards fused shader dicts shared between players (video wall tiles write from their own workers)
+SHADER_FILES_LOCK = threading.Lock()
 
 
 # -------------------------------
@@ -43,51 +74,146 @@ from helper import get_resource_path
 # -------------------------------
 
 class MPVPlayer(QObject):
+    """
+    All libmpv calls run on one CommandWorker thread. Public methods only
+    update state and queue work, so they never block the caller; opens are
+    latest-wins (a newer load cancels a superseded one).
+    """
 
     error_signal = Signal(str, str)
-
-    def __init__(self, wid: int = None, retro_audio: bool = False, osc: bool = True, settings=None):
+    playback_started = Signal()  # first frame after a load (playback-restart)
+
+    def __init__(self, wid: int = None, retro_audio: bool = False, osc: bool = True, settings=None, fused: bool = True,
+                 cache_dir: str = None, decoder: str = "software", decoder_threads: int = 0,
+                 cache_profile: str = "auto", cache_budget=None, placement: str = "source", lowres_lines: int = 0,
+                 thumbnail_interval: float = 0.0, thumbnail_cache_bytes: int = 256 * MiB,
+                 mpv_options: dict = None, shader_files: dict = None, prewarm: bool = True,
+                 prewarm_wid: int = None):
         """Initialize MPV wrapper; MPV instance created on video load."""
         super().__init__()
 
         self.settings = settings
+        self._fused = fused
+
+        # Where effects run (source or output resolution) and optional low-res scanline/VHS pass
+        if placement not in EFFECT_PLACEMENTS:
+            raise ValueError(f"Unknown effect placement: {placement}")
+        self._placement = placement
+        self._lowres_lines = lowres_lines
+        if lowres_lines and not fused:
+            print(f"Low-res pass ({lowres_lines} lines) needs fused shaders; chain mode renders at full resolution",
+                  flush=True)
+
+        # Fused shaders and compiled shader cache live under cache_dir (settings dir)
+        base = Path(cache_dir) if cache_dir else Path(tempfile.gettempdir()) / "Phosphor"
+        self._shader_dir = base / "shaders"
+        self._shader_cache_dir = base / "shader_cache" if cache_dir else None
+        self.shader_cache_stats = {"hits": 0, "misses": 0}
+        self._prewarm_thread = None
+        self._prewarm = prewarm
+        self._prewarm_wid = prewarm_wid  # never-shown native window the prewarm instance renders into
+
+        # MPV log messages go through a non-blocking, rate-limited pipeline (rotating mpv.log)
+        self._log = get_log_pipeline(str(base / "logs" / "mpv.log") if cache_dir else None)
+
+        # Decoder strategy ("auto" measures per codec/resolution on load)
+        self._decoder_tuner = None
+        self._decoder_generation = 0
+        self.decoder_choice = None
+        if decoder == "auto":
+            cache_file = base / "decoder_cache.json" if cache_dir else None
+            self._decoder_tuner = DecoderTuner(cache_file)
+            hwdec = "no"
+        else:
+            hwdec = hwdec_for(decoder)
+
+        # Demuxer cache profile ("auto": network-share for NAS/SMB paths) within a shared memory budget
+        if cache_profile != "auto" and cache_profile not in CACHE_PROFILES:
+            raise ValueError(f"Unknown cache profile: {cache_profile}")
+        self._cache_profile = cache_profile
+        self._cache_budget = cache_budget or CACHE_BUDGET
+        self._cache_path = None
+        self._cache_demuxers = 1
+        self.cache_limits = {}
+
+        # Seek-bar thumbnails (interval 0 = off): hidden extractor per file, shared LRU disk cache
+        self._thumbnail_interval = thumbnail_interval
+        self._thumbnail_cache = None
+        if thumbnail_interval:
+            self._thumbnail_cache = ThumbnailCache(base / "thumbnails", thumbnail_cache_bytes)
+        self._thumbnails = None
+        self._overlay_buffer = None
+
         self._crt_enabled = False
         self._scanlines_enabled = False
         self._vhs_enabled = False
         self._retro_audio_enabled = retro_audio
         self._file_loaded = False
-        self._lock = threading.Lock()
+        self._playback_started = False
         self._terminated = False
 
-        # shader stage levels (-5 .. +5), UI controlled
+        # What is playing (for snapshot/restore) and a one-shot start position of the next load
+        self._source = None
+        self._start_pending = False
+        self._closed = False
+        self.worker_heartbeat = time.monotonic()
+
+        # Single owner of the MPV instance
+        self._worker = CommandWorker()
+
+        # Shader update transactions (see batch()) and slider debounce
+        self._batch_lock = threading.RLock()
+        self._batch_depth = 0
+        self._batch_pending = set()
+        self._opts_timer = None
+        self._last_opts_apply = 0.0
+
+        # shader stage levels (-5.0 .. +5.0), UI controlled
         self.shader_levels = {
-            "crt": 0,
-            "scanlines": 0,
-            "vhs": 0,
+            "crt": 0.0,
+            "scanlines": 0.0,
+            "vhs": 0.0,
         }
 
         # MPV creation kwargs
         self._mpv_kwargs = dict(
             osc=osc,
-            hwdec="no",
+            hwdec=hwdec,
+            vd_lavc_threads=decoder_threads,
             input_builtin_bindings=True,
             input_default_bindings=True,
             input_vo_keyboard=True,
+            prefetch_playlist=True,
             log_handler=self.mpv_log,
             loglevel="warn",
         )
 
+        if self._shader_cache_dir is not None:
+            self._shader_cache_dir.mkdir(parents=True, exist_ok=True)
+            self._mpv_kwargs["gpu_shader_cache_dir"] = str(self._shader_cache_dir)
+
+        # gpu-next (libplacebo) is required for //!PARAM shader options
+        self._mpv_kwargs["vo"] = "gpu-next"
         if wid is not None:
             self._mpv_kwargs["wid"] = str(wid)
-            self._mpv_kwargs["vo"] = "opengl"
-        else:
-            self._mpv_kwargs["vo"] = "gpu"
+            self._mpv_kwargs["gpu_api"] = "opengl"
 
-        # Apply retro audio filter ONLY at creation
+        # Extra options of the embedding (e.g. video wall tile geometry)
+        self._mpv_kwargs.update(mpv_options or {})
+        self.fps_cap = None
+
+        # Retro audio filter at creation; toggled live later (labeled stage, see enable_retro_audio)
         if self._retro_audio_enabled:
-            self._mpv_kwargs["af"] = f"lavfi=[{self._get_audio_filter()}]"
+            self._mpv_kwargs["af"] = self._retro_audio_filter()
+
+        # Playback health samples, tagged with the active effects and levels
+        self.telemetry = PlaybackTelemetry(context=self._telemetry_context)
 
         self.mpv = None
+        self._active_shaders = None
+        self._active_shader_opts = None
+        # Fused shader paths per effect set; players of a video wall share one dict
+        self._shader_files = shader_files if shader_files is not None else {}
 
 
     # -------------------------------
@@ -97,10 +223,18 @@ class MPVPlayer(QObject):
     def _create_mpv(self):
         """Instantiate MPV object if not already created."""
         if self.mpv is None:
+            mpv = load_mpv()
             self.mpv = mpv.MPV(**self._mpv_kwargs)
+            self._active_shaders = None
+            self._active_shader_opts = None
             self.mpv.keep_open = True
             self.mpv.pause = True
-            self.mpv.observe_property("file-loaded", self._on_file_loaded)
+            self._file_loaded_cb = self.mpv.event_callback("file-loaded")(self._on_file_loaded)
+            self._restart_cb = self.mpv.event_callback("playback-restart")(self._on_playback_restart)
+            self.telemetry.attach(self.mpv)
+            if self._thumbnail_cache is not None:
+                self.mpv.observe_property("mouse-pos", self._on_mouse_pos)
+            self._cache_budget.register(self, lambda: self._worker.submit(self._apply_cache_options))
 
             self.mpv.input_default_bindings = True
             self.mpv.input_vo_keyboard = True
@@ -111,8 +245,56 @@ class MPVPlayer(QObject):
     # -------------------------------
 
     def mpv_log(self, level, component, message):
-        """Simple logging for MPV messages."""
-        print(f"[MPV {level}][{component}] {message}", flush=True)
+        """MPV event thread: only enqueue, the log pipeline writes in the background."""
+        self._log.submit(level, component, message)
+
+
+    # -------------------------------
+    # Transactions
+    # -------------------------------
+
+    @contextmanager
+    def batch(self):
+        """
+        Collect effect and level changes and apply them once on exit:
+
+            with player.batch():
+                player.enable_crt(True)
+                player.set_shader_level("crt", 2.0)
+
+        Batches may be nested; the outermost one applies.
+        """
+        with self._batch_lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._batch_lock:
+                self._batch_depth -= 1
+                pending = set()
+                if self._batch_depth == 0:
+                    pending, self._batch_pending = self._batch_pending, set()
+            if "shaders" in pending:
+                self._request("shaders")
+            elif "opts" in pending:
+                self._request("opts")
+
+    def _deferred(self, kind: str) -> bool:
+        """Record a pending update if a batch is open; True if deferred."""
+        with self._batch_lock:
+            if self._batch_depth:
+                self._batch_pending.add(kind)
+                return True
+            return False
+
+    def _request(self, kind: str):
+        """Queue a shader ("shaders") or shader option ("opts") update unless a batch defers it."""
+        if self._deferred(kind):
+            return
+        if kind == "shaders":
+            self._worker.submit(self._update_shaders, key="shaders")
+        else:
+            self._worker.submit(self._update_shader_opts, key="opts")
 
 
     # -------------------------------
@@ -121,15 +303,15 @@ class MPVPlayer(QObject):
 
     def enable_crt(self, enabled: bool):
         self._crt_enabled = enabled
-        self._update_shaders()
+        self._request("shaders")
 
     def enable_scanlines(self, enabled: bool):
         self._scanlines_enabled = enabled
-        self._update_shaders()
+        self._request("shaders")
 
     def enable_vhs(self, enabled: bool):
         self._vhs_enabled = enabled
-        self._update_shaders()
+        self._request("shaders")
 
 
     # -------------------------------
@@ -138,13 +320,32 @@ class MPVPlayer(QObject):
 
     def set_shader_level(self, shader: str, level: float):
         """
-        Set shader stage from slider (-5..+5).
-        Stage is always loaded, visibility controlled by enabled flags.
+        Set shader strength from slider (-5.0..+5.0).
+        Only the //!PARAM uniforms change, the loaded shaders are kept.
+        Debounced: during a drag MPV gets at most one update per
+        SHADER_OPTS_DEBOUNCE, the last one always carries the latest level.
         """
-        level_i = int(round(level))
-        level_i = max(-5, min(5, level_i))
-        self.shader_levels[shader] = level_i
-        self._update_shaders()
+        self.shader_levels[shader] = clamp_level(level)
+        if self._deferred("opts"):
+            return
+
+        with self._batch_lock:
+            if self._opts_timer is not None:
+                return  # trailing update already scheduled, reads the latest levels
+            wait = self._last_opts_apply + SHADER_OPTS_DEBOUNCE - time.monotonic()
+            if wait > 0:
+                self._opts_timer = threading.Timer(wait, self._apply_debounced_opts)
+                self._opts_timer.daemon = True
+                self._opts_timer.start()
+                return
+            self._last_opts_apply = time.monotonic()
+        self._request("opts")
+
+    def _apply_debounced_opts(self):
+        with self._batch_lock:
+            self._opts_timer = None
+            self._last_opts_apply = time.monotonic()
+        self._request("opts")
 
 
     # -------------------------------
@@ -153,37 +354,143 @@ class MPVPlayer(QObject):
 
     def _update_shaders(self):
         """
-        Load GLSL shader FILES based on:
+        Load GLSL shaders based on:
         - enabled flags
-        - integer shader stage (-5..+5)
+        - shader strength (-5.0..+5.0) as //!PARAM values
+        Fused mode loads one single-pass shader for all enabled effects,
+        otherwise the per-effect stage FILES are chained.
         """
         if not self.mpv:
             return
 
-        shaders = []
+        enabled = self._enabled_effects()
+        if self._fused:
+            shaders = self._fused_shaders(enabled)
+        else:
+            shaders = self._chain_shaders(enabled)
 
-        if self._crt_enabled:
-            lvl = self.shader_levels["crt"]
-            f = Path(get_resource_path(f"shaders/crt_base_{lvl}.glsl"))
-            if f.exists():
-                shaders.append(str(f))
+        self._update_shader_opts()
+        if shaders != self._active_shaders:
+            self.mpv.glsl_shaders = shaders
+            self._active_shaders = shaders
 
-        if self._scanlines_enabled:
-            lvl = self.shader_levels["scanlines"]
-            f = Path(get_resource_path(f"shaders/scanlines_{lvl}.glsl"))
-            if f.exists():
-                shaders.append(str(f))
+        if not shaders:
+            print("No shaders loaded (all disabled or files missing)", flush=True)
 
-        if self._vhs_enabled:
-            lvl = self.shader_levels["vhs"]
-            f = Path(get_resource_path(f"shaders/vhs_noise_{lvl}.glsl"))
-            if f.exists():
-                shaders.append(str(f))
+    def _enabled_effects(self):
+        """Enabled effects in chain order."""
+        flags = {
+            "crt": self._crt_enabled,
+            "scanlines": self._scanlines_enabled,
+            "vhs": self._vhs_enabled,
+        }
+        return tuple(e for e in EFFECTS if flags[e])
+
+    def _chain_shaders(self, enabled):
+        """One stage file per enabled effect (one render pass each)."""
+        return chain_shader_files(enabled, self._placement, self._shader_dir)
+
+    def _fused_shaders(self, enabled):
+        """Single fused shader for the enabled effects (one render pass), written once per set."""
+        # The dict may be shared by the players of a video wall (one writer per set)
+        with SHADER_FILES_LOCK:
+            if enabled in self._shader_files:
+                return self._shader_files[enabled]
+            try:
+                shaders = fused_shader_files(self._shader_dir, enabled, placement=self._placement,
+                                             lowres_lines=self._lowres_lines)
+            except OSError as e:
+                print(f"Fused shader unavailable, falling back to chain: {e}", flush=True)
+                return self._chain_shaders(enabled)
+            self._shader_files[enabled] = shaders
+            return shaders
+
+    def _update_shader_opts(self):
+        """Push strengths as //!PARAM uniforms (no shader recompile); unchanged values are skipped."""
+        if not self.mpv:
+            return
+        opts = format_shader_opts(shader_opts(self.shader_levels))
+        if opts != self._active_shader_opts:
+            self.mpv["glsl-shader-opts"] = opts
+            self._active_shader_opts = opts
 
-        self.mpv.glsl_shaders = shaders
 
-        if not shaders:
-            print("No shaders loaded (all disabled or files missing)", flush=True)
+    # -------------------------------
+    # Shader cache prewarm
+    # -------------------------------
+
+    def _start_prewarm(self):
+        """Compile all effect variants in the background (once per player)."""
+        if not self._prewarm or self._shader_cache_dir is None or self._prewarm_thread is not None:
+            return
+        if self._prewarm_wid is None:
+            print("Shader prewarm skipped: no hidden window to render into", flush=True)
+            self._prewarm = False
+            return
+        size = (self.mpv.width or 1280, self.mpv.height or 720)
+        self._prewarm_thread = threading.Thread(target=self._prewarm_shaders, args=size, daemon=True)
+        self._prewarm_thread.start()
+
+    def _prewarm_shaders(self, width: int, height: int):
+        """
+        Render a few frames of every effect variant in a hidden MPV instance
+        embedded in a never-shown native window (no window flashes, no focus
+        change), sharing the shader cache dir. Each variant gets its own
+        short-lived instance because compiled shaders are written to the
+        cache when an instance shuts down: a variant that added cache
+        entries was a miss (compiled now), one that added none a hit.
+        """
+        kwargs = dict(
+            vo=self._mpv_kwargs["vo"],
+            wid=str(self._prewarm_wid),
+            force_window="no",
+            hwdec="no",
+            audio="no",
+            osc=False,
+            untimed=True,
+            keep_open=True,
+            input_default_bindings=False,
+            input_vo_keyboard=False,
+            gpu_shader_cache_dir=str(self._shader_cache_dir),
+            glsl_shader_opts=format_shader_opts(shader_opts(self.shader_levels)),
+            loglevel="error",
+        )
+        if "gpu_api" in self._mpv_kwargs:
+            kwargs["gpu_api"] = self._mpv_kwargs["gpu_api"]
+
+        for effects in EFFECT_SETS:
+            if not effects or self._terminated:
+                continue
+            before = self._shader_cache_entries()
+            try:
+                self._prewarm_variant(kwargs, effects, width, height)
+            except Exception as e:
+                print(f"Shader prewarm failed: {e}", flush=True)
+                break
+            hit = not (self._shader_cache_entries() - before)
+            self.shader_cache_stats["hits" if hit else "misses"] += 1
+            print(f"Shader cache {'hit' if hit else 'miss'}: {' + '.join(effects)}", flush=True)
+
+        stats = self.shader_cache_stats
+        print(f"Shader prewarm done: {stats['hits']} hits, {stats['misses']} misses", flush=True)
+
+    def _prewarm_variant(self, kwargs: dict, effects, width: int, height: int):
+        """Compile one effect variant; returns after the instance has shut down (cache written)."""
+        warm = load_mpv().MPV(**kwargs)
+        try:
+            warm.glsl_shaders = self._fused_shaders(effects) if self._fused else self._chain_shaders(effects)
+            warm.play(f"av://lavfi:testsrc2=size={width}x{height}:rate=30")
+            warm.wait_for_property("estimated-frame-number", lambda n: n is not None and n >= 3, timeout=10)
+        finally:
+            warm.terminate()
+
+    def _shader_cache_entries(self):
+        """(name, size) of the compiled shader blobs in the cache dir."""
+        try:
+            with os.scandir(self._shader_cache_dir) as entries:
+                return {(e.name, e.stat().st_size) for e in entries if e.is_file()}
+        except OSError:
+            return set()
 
 
     # -------------------------------
@@ -191,8 +498,62 @@ class MPVPlayer(QObject):
     # -------------------------------
 
     def enable_retro_audio(self, enabled: bool):
-        """Enable or disable retro audio."""
+        """
+        Enable or disable retro audio, live on a playing instance: only the
+        labeled @retro stage is added to or removed from the filter chain
+        (af add/remove), other filters and the audio output stay as they are.
+        """
         self._retro_audio_enabled = enabled
+        if enabled:
+            self._mpv_kwargs["af"] = self._retro_audio_filter()
+        else:
+            self._mpv_kwargs.pop("af", None)
+        self._worker.submit(self._toggle_retro_audio, enabled, key="retro_audio")
+
+    def _toggle_retro_audio(self, enabled: bool):
+        if not self.mpv or self._terminated:
+            return
+        active = any(f.get("label") == RETRO_AUDIO_LABEL for f in (self.mpv.af or []))
+        if enabled and not active:
+            self.mpv.command("af", "add", self._retro_audio_filter())
+        elif not enabled and active:
+            self.mpv.command("af", "remove", f"@{RETRO_AUDIO_LABEL}")
+
+    def _retro_audio_filter(self) -> str:
+        return f"@{RETRO_AUDIO_LABEL}:lavfi=[{self._get_audio_filter()}]"
+
+    def _apply_audio_filter(self):
+        """Re-apply the audio filter on a reused MPV instance."""
+        self.mpv.af = self._mpv_kwargs.get("af", "")
+
+
+    # -------------------------------
+    # Frame-rate cap
+    # -------------------------------
+
+    def set_fps_cap(self, fps: float = None):
+        """
+        Limit the rendered frame rate (None = source rate), live: a labeled
+        @budget fps filter is replaced in the video filter chain, so shaders
+        and presentation only run for the kept frames.
+        """
+        self.fps_cap = fps
+        if fps:
+            self._mpv_kwargs["vf"] = self._fps_filter(fps)
+        else:
+            self._mpv_kwargs.pop("vf", None)
+        self._worker.submit(self._apply_fps_cap, fps, key="fps_cap")
+
+    def _apply_fps_cap(self, fps: float):
+        if not self.mpv or self._terminated:
+            return
+        if any(f.get("label") == FPS_CAP_LABEL for f in (self.mpv.vf or [])):
+            self.mpv.command("vf", "remove", f"@{FPS_CAP_LABEL}")
+        if fps:
+            self.mpv.command("vf", "add", self._fps_filter(fps))
+
+    def _fps_filter(self, fps: float) -> str:
+        return f"@{FPS_CAP_LABEL}:fps=fps={fps:.3f}"
 
 
     # -------------------------------
@@ -200,11 +561,63 @@ class MPVPlayer(QObject):
     # -------------------------------
 
     def load(self, path: str):
-        """Load a video file into MPV, handling missing installation or library path issues."""
+        """Queue loading a video file; a newer load supersedes this one."""
+        self._source = ([path], False)
+        self._worker.submit(self._load, [path], False, key="load")
+
+    def load_playlist(self, paths, loop: bool = True, start: float = None):
+        """
+        Queue a playlist: the files go into MPV's internal playlist, so the
+        next item is opened and prefetched while the current one plays and
+        items follow each other without tearing down the window or shaders.
+        start (seconds) applies to the first item only.
+        """
+        paths = list(paths)
+        if paths:
+            self._source = (paths, loop)
+            self._worker.submit(self._load, paths, loop, start, key="load")
+
+    def append(self, path: str):
+        """Queue a file after the current playlist (starts playback if idle)."""
+        paths, loop = self._source or ([], False)
+        self._source = (paths + [path], loop)
+        self._worker.submit(self._append, path)
+
+    def playlist_next(self):
+        self.command("playlist-next", "weak")
+
+    def playlist_prev(self):
+        self.command("playlist-prev", "weak")
+
+    def _append(self, path: str):
+        if self.mpv is None or self._terminated:
+            self._load([path], False)
+            return
+        self.mpv.command("loadfile", path, "append-play")
+
+    def _load(self, paths, loop: bool, start: float = None):
+        """
+        Load video files into MPV, handling missing installation or library path issues.
+        A running instance is reused (loadfile replace): window, GL context and
+        compiled shaders stay warm, only the audio filter is re-applied.
+        The auto decoder starts in software and is tuned for the first file in
+        the background (kept for the playlist).
+        """
         self._file_loaded = False
+        self._playback_started = False
 
         try:
+            mpv = load_mpv()
+            if self.mpv is not None and not self._terminated:
+                try:
+                    self._apply_audio_filter()
+                except mpv.ShutdownError:
+                    # MPV window was closed (e.g. quit key) -> start a fresh instance
+                    self.telemetry.detach()
+                    self._cache_budget.unregister(self)
+                    self.mpv = None
             self._create_mpv()
+            self._closed = False
         except Exception as e:
             # MPV could not be instantiated → MPV is probably missing or paths are not set
             msg = "Failed to initialize MPV.\n\n"
@@ -234,64 +647,363 @@ class MPVPlayer(QObject):
             self.error_signal.emit("MPV Initialization Error", msg)
             return
 
-        # Load video
+        # Load video (further files are appended to MPV's playlist and prefetched)
         if self.mpv and not self._terminated:
             try:
-                self.mpv.command("loadfile", path, "replace")
+                if self._decoder_tuner is not None:
+                    self._start_decoder_tuning(paths[0])
+                if self._worker.cancelled():
+                    print(f"Open superseded: {paths[0]}", flush=True)
+                    return
+                self._cache_path = paths[0]
+                self._cache_demuxers = 2 if len(paths) > 1 else 1  # prefetched next item has its own cache
+                self._apply_cache_options()
+                self.mpv.loop_playlist = "inf" if loop else "no"
+                if len(paths) > 1:
+                    # Keep the window open across items (no black gap between files)
+                    self.mpv.force_window = "yes"
+                if start:
+                    # Reset after the first item has loaded (see _after_file_loaded)
+                    self.mpv["start"] = f"{start:.3f}"
+                    self._start_pending = True
+                self.mpv.command("loadfile", paths[0], "replace")
+                for path in paths[1:]:
+                    self.mpv.command("loadfile", path, "append")
                 self.mpv.pause = False
             except Exception as e:
                 print(f"Error loading video: {e}", flush=True)
                 self.error_signal.emit("Error Loading Video", f"Error loading file:\n{e}")
 
 
+    def _start_decoder_tuning(self, path: str):
+        """
+        Auto decoder: play in software right away, look up or measure the
+        fastest working strategy for this file on a background thread and
+        switch to it when done (a newer open cancels the measurement).
+        """
+        self.mpv.hwdec = "no"
+        self.mpv["vd-lavc-threads"] = 0
+        self._decoder_generation += 1
+        generation = self._decoder_generation
+
+        def cancelled():
+            return generation != self._decoder_generation or self._closed
+
+        def run():
+            try:
+                choice = self._decoder_tuner.select(path, cancelled=cancelled)
+            except Exception as e:
+                print(f"Decoder auto-tuning failed, keeping software decoding: {e}", flush=True)
+                return
+            if choice is not None and not cancelled():
+                self._worker.submit(self._apply_decoder, choice, generation, key="decoder")
+
+        threading.Thread(target=run, name="decoder-tuning", daemon=True).start()
+
+    def _apply_decoder(self, choice: dict, generation: int):
+        """Switch the running file to the tuned decoder (changing hwdec reinitializes the decoder)."""
+        if generation != self._decoder_generation or not self.mpv or self._terminated:
+            return
+        self.decoder_choice = choice
+        # Thread count is read at decoder init: set it first so the hwdec switch picks it up
+        self.mpv["vd-lavc-threads"] = choice["threads"]
+        self.mpv.hwdec = choice["hwdec"]
+        print(f"Decoder switched to {choice['strategy']} (hwdec={choice['hwdec']}, threads={choice['threads']})",
+              flush=True)
+
+
+    # -------------------------------
+    # Demuxer cache
+    # -------------------------------
+
+    def _apply_cache_options(self):
+        """Set the cache profile of the current file, limited to this player's budget share."""
+        if not self.mpv or self._cache_path is None:
+            return
+        profile = resolve_profile(self._cache_profile, self._cache_path)
+        opts = cache_options(profile, self._cache_budget.share() // self._cache_demuxers)
+        limits = {"profile": profile, **opts}
+        if limits == self.cache_limits:
+            return
+        for name, value in opts.items():
+            self.mpv[name] = value
+        self.cache_limits = limits
+        print(f"Cache profile {profile}: {opts['demuxer-max-bytes'] // (1024 * 1024)} MiB ahead, "
+              f"{opts['demuxer-max-back-bytes'] // (1024 * 1024)} MiB back", flush=True)
+
+    def cache_usage(self) -> dict:
+        """Cache fill and memory use vs. the applied limits (from telemetry, no libmpv call)."""
+        state = self.telemetry.latest().get("demuxer-cache-state") or {}
+        limits = self.cache_limits
+        max_bytes = limits.get("demuxer-max-bytes")
+        fw_bytes = state.get("fw_bytes")
+        return {
+            "profile": limits.get("profile"),
+            "duration": state.get("duration"),
+            "fw_bytes": fw_bytes,
+            "total_bytes": state.get("total_bytes"),
+            "max_bytes": max_bytes,
+            "back_bytes": limits.get("demuxer-max-back-bytes"),
+            "fill": fw_bytes / max_bytes if fw_bytes is not None and max_bytes else None,
+            "underrun": state.get("underrun"),
+        }
+
+
     # -------------------------------
     # Play / Pause
     # -------------------------------
 
     def toggle_pause(self):
         """Toggle pause/play."""
+        self._worker.submit(self._toggle_pause)
+
+    def _toggle_pause(self):
         if self.mpv:
             self.mpv.pause = not self.mpv.pause
 
+    def set_pause(self, paused: bool):
+        """Pause or resume (idempotent, for remote control)."""
+        self._worker.submit(self._set_pause, paused, key="pause")
+
+    def _set_pause(self, paused: bool):
+        if self.mpv:
+            self.mpv.pause = paused
+
+    def command(self, *args):
+        """Queue an MPV command (e.g. "seek", 10, "relative")."""
+        self._worker.submit(self._command, *args)
+
+    def _command(self, *args):
+        if self.mpv:
+            self.mpv.command(*args)
+
 
     # -------------------------------
     # Stop / Terminate
     # -------------------------------
 
-    def terminate(self):
-        """Terminate MPV safely."""
-        def _terminate():
-            with self._lock:
-                if self.mpv:
-                    try:
-                        # Remove observers first
-                        self.mpv.unobserve_property("file-loaded", self._on_file_loaded)
-                    except Exception:
-                        pass
-                    try:
-                        self.mpv.terminate()
-                        self._terminated = True
-                    except Exception:
-                        pass
-                    self.mpv = None
+    def terminate(self, timeout: float = None):
+        """
+        Terminate MPV safely (after the already queued commands). Without a
+        timeout this does not block and returns None; with one it waits up
+        to timeout seconds and returns whether the shutdown is confirmed
+        (False: the worker hangs, e.g. in a wedged libmpv call, and the
+        instance is abandoned).
+        The cache budget share is released right away, so an abandoned or
+        rebuilt player never keeps it.
+        """
+        self._closed = True
+        self._cache_budget.unregister(self)
+        with self._batch_lock:
+            if self._opts_timer is not None:
+                self._opts_timer.cancel()
+                self._opts_timer = None
+
+        self._worker.submit(self._terminate)
+        finished = self._worker.stop(timeout)
+        if finished is None:
+            return None
+        return finished and (self._terminated or self.mpv is None)
+
+    def _terminate(self):
+        if self.mpv:
+            try:
+                # Remove callbacks first
+                self._file_loaded_cb.unregister_mpv_events()
+                self._restart_cb.unregister_mpv_events()
+                self.telemetry.detach()
+                self._cache_budget.unregister(self)
+                if self._thumbnail_cache is not None:
+                    self.mpv.unobserve_property("mouse-pos", self._on_mouse_pos)
+            except Exception:
+                pass
+            self._stop_thumbnails()
+            try:
+                self.mpv.terminate()
+                self._terminated = True
+            except Exception:
+                pass
+            self.mpv = None
+
+
+    # -------------------------------
+    # Watchdog support
+    # -------------------------------
+
+    @property
+    def running(self) -> bool:
+        """An instance exists and was not closed (by terminate or the user quitting the MPV window)."""
+        return self.mpv is not None and not self._closed
+
+    def ping(self):
+        """Queue a heartbeat: worker_heartbeat advances only if the worker and the libmpv core respond."""
+        self._worker.submit(self._ping, key="ping")
+
+    def _ping(self):
+        if self.mpv and not self._terminated:
+            try:
+                self.mpv["pause"]  # property read, waits for the core
+            except load_mpv().ShutdownError:
+                self._closed = True
+        self.worker_heartbeat = time.monotonic()
+
+    def snapshot(self) -> dict:
+        """File, position and effect settings from cached state only (safe while libmpv hangs)."""
+        latest = self.telemetry.latest()
+        paths, loop = self._source or ([], False)
+        return {
+            "paths": list(paths),
+            "loop": loop,
+            "playlist_pos": latest.get("playlist-pos") or 0,
+            "position": latest.get("playback-time"),
+            "paused": bool(latest.get("pause")),
+            "effects": list(self._enabled_effects()),
+            "levels": dict(self.shader_levels),
+            "retro_audio": self._retro_audio_enabled,
+        }
+
+    def restore(self, snapshot: dict):
+        """
+        Continue a snapshot in this (fresh) player: same effects and levels,
+        the playlist from the current item (looping playlists keep their
+        order) at the saved position and pause state.
+        """
+        with self.batch():
+            self.enable_crt("crt" in snapshot["effects"])
+            self.enable_scanlines("scanlines" in snapshot["effects"])
+            self.enable_vhs("vhs" in snapshot["effects"])
+            for effect, level in snapshot["levels"].items():
+                self.set_shader_level(effect, level)
+        self.enable_retro_audio(snapshot["retro_audio"])
+
+        paths = snapshot["paths"]
+        pos = min(max(0, snapshot["playlist_pos"]), len(paths) - 1) if paths else 0
+        paths = paths[pos:] + paths[:pos] if snapshot["loop"] else paths[pos:]
+        if paths:
+            self.load_playlist(paths, loop=snapshot["loop"], start=snapshot["position"])
+            if snapshot["paused"]:
+                self.set_pause(True)
+
+
+    # -------------------------------
+    # Seek-bar thumbnails
+    # -------------------------------
+
+    def _start_thumbnails(self):
+        """Extract thumbnails of the current file in the background (worker thread)."""
+        if self._thumbnail_cache is None:
+            return
+        path = self.mpv.path
+        if not path or (self._thumbnails is not None and self._thumbnails.path == path):
+            return
+        self._stop_thumbnails()
+        self._thumbnails = ThumbnailExtractor(
+            path, self._thumbnail_cache, interval=self._thumbnail_interval, should_yield=self._thumbnails_yield
+        )
+        self._thumbnails.start()
+
+    def _stop_thumbnails(self):
+        if self._thumbnails is not None:
+            self._thumbnails.stop(timeout=0.5)
+            self._thumbnails = None
+
+    def _thumbnails_yield(self) -> bool:
+        """Extractor pauses while this player starts, seeks or waits for its cache."""
+        if not self._playback_started:
+            return True
+        latest = self.telemetry.latest()
+        underrun = (latest.get("demuxer-cache-state") or {}).get("underrun")
+        return bool(latest.get("seeking") or latest.get("paused-for-cache") or underrun)
+
+    def thumbnail_progress(self) -> dict:
+        """Extracted thumbnails of the current file (for the stats panel)."""
+        t = self._thumbnails
+        if t is None or not t.duration:
+            return {"done": 0, "total": 0}
+        return {"done": t.done, "total": t.index_for(t.duration) + 1}
+
+    def _on_mouse_pos(self, name, pos):
+        """MPV event thread: hover updates are latest-wins on the worker."""
+        self._worker.submit(self._show_thumbnail, pos, key="thumbnail")
+
+    def _show_thumbnail(self, pos):
+        """Show the cached thumbnail for the hovered seek-bar position as an OSD overlay."""
+        if not self.mpv or self._thumbnails is None:
+            return
+        osd = self.mpv.osd_dimensions or {}
+        osd_w, osd_h = osd.get("w") or 0, osd.get("h") or 0
+        duration = self.mpv.duration
+        thumb = None
+        if pos and pos.get("hover") and osd_w and duration and pos["y"] >= osd_h * (1.0 - THUMBNAIL_HOVER_ZONE):
+            thumb = self._thumbnails.get(duration * min(max(pos["x"] / osd_w, 0.0), 1.0))
+
+        if thumb is None:
+            if self._overlay_buffer is not None:
+                self.mpv.command("overlay-remove", THUMBNAIL_OVERLAY_ID)
+                self._overlay_buffer = None
+            return
 
-        threading.Thread(target=_terminate, daemon=True).start()
+        width, height, stride, data = thumb
+        x = int(min(max(pos["x"] - width / 2, 0), max(osd_w - width, 0)))
+        y = int(max(osd_h * (1.0 - THUMBNAIL_HOVER_ZONE) - height - 8, 0))
+        # The buffer must stay alive while the overlay uses it (replaced on the next hover)
+        buffer = ctypes.create_string_buffer(data, len(data))
+        self.mpv.command("overlay-add", THUMBNAIL_OVERLAY_ID, x, y, f"&{ctypes.addressof(buffer)}", 0,
+                         "bgra", width, height, stride)
+        self._overlay_buffer = buffer
+
+
+    # -------------------------------
+    # Telemetry
+    # -------------------------------
+
+    def _telemetry_context(self):
+        """Effect state stored with every telemetry sample."""
+        return {
+            "effects": list(self._enabled_effects()),
+            "levels": dict(self.shader_levels),
+            "fused": self._fused,
+            "placement": self._placement,
+            "lowres_lines": self._lowres_lines,
+            "cache_profile": self.cache_limits.get("profile"),
+            "cache_max_bytes": self.cache_limits.get("demuxer-max-bytes"),
+            "log_dropped": self._log.stats["dropped"],
+        }
+
+    def export_telemetry(self, path: str) -> int:
+        """Export buffered telemetry samples as JSON lines."""
+        return self.telemetry.export_jsonl(path)
 
 
     # -------------------------------
     # Events
     # -------------------------------
 
-    def _on_file_loaded(self, name, val):
-        """Callback when MPV finishes loading a file."""
+    def _on_file_loaded(self, event=None):
+        """Callback (MPV event thread) when MPV finishes loading a file."""
         if not self.mpv or self._terminated:
             return
-        self._file_loaded = bool(val)
-        if self._file_loaded:
-            self._update_shaders()
+        self._file_loaded = True
+        self._worker.submit(self._after_file_loaded)
+
+    def _after_file_loaded(self):
+        if not self.mpv or self._terminated:
+            return
+        if self._start_pending:
+            self.mpv["start"] = "none"
+            self._start_pending = False
+        self._update_shaders()
+        self._start_prewarm()
+        self._start_thumbnails()
+
+    def _on_playback_restart(self, event=None):
+        """First playback-restart after a load = first frame on screen."""
+        if not self._playback_started:
+            self._playback_started = True
+            self.playback_started.emit()
 
     def _mpv_event(self, event):
-        if event["event_id"] == mpv.MPV_EVENT_SHUTDOWN:
+        if event["event_id"] == load_mpv().MPV_EVENT_SHUTDOWN:
             self.terminate()
 
 
@@ -300,12 +1012,5 @@ class MPVPlayer(QObject):
     # -------------------------------
 
     def _get_audio_filter(self):
-        """Retro Audio mit leichtem Mono, Kompressor + Make-up, Bitcrush und Echo."""
-        return ",".join([
-            "highpass=f=150",
-            "lowpass=f=6000",
-            "acompressor=threshold=0.2:ratio=3:makeup=2",
-            "acrusher=bits=8",
-            "pan=stereo|c0=0.7*c0+0.3*c1|c1=0.7*c1+0.3*c0"
-            # "aecho=0.05:0.3:1:0.3"
-        ])
+        """Retro Audio lavfi chain (see player/effects.py)."""
+        return get_audio_filter()
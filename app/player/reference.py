@@ -0,0 +1,290 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2026 Michael Gasche
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+
+# File:        reference.py
+# Version:     1.0
+# Author:      Michael Gasche
+# Created:     2026-10
+# Product:     Phosphor
+# Description: NumPy reference renderer of the fused CRT/Scanline/VHS shader (CPU previews, golden images).
+
+
+import sys
+import argparse
+
+from pathlib import Path
+
+import numpy as np
+
+from player.shader_builder import (
+    CRT_LUT_SIZE, EFFECTS, EFFECT_SETS, NOISE_SIZE,
+    crt_lut_bytes, noise_bytes, shader_opts
+)
+
+
+# -------------------------------
+# Sampling helpers (mpv texture semantics)
+# -------------------------------
+
+def to_float(frames) -> np.ndarray:
+    """uint8 or float frames as float32 RGB in 0..1 (alpha dropped)."""
+    frames = np.asarray(frames)
+    if frames.dtype == np.uint8:
+        frames = frames.astype(np.float32) / 255.0
+    return frames[..., :3].astype(np.float32, copy=False)
+
+
+def to_uint8(frames) -> np.ndarray:
+    return (np.clip(frames, 0.0, 1.0) * 255.0 + 0.5).astype(np.uint8)
+
+
+def _bilinear_taps(u, v, width: int, height: int):
+    """Indices and weights of a linear, clamp-to-edge texture lookup at normalized (u, v)."""
+    x = np.clip(u * width - 0.5, 0.0, width - 1)
+    y = np.clip(v * height - 0.5, 0.0, height - 1)
+    x0 = np.floor(x).astype(np.intp)
+    y0 = np.floor(y).astype(np.intp)
+    x1 = np.minimum(x0 + 1, width - 1)
+    y1 = np.minimum(y0 + 1, height - 1)
+    fx = (x - x0).astype(np.float32)
+    fy = (y - y0).astype(np.float32)
+    return y0, y1, x0, x1, fx, fy
+
+
+def _gather(image, taps, channel=None):
+    """Linear lookup of image (..., H, W, C) with precomputed taps."""
+    y0, y1, x0, x1, fx, fy = taps
+    img = image if channel is None else image[..., channel]
+    top = img[..., y0, x0, :] if channel is None else img[..., y0, x0]
+    top_r = img[..., y0, x1, :] if channel is None else img[..., y0, x1]
+    bottom = img[..., y1, x0, :] if channel is None else img[..., y1, x0]
+    bottom_r = img[..., y1, x1, :] if channel is None else img[..., y1, x1]
+    if channel is None:
+        fx, fy = fx[..., None], fy[..., None]
+    return (top * (1 - fx) + top_r * fx) * (1 - fy) + (bottom * (1 - fx) + bottom_r * fx) * fy
+
+
+# -------------------------------
+# ReferenceRenderer class
+# -------------------------------
+
+class ReferenceRenderer:
+    """
+    Vectorized CPU implementation of the fused shader (source placement,
+    full resolution): same //!PARAM values, the same baked CRT lookup and
+    VHS noise textures, VHS noise keyed by frame number. Frames are
+    (H, W, 3) or batches (N, H, W, 3), uint8 or float 0..1.
+
+    Position-only terms (CRT warp taps, vignette, scanline modulation) are
+    computed once per frame size; per frame only the taps and noise run.
+    Results match the GPU up to filtering precision (a few 8-bit steps).
+    """
+
+    def __init__(self, effects=EFFECTS, levels: dict = None):
+        self.effects = tuple(e for e in EFFECTS if e in effects)
+        self.levels = dict(levels or {})
+        self.opts = shader_opts(self.levels)
+
+        self._noise = np.frombuffer(noise_bytes(), dtype=np.uint8).reshape(NOISE_SIZE, NOISE_SIZE)
+        self._noise = self._noise.astype(np.float32) / 255.0
+        self._lut = np.frombuffer(crt_lut_bytes(), dtype="<f2").reshape(CRT_LUT_SIZE, CRT_LUT_SIZE, 4)
+        self._lut = self._lut.astype(np.float32)
+        self._geometry = {}
+
+    def set_levels(self, levels: dict):
+        """Change levels (like glsl-shader-opts); cached geometry is rebuilt on the next frame."""
+        self.levels = dict(levels)
+        self.opts = shader_opts(self.levels)
+        self._geometry.clear()
+
+
+    # -------------------------------
+    # Per frame size
+    # -------------------------------
+
+    def _geometry_for(self, height: int, width: int) -> dict:
+        key = (height, width)
+        if key in self._geometry:
+            return self._geometry[key]
+
+        o = self.opts
+        # HOOKED_pos at pixel centers (row 0 = top, as mpv's HOOKED_pos)
+        u = ((np.arange(width, dtype=np.float32) + 0.5) / width)[None, :].repeat(height, 0)
+        v = ((np.arange(height, dtype=np.float32) + 0.5) / height)[:, None].repeat(width, 1)
+        geo = {"u": u, "v": v}
+
+        if "crt" in self.effects:
+            # Baked lookup over one quadrant, sampled like the shader (texel i = |n| = i / (size - 1))
+            size = CRT_LUT_SIZE
+            nx, ny = u * 2.0 - 1.0, v * 2.0 - 1.0
+            ax, ay = np.abs(nx), np.abs(ny)
+            lut_taps = _bilinear_taps(ax * (size - 1) / size + 0.5 / size, ay * (size - 1) / size + 0.5 / size,
+                                      size, size)
+            lut = _gather(self._lut, lut_taps)
+            a, b, c = np.sign(nx) * lut[..., 0], np.sign(ny) * lut[..., 1], np.sign(ny) * lut[..., 2]
+            k = o["CRT_CURVATURE_AMOUNT"]
+            cu = (nx + k * a + 1.0) * 0.5
+            cv = (ny + k * (b + k * (c + k * ny * a ** 2)) + 1.0) * 0.5
+
+            # HOOKED_texOff(off) samples HOOKED_pos + HOOKED_pt * off (kept exactly as the shader does)
+            chroma = o["CRT_CHROMA_OFFSET"]
+            geo["tap_r"] = _bilinear_taps(u + (cu + chroma) / width, v + cv / height, width, height)
+            geo["tap_g"] = _bilinear_taps(cu, cv, width, height)
+            geo["tap_b"] = _bilinear_taps(u + (cu - chroma) / width, v + cv / height, width, height)
+
+            vignette = np.exp2(o["CRT_VIGNETTE_POWER"] * lut[..., 3])
+            strength = o["CRT_VIGNETTE_STRENGTH"]
+            geo["vignette"] = (1.0 - strength) + vignette * strength
+
+        if "scanlines" in self.effects:
+            scan = np.sin(v[:, :1] * o["SCAN_DENSITY"]) * 0.5 + 0.5
+            modulation = o["SCAN_DARK_LEVEL"] + (o["SCAN_BRIGHT_LEVEL"] - o["SCAN_DARK_LEVEL"]) * scan
+            geo["scan"] = ((1.0 - o["SCAN_STRENGTH"]) + modulation * o["SCAN_STRENGTH"]).astype(np.float32)
+
+        if "vhs" in self.effects:
+            geo["x"] = np.arange(width)
+            geo["y"] = np.arange(height)
+
+        self._geometry[key] = geo
+        return geo
+
+
+    # -------------------------------
+    # Rendering
+    # -------------------------------
+
+    def _vhs(self, col, geo, frame: int):
+        """Grain, flicker and glitch lines of one frame (integer texel math, as in the shader)."""
+        o = self.opts
+        n = NOISE_SIZE
+        f = frame % 4096
+        ox = (37 * f) % n
+        oy = (23 * f + 29 * (f // n)) % n
+        grain = self._noise[np.ix_((geo["y"] + oy) % n, (geo["x"] + ox) % n)]
+        grain = (grain - 0.5) * o["VHS_GRAIN_STRENGTH"]
+        flicker = (self._noise[f // n, f % n] - 0.5) * o["VHS_FLICKER_STRENGTH"]
+
+        ramp = geo["v"][:, :1] * o["VHS_LINE_DENSITY"] + (frame % 50) * 0.02
+        glitch = (ramp - np.floor(ramp) >= 0.98) * o["VHS_GLITCH_AMOUNT"]
+
+        col += (grain + flicker - glitch)[..., None]
+        np.clip(col, 0.0, 1.0, out=col)
+
+    def render(self, frames, frame: int = 0) -> np.ndarray:
+        """
+        Effected copy of one frame or a batch as float32 0..1. frame is the
+        mpv frame number of the first image (batch images count up from it).
+        """
+        frames = to_float(frames)
+        single = frames.ndim == 3
+        batch = frames[None] if single else frames
+        height, width = batch.shape[1:3]
+        geo = self._geometry_for(height, width)
+
+        if "crt" in self.effects:
+            out = np.empty_like(batch)
+            out[..., 0] = _gather(batch, geo["tap_r"], 0)
+            out[..., 1] = _gather(batch, geo["tap_g"], 1)
+            out[..., 2] = _gather(batch, geo["tap_b"], 2)
+            out *= geo["vignette"][..., None]
+        else:
+            out = batch.copy()
+
+        if "scanlines" in self.effects:
+            out *= geo["scan"][..., None]
+
+        if "vhs" in self.effects:
+            for i in range(out.shape[0]):
+                self._vhs(out[i], geo, frame + i)
+
+        return out[0] if single else out
+
+
+# -------------------------------
+# Golden images
+# -------------------------------
+
+def test_pattern(width: int = 320, height: int = 180) -> np.ndarray:
+    """Deterministic RGB gradient with a checker, as uint8 (H, W, 3)."""
+    y, x = np.mgrid[0:height, 0:width]
+    checker = ((x // 16 + y // 16) % 2) * 0.25
+    frame = np.stack([x / max(1, width - 1), y / max(1, height - 1), 0.5 + checker - 0.125], axis=-1)
+    return to_uint8(frame)
+
+
+# Golden images are small (cheap to commit and to check) and cover every effect set
+GOLDEN_SIZE = (48, 27)
+GOLDEN_LEVELS = (-5.0, 0.0, 5.0)
+GOLDEN_FRAMES = (0, 1, 4095)
+
+
+def golden_name(effects, level: float, frame: int) -> str:
+    return f"{'_'.join(effects) or 'clean'}_{level:+.1f}_f{frame}"
+
+
+def render_goldens() -> dict:
+    """Golden name -> uint8 image of the test pattern for every effect set, level and frame."""
+    source = test_pattern(*GOLDEN_SIZE)
+    images = {}
+    for effects in EFFECT_SETS:
+        for level in GOLDEN_LEVELS:
+            renderer = ReferenceRenderer(effects, {e: level for e in EFFECTS})
+            for frame in GOLDEN_FRAMES:
+                images[golden_name(effects, level, frame)] = to_uint8(renderer.render(source, frame))
+    return images
+
+
+def write_or_check_goldens(path, check: bool, tolerance: int = 1) -> int:
+    """
+    Write the golden images into one compressed .npz file, or compare the
+    current renderer against a committed one; returns the mismatch count.
+    """
+    path = Path(path)
+    images = render_goldens()
+    if not check:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez_compressed(path, **images)
+        return 0
+
+    failures = 0
+    with np.load(path) as goldens:
+        for name, image in images.items():
+            if name not in goldens.files:
+                print(f"MISSING {name}", flush=True)
+                failures += 1
+                continue
+            diff = int(np.abs(goldens[name].astype(np.int16) - image.astype(np.int16)).max())
+            if diff > tolerance:
+                print(f"MISMATCH {name}: max difference {diff}", flush=True)
+                failures += 1
+    return failures
+
+
+if __name__ == "__main__":
+    # PYTHONPATH=app python -m player.reference tests/goldens/reference.npz [--check]
+    parser = argparse.ArgumentParser(description="Write or check golden images of the reference renderer.")
+    parser.add_argument("path", help="golden .npz file")
+    parser.add_argument("--check", action="store_true", help="compare instead of writing; exit 1 on mismatches")
+    args = parser.parse_args()
+    failed = write_or_check_goldens(args.path, args.check)
+    print(f"{'Checked' if args.check else 'Wrote'} golden images in {args.path} ({failed} failures)", flush=True)
+    sys.exit(1 if failed else 0)
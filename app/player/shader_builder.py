@@ -0,0 +1,486 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2026 Michael Gasche
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+
+# File:        shader_builder.py
+# Version:     1.0
+# Author:      Michael Gasche
+# Created:     2026-10
+# Product:     Phosphor
+# Description: Shader parameter tables and fused single-pass shader builder.
+
+
+import os
+import math
+import random
+import struct
+import tempfile
+
+from itertools import combinations
+from pathlib import Path
+
+
+# Effect order of the shader chain (CRT -> Scanlines -> VHS)
+EFFECTS = ("crt", "scanlines", "vhs")
+
+# All 8 on/off combinations, in chain order (empty set = Clean)
+EFFECT_SETS = tuple(c for r in range(len(EFFECTS) + 1) for c in combinations(EFFECTS, r))
+
+
+# -------------------------------
+# Parameter tables
+# -------------------------------
+
+# Underlying values for CRT
+CRT_BASE_PARAMS = {
+    "CURVATURE_AMOUNT": 0.05,   # Screen curvature strength
+    "CHROMA_OFFSET": 0.002,     # Horizontal chromatic aberration
+    "VIGNETTE_STRENGTH": 0.5,   # Vignette intensity
+    "VIGNETTE_POWER": 1.0       # Vignette falloff
+}
+
+# Base values for scan lines
+SCANLINE_BASE_PARAMS = {
+    "SCANLINE_DENSITY": 600.0,
+    "DARK_LEVEL": 0.82,
+    "BRIGHT_LEVEL": 1.05,
+    "STRENGTH": 1.0
+}
+
+# Underlying values for VHS
+VHS_BASE_PARAMS = {
+    "GRAIN_STRENGTH": 0.03,
+    "FLICKER_STRENGTH": 0.01,
+    "LINE_DENSITY": 10.0,
+    "GLITCH_AMOUNT": 0.02
+}
+
+# Scale -5 to +5 (levels are floats, integer ticks are the former stages)
+SCALE = list(range(-5, 6))
+LEVEL_MIN = -5.0
+LEVEL_MAX = 5.0
+
+# Runtime //!PARAM names per effect (shared by stage files and fused shaders)
+PARAM_NAMES = {
+    "crt": {
+        "CURVATURE_AMOUNT": "CRT_CURVATURE_AMOUNT",
+        "CHROMA_OFFSET": "CRT_CHROMA_OFFSET",
+        "VIGNETTE_STRENGTH": "CRT_VIGNETTE_STRENGTH",
+        "VIGNETTE_POWER": "CRT_VIGNETTE_POWER",
+    },
+    "scanlines": {
+        "SCANLINE_DENSITY": "SCAN_DENSITY",
+        "DARK_LEVEL": "SCAN_DARK_LEVEL",
+        "BRIGHT_LEVEL": "SCAN_BRIGHT_LEVEL",
+        "STRENGTH": "SCAN_STRENGTH",
+    },
+    "vhs": {
+        "GRAIN_STRENGTH": "VHS_GRAIN_STRENGTH",
+        "FLICKER_STRENGTH": "VHS_FLICKER_STRENGTH",
+        "LINE_DENSITY": "VHS_LINE_DENSITY",
+        "GLITCH_AMOUNT": "VHS_GLITCH_AMOUNT",
+    },
+}
+
+# //!DESC of each runtime parameter
+PARAM_DESCS = {
+    "crt": {
+        "CURVATURE_AMOUNT": "Screen curvature strength",
+        "CHROMA_OFFSET": "Horizontal chromatic aberration",
+        "VIGNETTE_STRENGTH": "Vignette intensity",
+        "VIGNETTE_POWER": "Vignette falloff curve",
+    },
+    "scanlines": {
+        "SCANLINE_DENSITY": "Vertical scanline frequency",
+        "DARK_LEVEL": "Brightness of dark scanlines",
+        "BRIGHT_LEVEL": "Brightness between scanlines",
+        "STRENGTH": "Overall scanline intensity",
+    },
+    "vhs": {
+        "GRAIN_STRENGTH": "Pixel noise intensity",
+        "FLICKER_STRENGTH": "Frame-based brightness flicker",
+        "LINE_DENSITY": "Number of horizontal glitch lines",
+        "GLITCH_AMOUNT": "Horizontal glitch displacement strength",
+    },
+}
+
+
+def clamp_level(level: float) -> float:
+    """Clamp a (continuous) stage level to -5..+5."""
+    return max(LEVEL_MIN, min(LEVEL_MAX, float(level)))
+
+
+def crt_params(level: float) -> dict:
+    """CRT values for a stage level (+/-20% per level)."""
+    p = CRT_BASE_PARAMS
+    return {
+        "CURVATURE_AMOUNT": p["CURVATURE_AMOUNT"] * (1 + 0.2 * level),
+        "CHROMA_OFFSET": p["CHROMA_OFFSET"] * (1 + 0.2 * level),
+        "VIGNETTE_STRENGTH": min(max(p["VIGNETTE_STRENGTH"] * (1 + 0.15 * level), 0.0), 1.0),
+        "VIGNETTE_POWER": max(p["VIGNETTE_POWER"] * (1 + 0.1 * level), 0.1),
+    }
+
+
+def scanline_params(level: float) -> dict:
+    """Scanline values for a stage level (density +/-10%, strength +/-20%)."""
+    p = SCANLINE_BASE_PARAMS
+    return {
+        "SCANLINE_DENSITY": p["SCANLINE_DENSITY"] * (1 + 0.1 * level),
+        "DARK_LEVEL": p["DARK_LEVEL"],
+        "BRIGHT_LEVEL": p["BRIGHT_LEVEL"],
+        "STRENGTH": min(max(p["STRENGTH"] * (1 + 0.2 * level), 0.0), 2.0),
+    }
+
+
+def vhs_params(level: float) -> dict:
+    """VHS values for a stage level (+/-20% per level)."""
+    p = VHS_BASE_PARAMS
+    return {
+        "GRAIN_STRENGTH": max(p["GRAIN_STRENGTH"] * (1 + 0.2 * level), 0.0),
+        "FLICKER_STRENGTH": max(p["FLICKER_STRENGTH"] * (1 + 0.2 * level), 0.0),
+        "LINE_DENSITY": p["LINE_DENSITY"],
+        "GLITCH_AMOUNT": max(p["GLITCH_AMOUNT"] * (1 + 0.2 * level), 0.0),
+    }
+
+
+LEVEL_PARAMS = {
+    "crt": crt_params,
+    "scanlines": scanline_params,
+    "vhs": vhs_params,
+}
+
+
+# -------------------------------
+# Runtime parameters
+# -------------------------------
+
+def shader_opts(levels: dict) -> dict:
+    """//!PARAM values (glsl-shader-opts) for all effects at the given levels."""
+    opts = {}
+    for effect, params in LEVEL_PARAMS.items():
+        values = params(clamp_level(levels.get(effect, 0)))
+        for key, name in PARAM_NAMES[effect].items():
+            opts[name] = values[key]
+    return opts
+
+
+def format_shader_opts(opts: dict) -> str:
+    """Format values as an mpv key-value list ("A=1.0,B=2.0")."""
+    return ",".join(f"{name}={value:.6f}" for name, value in opts.items())
+
+
+def param_block(effect: str, key: str, desc: str, level: float = 0) -> str:
+    """
+    //!PARAM block for one effect value. Default is the given level (0 unless
+    baked for a renderer without shader options), the range covers levels
+    -5..+5 so mpv clamps out-of-range options.
+    """
+    params = LEVEL_PARAMS[effect]
+    values = [params(LEVEL_MIN)[key], params(LEVEL_MAX)[key]]
+    return "\n".join([
+        f"//!PARAM {PARAM_NAMES[effect][key]}",
+        f"//!DESC {desc}",
+        "//!TYPE float",
+        f"//!MINIMUM {min(values):.6f}",
+        f"//!MAXIMUM {max(values):.6f}",
+        f"{params(clamp_level(level))[key]:.6f}",
+        "",
+    ])
+
+
+# -------------------------------
+# VHS noise texture
+# -------------------------------
+
+# Tileable white noise (r8) embedded as //!TEXTURE; identical bytes, hence identical grain, on every GPU
+NOISE_TEXTURE = "PHOSPHOR_NOISE"
+NOISE_SIZE = 64
+NOISE_SEED = 1984
+
+
+def noise_bytes(size: int = NOISE_SIZE, seed: int = NOISE_SEED) -> bytes:
+    """size x size noise bytes from a seeded generator (white noise tiles seamlessly)."""
+    rng = random.Random(seed)
+    return bytes(rng.randrange(256) for _ in range(size * size))
+
+
+def noise_texture_block(size: int = NOISE_SIZE, seed: int = NOISE_SEED) -> str:
+    """//!TEXTURE block with the noise as hex data (nearest filtering, repeating)."""
+    return "\n".join([
+        f"//!TEXTURE {NOISE_TEXTURE}",
+        f"//!SIZE {size} {size}",
+        "//!FORMAT r8",
+        "//!FILTER NEAREST",
+        "//!BORDER REPEAT",
+        noise_bytes(size, seed).hex(),
+        "",
+    ])
+
+
+def vhs_noise_lines(uv: str, size: str, tile: int = NOISE_SIZE):
+    """
+    GLSL lines adding VHS grain, flicker and glitch lines to col. Grain is
+    one nearest fetch per pixel from the noise texture, shifted by a whole
+    number of texels each frame; flicker reads one texel per frame. All
+    frame math stays in exact float integers (repeats after 4096 frames).
+    """
+    n = f"{float(tile):.1f}"
+    return [
+        "    float noise_frame = mod(float(frame), 4096.0);",
+        f"    vec2 noise_offset = mod(vec2(37.0, 23.0) * noise_frame + vec2(0.0, 29.0) * floor(noise_frame / {n}), {n});",
+        f"    vec2 flicker_texel = vec2(mod(noise_frame, {n}), floor(noise_frame / {n}));",
+        f"    float grain = (texture({NOISE_TEXTURE}, (floor({uv} * {size}) + noise_offset + 0.5) / {n}).r - 0.5)",
+        "        * VHS_GRAIN_STRENGTH;",
+        f"    float flicker = (texture({NOISE_TEXTURE}, (flicker_texel + 0.5) / {n}).r - 0.5) * VHS_FLICKER_STRENGTH;",
+        f"    float glitch = step(0.98, fract({uv}.y * VHS_LINE_DENSITY + mod(float(frame), 50.0) * 0.02))",
+        "        * VHS_GLITCH_AMOUNT;",
+        "    col.rgb += grain + flicker - glitch;",
+    ]
+
+
+# -------------------------------
+# CRT lookup texture
+# -------------------------------
+
+# Position-only CRT terms baked into an rgba16f texture, so levels stay live //!PARAM
+# uniforms: the warp basis for any curvature k (nx' = nx + k*A, ny' = ny + k*(B + k*(C +
+# k*ny*A*A))) and log2(1 - dist) for the vignette (pow = exp2(power * log2)). All terms
+# are mirror-symmetric, so the texture covers one quadrant (|nx|, |ny|) and the shader
+# restores the signs: twice the resolution, and the vignette cusp at the centre falls
+# on a texel (max. error 0.17% at the strongest falloff, 64x64).
+CRT_LUT_TEXTURE = "PHOSPHOR_CRT_LUT"
+CRT_LUT_SIZE = 64
+
+
+def crt_lut_texel(ax: float, ay: float):
+    """(|A|, |B|, |C|, log2(1 - dist)) at |nx|, |ny| (screen position, -1..1 from the centre)."""
+    a = ax * ay * ay
+    return a, ay * ax * ax, 2.0 * ay * ax * a, math.log2(1.0 - 0.5 * math.hypot(ax, ay))
+
+
+def crt_lut_bytes(size: int = CRT_LUT_SIZE) -> bytes:
+    """size x size texels (half floats, little endian); texel i is |nx| or |ny| = i / (size - 1)."""
+    data = bytearray()
+    for y in range(size):
+        for x in range(size):
+            data += struct.pack("<4e", *crt_lut_texel(x / (size - 1), y / (size - 1)))
+    return bytes(data)
+
+
+def crt_lut_block(size: int = CRT_LUT_SIZE) -> str:
+    """//!TEXTURE block with the CRT lookup table (linear filtering, clamped)."""
+    return "\n".join([
+        f"//!TEXTURE {CRT_LUT_TEXTURE}",
+        f"//!SIZE {size} {size}",
+        "//!FORMAT rgba16f",
+        "//!FILTER LINEAR",
+        "//!BORDER CLAMP",
+        crt_lut_bytes(size).hex(),
+        "",
+    ])
+
+
+def crt_lines(tex: str, uv: str, size: int = CRT_LUT_SIZE):
+    """
+    GLSL lines for the CRT effect: one lookup for warp and vignette, the
+    three chroma taps from tex, then the vignette. Sets col.
+    """
+    scale = f"{(size - 1) / size:.7f}"
+    bias = f"{0.5 / size:.7f}"
+    return [
+        "    // ===== Fetch: screen curvature + chromatic aberration =====",
+        f"    vec2 n = {uv} * 2.0 - 1.0;",
+        f"    vec4 lut = texture({CRT_LUT_TEXTURE}, abs(n) * {scale} + {bias});",
+        "    vec3 warp = vec3(sign(n.x), sign(n.y), sign(n.y)) * lut.rgb;",
+        "    float k = CRT_CURVATURE_AMOUNT;",
+        "    vec2 cuv = (n + k * vec2(warp.x, warp.y + k * (warp.z + k * n.y * warp.x * warp.x)) + 1.0) * 0.5;",
+        f"    float r = {tex}_texOff(cuv + vec2( CRT_CHROMA_OFFSET, 0.0)).r;",
+        f"    float g = {tex}_tex(cuv).g;",
+        f"    float b = {tex}_texOff(cuv + vec2(-CRT_CHROMA_OFFSET, 0.0)).b;",
+        "    vec4 col = vec4(r, g, b, 1.0);",
+        "",
+        "    // ===== CRT vignette: pow(1 - dist, power) from the baked log2 =====",
+        "    float vignette = exp2(CRT_VIGNETTE_POWER * lut.a);",
+        "    col.rgb *= mix(1.0, vignette, CRT_VIGNETTE_STRENGTH);",
+        "",
+    ]
+
+
+# -------------------------------
+# Fused shader
+# -------------------------------
+
+# Where effects run: source resolution (MAIN hook) or output/window resolution (OUTPUT hook)
+EFFECT_PLACEMENTS = {
+    "source": "MAIN",
+    "output": "OUTPUT",
+}
+
+# Intermediate texture of the low-resolution scanline/VHS pass
+LOWRES_TEXTURE = "PHOSPHOR_LOWRES"
+
+EFFECT_TITLES = {"crt": "CRT", "scanlines": "Scanlines", "vhs": "VHS"}
+
+
+def _fetch_lines(effects, tex: str):
+    """Sample tex (CRT: baked curvature + chromatic aberration taps, then vignette)."""
+    if "crt" not in effects:
+        return [
+            "    // ===== Fetch =====",
+            f"    vec4 col = {tex}_tex(uv);",
+            "",
+        ]
+    return crt_lines(tex, "uv")
+
+
+def _overlay_lines(effects, size: str = "HOOKED_size"):
+    """Scanline modulation and VHS noise on col (size: pixel size of the pass output)."""
+    body = []
+    if "scanlines" in effects:
+        body += [
+            "    // ===== Scanlines =====",
+            "    float scan = sin(uv.y * SCAN_DENSITY) * 0.5 + 0.5;",
+            "    float modulation = mix(SCAN_DARK_LEVEL, SCAN_BRIGHT_LEVEL, scan);",
+            "    col.rgb *= mix(1.0, modulation, SCAN_STRENGTH);",
+            "",
+        ]
+    if "vhs" in effects:
+        body += [
+            "    // ===== VHS grain, flicker and glitch lines =====",
+            *vhs_noise_lines("uv", size),
+            "    col = clamp(col, 0.0, 1.0);",
+            "",
+        ]
+    return body
+
+
+def _pass(hook: str, binds, desc: str, body, directives=()):
+    """One //!HOOK pass returning col."""
+    return [
+        f"//!HOOK {hook}",
+        *(f"//!BIND {b}" for b in binds),
+        *directives,
+        f"//!DESC {desc}",
+        "",
+        "vec4 hook() {",
+        f"    vec2 uv = {binds[0]}_pos;",
+        "",
+        *body,
+        "    return col;",
+        "}",
+        "",
+    ]
+
+
+def build_fused_shader(effects, levels: dict = None, placement: str = "source", lowres_lines: int = 0) -> str:
+    """
+    Build one single-pass shader for the enabled effects.
+    The source texture is sampled once (three taps with CRT chroma offset),
+    VHS noise comes from the embedded noise texture, everything else stays
+    in registers. Math matches the separate stage files,
+    strengths are //!PARAM uniforms updated via glsl-shader-opts; levels bakes
+    their defaults for renderers that cannot set options (e.g. libplacebo filter).
+
+    placement "output" hooks OUTPUT instead of MAIN, so the cost follows the
+    window size instead of the source size. With lowres_lines, scanlines and
+    VHS noise are rendered into a lowres_lines-high intermediate texture
+    (aspect kept) that the second pass upscales, applying CRT curvature on
+    the way (so the scanlines are curved with the tube).
+    """
+    if placement not in EFFECT_PLACEMENTS:
+        raise ValueError(f"Unknown effect placement: {placement}")
+    hook = EFFECT_PLACEMENTS[placement]
+    effects = [e for e in EFFECTS if e in effects]
+    levels = levels or {}
+
+    params = []
+    for effect in effects:
+        for key, desc in PARAM_DESCS[effect].items():
+            params.append(param_block(effect, key, desc, levels.get(effect, 0)))
+    lut = [CRT_LUT_TEXTURE] if "crt" in effects else []
+    if lut:
+        params.append(crt_lut_block())
+    noise = [NOISE_TEXTURE] if "vhs" in effects else []
+    if noise:
+        params.append(noise_texture_block())
+
+    desc = " + ".join(EFFECT_TITLES[e] for e in effects) or "Passthrough"
+    overlays = [e for e in effects if e in ("scanlines", "vhs")]
+
+    if lowres_lines and overlays:
+        lines = int(lowres_lines)
+        titles = " + ".join(EFFECT_TITLES[e] for e in overlays)
+        # Grain texels follow this pass's own output pixels (mpv truncates //!WIDTH to int)
+        size = f"vec2(floor(HOOKED_size.x * {lines:.1f} / HOOKED_size.y), {lines:.1f})"
+        passes = _pass(
+            hook, ["HOOKED", *noise], f"Phosphor Low-Res Effect ({titles}, {lines} lines)",
+            _fetch_lines((), "HOOKED") + _overlay_lines(overlays, size),
+            [f"//!SAVE {LOWRES_TEXTURE}", f"//!WIDTH HOOKED.w {lines} * HOOKED.h /", f"//!HEIGHT {lines}"],
+        )
+        passes += _pass(
+            hook, [LOWRES_TEXTURE, "HOOKED", *lut], f"Phosphor Upscale ({desc})",
+            _fetch_lines(effects, LOWRES_TEXTURE),
+        )
+    else:
+        passes = _pass(hook, ["HOOKED", *lut, *noise], f"Phosphor Fused Effect ({desc})",
+                       _fetch_lines(effects, "HOOKED") + _overlay_lines(effects))
+
+    return "\n".join([*params, *passes])
+
+
+def fused_shader_name(effects, levels: dict = None, placement: str = "source", lowres_lines: int = 0) -> str:
+    """File name of a fused shader, keyed by the enabled effect set (and baked levels, placement, low-res size)."""
+    parts = [e for e in EFFECTS if e in effects]
+    if levels:
+        parts += [f"{e}{clamp_level(levels.get(e, 0)):+.1f}" for e in EFFECTS if e in effects]
+    if placement != "source":
+        parts.append(placement)
+    if lowres_lines:
+        parts.append(f"lo{int(lowres_lines)}")
+    return f"fused_{'_'.join(parts) or 'none'}.glsl"
+
+
+def write_text_atomic(path, content: str):
+    """Write via a temp file in the same folder and os.replace, so readers never see a partial shader."""
+    path = Path(path)
+    fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def write_fused_shader(directory, effects, levels: dict = None, placement: str = "source", lowres_lines: int = 0) -> Path:
+    """Write the fused shader into directory (once) and return its path."""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    path = directory / fused_shader_name(effects, levels, placement, lowres_lines)
+    content = build_fused_shader(effects, levels, placement, lowres_lines)
+    if not path.exists() or path.read_text() != content:
+        write_text_atomic(path, content)
+    return path
@@ -0,0 +1,189 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2026 Michael Gasche
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+
+# File:        telemetry.py
+# Version:     1.0
+# Author:      Michael Gasche
+# Created:     2026-10
+# Product:     Phosphor
+# Description: Playback health telemetry (dropped frames, A/V sync, cache) in a ring buffer.
+
+
+import json
+import threading
+import time
+
+from collections import deque
+
+
+# Observed MPV properties
+TELEMETRY_PROPERTIES = (
+    "frame-drop-count",
+    "decoder-frame-drop-count",
+    "vo-delayed-frame-count",
+    "avsync",
+    "estimated-vf-fps",
+    "container-fps",
+    "demuxer-cache-state",
+    "seeking",
+    "paused-for-cache",
+    "playback-time",
+    "pause",
+    "eof-reached",
+    "playlist-pos",
+)
+
+# Monotonic frame counters, kept as integers; per-sample rates are derived from their deltas
+FRAME_COUNTERS = {
+    "frame-drop-count": "drop_rate",
+    "decoder-frame-drop-count": "decoder_drop_rate",
+    "vo-delayed-frame-count": "delayed_rate",
+}
+
+
+# -------------------------------
+# PlaybackTelemetry class
+# -------------------------------
+
+class PlaybackTelemetry:
+    """
+    Observes playback health properties and samples them at a fixed
+    interval into a bounded ring buffer (oldest samples are dropped).
+    Timestamps are integer perf_counter_ns values and frame counters
+    integers, so rates come from exact deltas.
+    """
+
+    def __init__(self, capacity: int = 3600, interval: float = 1.0, context=None):
+        self.interval = interval
+        self._context = context
+        self._samples = deque(maxlen=capacity)
+        self._latest = {}
+        self._previous = None
+        self._lock = threading.Lock()
+        self._mpv = None
+        self._stop = threading.Event()
+        self._thread = None
+
+
+    # -------------------------------
+    # Attach / Detach
+    # -------------------------------
+
+    def attach(self, mpv_instance):
+        """Observe the telemetry properties of an MPV instance and start sampling."""
+        self._mpv = mpv_instance
+        for name in TELEMETRY_PROPERTIES:
+            mpv_instance.observe_property(name, self._on_property)
+
+        if self._thread is None:
+            self._stop = threading.Event()
+            self._thread = threading.Thread(target=self._run, args=(self._stop,), daemon=True)
+            self._thread.start()
+
+    def detach(self):
+        """Stop sampling and remove the observers."""
+        self._stop.set()
+        self._thread = None
+        if self._mpv is not None:
+            for name in TELEMETRY_PROPERTIES:
+                try:
+                    self._mpv.unobserve_property(name, self._on_property)
+                except Exception:
+                    pass
+            self._mpv = None
+
+
+    # -------------------------------
+    # Sampling
+    # -------------------------------
+
+    def _on_property(self, name, value):
+        """MPV event thread: only store the latest value."""
+        if name == "demuxer-cache-state":
+            value = self._cache_summary(value)
+        elif name in FRAME_COUNTERS and value is not None:
+            value = int(value)
+        with self._lock:
+            self._latest[name] = value
+
+    def _cache_summary(self, state):
+        """Reduce demuxer-cache-state to the fields worth keeping per sample."""
+        if not state:
+            return None
+        return {
+            "duration": state.get("cache-duration"),
+            "fw_bytes": state.get("fw-bytes"),
+            "total_bytes": state.get("total-bytes"),
+            "underrun": state.get("underrun"),
+            "idle": state.get("idle"),
+        }
+
+    def _run(self, stop):
+        while not stop.wait(self.interval):
+            self.sample()
+
+    def sample(self) -> dict:
+        """
+        Append one sample (latest values, frame counter rates per second
+        since the previous sample, optional context) to the ring buffer.
+        """
+        with self._lock:
+            sample = {"time": time.time(), "time_ns": time.perf_counter_ns(), **self._latest}
+            previous, self._previous = self._previous, sample
+        elapsed_ns = sample["time_ns"] - previous["time_ns"] if previous else 0
+        for name, rate in FRAME_COUNTERS.items():
+            now, before = sample.get(name), previous.get(name) if previous else None
+            if elapsed_ns > 0 and now is not None and before is not None:
+                sample[rate] = max(0, now - before) * 1_000_000_000 / elapsed_ns
+            else:
+                sample[rate] = None
+        if self._context is not None:
+            try:
+                sample.update(self._context())
+            except Exception:
+                pass
+        with self._lock:
+            self._samples.append(sample)
+        return sample
+
+
+    # -------------------------------
+    # Access / Export
+    # -------------------------------
+
+    def latest(self) -> dict:
+        """Most recent property values."""
+        with self._lock:
+            return dict(self._latest)
+
+    def samples(self) -> list:
+        """Copy of the buffered samples, oldest first."""
+        with self._lock:
+            return list(self._samples)
+
+    def export_jsonl(self, path: str) -> int:
+        """Write all buffered samples as JSON lines; returns the sample count."""
+        samples = self.samples()
+        with open(path, "w") as f:
+            for sample in samples:
+                f.write(json.dumps(sample) + "\n")
+        return len(samples)
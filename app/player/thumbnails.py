@@ -0,0 +1,320 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2026 Michael Gasche
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+
+# File:        thumbnails.py
+# Version:     1.0
+# Author:      Michael Gasche
+# Created:     2026-10
+# Product:     Phosphor
+# Description: Seek-bar thumbnails: throttled background extractor and LRU disk cache.
+
+
+import os
+import sys
+import math
+import time
+import zlib
+import struct
+import hashlib
+import threading
+
+from pathlib import Path
+from collections import OrderedDict
+
+from player.cache import MiB
+from player.libmpv import load_mpv
+
+
+# Thumbnail file: width, height, stride (BGRA, alpha opaque), then zlib data
+HEADER = struct.Struct("<III")
+
+
+def file_fingerprint(path: str) -> str:
+    """Cache key of a file: real path, size and modification time (URLs: the URL)."""
+    try:
+        real = os.path.realpath(path)
+        st = os.stat(real)
+        data = f"{real}|{st.st_size}|{st.st_mtime_ns}"
+    except OSError:
+        data = path
+    return hashlib.sha1(data.encode("utf-8")).hexdigest()[:20]
+
+
+# -------------------------------
+# ThumbnailCache class
+# -------------------------------
+
+class ThumbnailCache:
+    """
+    Size-bounded LRU cache on disk: one file per thumbnail, grouped in a
+    folder per (file fingerprint, interval, width). The LRU order and sizes
+    are kept in memory, so reads and evictions touch no file metadata; file
+    mtimes persist the order across restarts and are only updated when a
+    thumbnail is written (reads since then are stamped in order too).
+    """
+
+    def __init__(self, directory, max_bytes: int = 256 * MiB):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._sizes = OrderedDict()  # least recently used first
+        self._read = OrderedDict()   # read since the last write, mtime not yet updated
+        self._total = 0
+        self.stats = {"hits": 0, "misses": 0, "evicted": 0}
+        self._scan()
+
+    def _scan(self):
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            files = []
+            for f in self.directory.glob("*/*.thumb"):
+                st = f.stat()
+                files.append((st.st_mtime_ns, f, st.st_size))
+        except OSError as e:
+            print(f"Thumbnail cache unavailable: {e}", flush=True)
+            return
+        for _, f, size in sorted(files, key=lambda x: x[0]):
+            self._sizes[f] = size
+            self._total += size
+
+    @staticmethod
+    def key(path: str, interval: float, width: int) -> str:
+        return f"{file_fingerprint(path)}-{interval:g}s-{width}"
+
+    def _file(self, key: str, index: int) -> Path:
+        return self.directory / key / f"{index:06d}.thumb"
+
+    def has(self, key: str, index: int) -> bool:
+        with self._lock:
+            return self._file(key, index) in self._sizes
+
+    def get(self, key: str, index: int):
+        """(width, height, stride, BGRA bytes) or None."""
+        f = self._file(key, index)
+        with self._lock:
+            if f not in self._sizes:
+                self.stats["misses"] += 1
+                return None
+            self._sizes.move_to_end(f)
+            self._read[f] = None
+            self._read.move_to_end(f)
+        try:
+            raw = f.read_bytes()
+        except OSError:
+            with self._lock:
+                self._total -= self._sizes.pop(f, 0)
+                self._read.pop(f, None)
+            return None
+        width, height, stride = HEADER.unpack_from(raw)
+        with self._lock:
+            self.stats["hits"] += 1
+        return width, height, stride, zlib.decompress(raw[HEADER.size:])
+
+    def put(self, key: str, index: int, width: int, height: int, stride: int, data: bytes):
+        f = self._file(key, index)
+        blob = HEADER.pack(width, height, stride) + zlib.compress(data, 1)
+        try:
+            f.parent.mkdir(parents=True, exist_ok=True)
+            tmp = f.with_suffix(".tmp")
+            tmp.write_bytes(blob)
+            os.replace(tmp, f)
+        except OSError as e:
+            print(f"Thumbnail cache write failed: {e}", flush=True)
+            return
+        with self._lock:
+            self._total += len(blob) - self._sizes.get(f, 0)
+            self._sizes[f] = len(blob)
+            self._sizes.move_to_end(f)
+            self._read.pop(f, None)
+            touched, self._read = [*self._read, f], OrderedDict()
+        self._stamp(touched)
+        self._evict()
+
+    def _stamp(self, files):
+        """Persist the LRU order of files (oldest first) as consecutive mtimes."""
+        now = time.time_ns() - len(files)
+        for i, f in enumerate(files):
+            try:
+                os.utime(f, ns=(now + i, now + i))
+            except OSError:
+                pass
+
+    def _evict(self):
+        while True:
+            with self._lock:
+                if self._total <= self.max_bytes or not self._sizes:
+                    return
+                f, size = self._sizes.popitem(last=False)
+                self._read.pop(f, None)
+                self._total -= size
+                self.stats["evicted"] += 1
+            try:
+                f.unlink()
+                if not any(f.parent.iterdir()):
+                    f.parent.rmdir()
+            except OSError:
+                pass
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            return self._total
+
+
+# -------------------------------
+# ThumbnailExtractor class
+# -------------------------------
+
+class ThumbnailExtractor:
+    """
+    Pulls one keyframe-aligned thumbnail per interval from a hidden,
+    decode-only MPV instance (vo=null, one software decoder thread,
+    scaled in the filter chain, screenshot-raw into memory).
+
+    Throttled so the visible player keeps its decode time: the extractor
+    runs at low OS priority where possible, waits while should_yield()
+    is true (e.g. the visible player is seeking or buffering) and works
+    at most duty of the wall time.
+    """
+
+    def __init__(self, path: str, cache: ThumbnailCache, interval: float = 10.0, width: int = 192,
+                 should_yield=None, duty: float = 0.25, on_thumbnail=None):
+        self.path = path
+        self.cache = cache
+        self.interval = interval
+        self.width = width
+        self.key = cache.key(path, interval, width)
+        self.duration = None
+        self.done = 0
+        self._should_yield = should_yield or (lambda: False)
+        self._duty = max(0.01, min(1.0, duty))
+        self._on_thumbnail = on_thumbnail
+        self._stop = threading.Event()
+        self._restart = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0):
+        self._stop.set()
+        self._restart.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+
+    def index_for(self, seconds: float) -> int:
+        return max(0, int(seconds // self.interval))
+
+    def get(self, seconds: float):
+        """Cached thumbnail nearest to (at or before) seconds, or None."""
+        return self.cache.get(self.key, self.index_for(seconds))
+
+
+    # -------------------------------
+    # Extraction
+    # -------------------------------
+
+    def _lower_priority(self):
+        # Niceness is per thread on Linux and inherited by the threads libmpv creates from here
+        if sys.platform.startswith("linux"):
+            try:
+                os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), 19)
+            except (AttributeError, OSError):
+                pass
+
+    def _run(self):
+        self._lower_priority()
+        try:
+            player = load_mpv().MPV(
+                vo="null",
+                ao="null",
+                audio="no",
+                sub="no",
+                hwdec="no",
+                vd_lavc_threads=1,
+                vd_lavc_skiploopfilter="all",
+                vd_lavc_fast=True,
+                hr_seek="no",
+                cache="no",
+                pause=True,
+                keep_open="always",
+                vf=f"scale={self.width}:-2",
+                input_default_bindings=False,
+                ytdl=False,
+                loglevel="error",
+            )
+        except Exception as e:
+            print(f"Thumbnail extractor unavailable: {e}", flush=True)
+            return
+
+        restart_cb = player.event_callback("playback-restart")(lambda event=None: self._restart.set())
+        try:
+            self._restart.clear()
+            player.command("loadfile", self.path, "replace")
+            if not self._restart.wait(10) or self._stop.is_set():
+                return
+            self.duration = player.duration
+            if not self.duration:
+                return
+
+            count = int(math.ceil(self.duration / self.interval))
+            for index in range(count):
+                if self._stop.is_set():
+                    return
+                if self.cache.has(self.key, index):
+                    self.done += 1
+                    continue
+                while self._should_yield() and not self._stop.wait(0.25):
+                    pass
+
+                started = time.perf_counter()
+                self._restart.clear()
+                player.command("seek", index * self.interval, "absolute+keyframes")
+                if not self._restart.wait(5) or self._stop.is_set():
+                    continue
+                image = player.node_command("screenshot-raw", "video")
+                self._store(index, image)
+
+                # Duty cycle: idle long enough that extraction uses at most duty of the time
+                spent = time.perf_counter() - started
+                self._stop.wait(spent * (1.0 / self._duty - 1.0))
+
+            print(f"Thumbnails ready: {count} for {os.path.basename(self.path)}", flush=True)
+        except Exception as e:
+            print(f"Thumbnail extraction failed: {e}", flush=True)
+        finally:
+            try:
+                restart_cb.unregister_mpv_events()
+            except Exception:
+                pass
+            player.terminate()
+
+    def _store(self, index: int, image: dict):
+        """screenshot-raw (bgr0) -> BGRA with opaque alpha, as overlay-add expects."""
+        if not image or image.get("format") not in ("bgr0", "bgra"):
+            return
+        data = bytearray(image["data"])
+        data[3::4] = b"\xff" * (len(data) // 4)
+        self.cache.put(self.key, index, image["w"], image["h"], image["stride"], bytes(data))
+        self.done += 1
+        if self._on_thumbnail is not None:
+            self._on_thumbnail(index)
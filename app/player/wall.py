@@ -0,0 +1,276 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2026 Michael Gasche
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+
+# File:        wall.py
+# Version:     1.0
+# Author:      Michael Gasche
+# Created:     2026-10
+# Product:     Phosphor
+# Description: Video wall: a grid of effected players under a shared frame budget.
+
+
+import os
+import math
+import time
+import threading
+
+from player.mpv_player import MPVPlayer
+
+
+# Tile limits of a wall
+WALL_MIN_TILES = 1
+WALL_MAX_TILES = 16
+
+# A tile dropping more frames per second than this is starving
+STARVING_DROPS_PER_SECOND = 0.5
+
+
+def grid_for(count: int):
+    """(columns, rows) of the most square grid holding count tiles."""
+    columns = max(1, math.ceil(math.sqrt(count)))
+    return columns, max(1, math.ceil(count / columns))
+
+
+def tile_geometries(count: int, x: int, y: int, width: int, height: int):
+    """(x, y, w, h) per tile, row by row, filling the given screen rectangle."""
+    columns, rows = grid_for(count)
+    tile_w, tile_h = width // columns, height // rows
+    return [(x + (i % columns) * tile_w, y + (i // columns) * tile_h, tile_w, tile_h) for i in range(count)]
+
+
+# -------------------------------
+# WallScheduler class
+# -------------------------------
+
+class WallScheduler:
+    """
+    Frame-rate budget per tile. The shading cost of a tile is its output
+    pixels times its frame rate (effects run at output resolution on the
+    wall); gpu_budget_mpps megapixels/s are split by water-filling, so
+    small or slow tiles keep their full rate and the rest share the
+    remainder equally.
+
+    Feedback on top: when the process CPU load exceeds cpu_target (share
+    of all cores) or tiles drop frames, the whole budget shrinks (x0.85)
+    and starving tiles get an extra penalty; both recover slowly.
+    """
+
+    def __init__(self, gpu_budget_mpps: float = 250.0, cpu_target: float = 0.8, min_fps: float = 8.0,
+                 hysteresis: float = 1.0):
+        self.gpu_budget_mpps = gpu_budget_mpps
+        self.cpu_target = cpu_target
+        self.min_fps = min_fps
+        self.hysteresis = hysteresis
+        self.factor = 1.0
+        self.cpu_load = None
+        self._penalty = {}
+        self._last_cpu = None
+
+    def measure_cpu(self):
+        """Process CPU load since the last call (all threads, incl. libmpv), as share of all cores."""
+        now = (time.perf_counter(), time.process_time())
+        if self._last_cpu is not None:
+            wall = now[0] - self._last_cpu[0]
+            if wall > 0:
+                self.cpu_load = (now[1] - self._last_cpu[1]) / wall / (os.cpu_count() or 1)
+        self._last_cpu = now
+        return self.cpu_load
+
+    def plan(self, tiles) -> dict:
+        """
+        tiles: dicts with id, pixels (output w*h), source_fps, drop_rate
+        (dropped frames/s since the last plan). Returns {id: fps cap or None}.
+        """
+        starving = {t["id"] for t in tiles if (t.get("drop_rate") or 0) > STARVING_DROPS_PER_SECOND}
+        overloaded = self.cpu_load is not None and self.cpu_load > self.cpu_target
+        if overloaded or starving:
+            self.factor = max(0.1, self.factor * 0.85)
+        elif self.cpu_load is None or self.cpu_load < self.cpu_target * 0.85:
+            self.factor = min(1.0, self.factor + 0.05)
+
+        for t in tiles:
+            penalty = self._penalty.get(t["id"], 1.0)
+            self._penalty[t["id"]] = max(0.25, penalty * 0.8) if t["id"] in starving else min(1.0, penalty + 0.05)
+
+        # Water-filling of the pixel rate: tiles needing less than an equal share keep their demand
+        budget = self.gpu_budget_mpps * 1e6 * self.factor
+        demand = {t["id"]: t["pixels"] * (t.get("source_fps") or 30.0) for t in tiles}
+        alloc = {}
+        remaining = sorted(tiles, key=lambda t: demand[t["id"]])
+        while remaining:
+            share = budget / len(remaining)
+            t = remaining.pop(0)
+            alloc[t["id"]] = min(demand[t["id"]], share)
+            budget -= alloc[t["id"]]
+
+        caps = {}
+        for t in tiles:
+            source_fps = t.get("source_fps") or 30.0
+            fps = alloc[t["id"]] / max(1, t["pixels"]) * self._penalty[t["id"]]
+            fps = max(self.min_fps, min(source_fps, fps))
+            caps[t["id"]] = None if fps >= source_fps - self.hysteresis else round(fps, 1)
+        return caps
+
+
+# -------------------------------
+# VideoWall class
+# -------------------------------
+
+class VideoWall:
+    """
+    N looping MPVPlayer tiles in a borderless grid. All tiles share one
+    shader directory, compiled shader cache and fused shader set (only the
+    first prewarms); a scheduler thread re-plans frame-rate caps from
+    per-tile telemetry every interval seconds.
+    """
+
+    def __init__(self, clips, rect, cache_dir: str, scheduler: WallScheduler = None, interval: float = 2.0,
+                 fused: bool = True, lowres_lines: int = 0, player_options: dict = None, prewarm_wid: int = None):
+        if not WALL_MIN_TILES <= len(clips) <= WALL_MAX_TILES:
+            raise ValueError(f"A video wall needs {WALL_MIN_TILES} to {WALL_MAX_TILES} clips, got {len(clips)}")
+        self.clips = list(clips)
+        self.rect = rect
+        self.scheduler = scheduler or WallScheduler()
+        self.interval = interval
+        self.players = []
+        self.tiles = []
+        self._cache_dir = cache_dir
+        self._fused = fused
+        self._lowres_lines = lowres_lines
+        self._player_options = player_options or {}
+        self._prewarm_wid = prewarm_wid
+        self._shader_files = {}
+        self._last = {}
+        self._stats = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self, effects=(), levels: dict = None):
+        """Create one player per clip and start the budget scheduler."""
+        geometries = tile_geometries(len(self.clips), *self.rect)
+        for index, (clip, (x, y, w, h)) in enumerate(zip(self.clips, geometries)):
+            player = MPVPlayer(
+                osc=False,
+                fused=self._fused,
+                cache_dir=self._cache_dir,
+                cache_profile="low-memory",
+                placement="output",
+                lowres_lines=self._lowres_lines,
+                shader_files=self._shader_files,
+                prewarm=index == 0,
+                prewarm_wid=self._prewarm_wid,
+                mpv_options=dict(
+                    geometry=f"{w}x{h}+{x}+{y}",
+                    border=False,
+                    keepaspect_window=False,
+                    mute=True,
+                    **self._player_options,
+                ),
+            )
+            self.players.append(player)
+            self.tiles.append({"id": index, "clip": clip, "geometry": (x, y, w, h)})
+        self.apply_effects(effects, levels)
+        for player, tile in zip(self.players, self.tiles):
+            player.load_playlist([tile["clip"]], loop=True)
+
+        self.scheduler.measure_cpu()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def apply_effects(self, effects, levels: dict = None):
+        """Same effects and levels on every tile (one shader update per tile)."""
+        for player in self.players:
+            with player.batch():
+                player.enable_crt("crt" in effects)
+                player.enable_scanlines("scanlines" in effects)
+                player.enable_vhs("vhs" in effects)
+                for effect, level in (levels or {}).items():
+                    player.set_shader_level(effect, level)
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(self.interval + 5.0)
+            self._thread = None
+        for player in self.players:
+            player.terminate()
+        self.players = []
+
+
+    # -------------------------------
+    # Scheduling
+    # -------------------------------
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.reschedule()
+            except Exception as e:
+                print(f"Video wall scheduler failed: {e}", flush=True)
+
+    def _tile_state(self, tile, player, now):
+        """Telemetry of one tile, with drop rates since the last pass."""
+        t = player.telemetry.latest()
+        drops = (t.get("frame-drop-count") or 0) + (t.get("decoder-frame-drop-count") or 0)
+        last_time, last_drops = self._last.get(tile["id"], (now, drops))
+        self._last[tile["id"]] = (now, drops)
+        elapsed_ns = now - last_time
+        _, _, w, h = tile["geometry"]
+        return {
+            "id": tile["id"],
+            "clip": os.path.basename(tile["clip"]),
+            "pixels": w * h,
+            "source_fps": t.get("container-fps"),
+            "fps": t.get("estimated-vf-fps"),
+            "dropped_vo": t.get("frame-drop-count"),
+            "dropped_decoder": t.get("decoder-frame-drop-count"),
+            "drop_rate": max(0, drops - last_drops) * 1_000_000_000 / elapsed_ns if elapsed_ns > 0 else 0.0,
+        }
+
+    def reschedule(self):
+        """One scheduler pass: sample tiles, plan and apply changed caps."""
+        now = time.perf_counter_ns()
+        states = [self._tile_state(tile, player, now) for tile, player in zip(self.tiles, self.players)]
+        self.scheduler.measure_cpu()
+        caps = self.scheduler.plan(states)
+        for state, player in zip(states, self.players):
+            cap = caps[state["id"]]
+            if self._changed(cap, player.fps_cap):
+                player.set_fps_cap(cap)
+            else:
+                cap = player.fps_cap
+            state["fps_cap"] = cap
+            state["starving"] = state["drop_rate"] > STARVING_DROPS_PER_SECOND
+        with self._lock:
+            self._stats = states
+
+    def _changed(self, cap, current) -> bool:
+        """Re-plug the fps filter only for real changes (each change reinitializes the filter chain)."""
+        if cap is None or current is None:
+            return cap != current
+        return abs(cap - current) >= self.scheduler.hysteresis
+
+    def tile_stats(self) -> list:
+        """Per-tile state of the last scheduler pass (for the wall panel)."""
+        with self._lock:
+            return [dict(s) for s in self._stats]
@@ -0,0 +1,349 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2026 Michael Gasche
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+
+# File:        watchdog.py
+# Version:     1.0
+# Author:      Michael Gasche
+# Created:     2026-10
+# Product:     Phosphor
+# Description: Long-run watchdog: resource and heartbeat sampling, stall/leak detection, player recovery.
+
+
+import os
+import sys
+import json
+import time
+import logging
+import threading
+import subprocess
+
+from collections import deque
+from concurrent.futures import Future
+from logging.handlers import RotatingFileHandler
+
+from player.cache import MiB
+
+
+# Growth per hour that counts as a leak when sustained over the whole window
+LEAK_RATES = {
+    "rss_bytes": 128 * MiB,
+    "threads": 30,
+    "fds": 60,
+}
+
+
+# -------------------------------
+# Process resources
+# -------------------------------
+
+def _linux_resources() -> dict:
+    values = {}
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                values["rss_bytes"] = int(line.split()[1]) * 1024
+            elif line.startswith("Threads:"):
+                values["threads"] = int(line.split()[1])
+    values["fds"] = len(os.listdir("/proc/self/fd"))
+    return values
+
+
+def _darwin_resources() -> dict:
+    pid = str(os.getpid())
+    rss = subprocess.check_output(["ps", "-o", "rss=", "-p", pid], stderr=subprocess.DEVNULL, timeout=5)
+    # One line per thread after the header
+    threads = subprocess.check_output(["ps", "-M", "-p", pid], stderr=subprocess.DEVNULL, timeout=5)
+    return {
+        "rss_bytes": int(rss.split()[0]) * 1024,
+        "threads": max(0, len(threads.splitlines()) - 1),
+        "fds": len(os.listdir("/dev/fd")),
+    }
+
+
+def _windows_resources() -> dict:
+    import ctypes
+    from ctypes import wintypes
+
+    class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+        _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD)] + [
+            (name, ctypes.c_size_t) for name in (
+                "PeakWorkingSetSize", "WorkingSetSize", "QuotaPeakPagedPoolUsage", "QuotaPagedPoolUsage",
+                "QuotaPeakNonPagedPoolUsage", "QuotaNonPagedPoolUsage", "PagefileUsage", "PeakPagefileUsage",
+            )
+        ]
+
+    process = ctypes.windll.kernel32.GetCurrentProcess()
+    counters = PROCESS_MEMORY_COUNTERS()
+    counters.cb = ctypes.sizeof(counters)
+    handles = wintypes.DWORD()
+    values = {"threads": threading.active_count()}  # Python threads only (no native thread count API)
+    if ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+        values["rss_bytes"] = counters.WorkingSetSize
+    if ctypes.windll.kernel32.GetProcessHandleCount(process, ctypes.byref(handles)):
+        values["fds"] = handles.value  # open handles
+    return values
+
+
+def process_resources() -> dict:
+    """Resident memory (bytes), thread count and open file descriptors of this process (incl. libmpv)."""
+    values = {"rss_bytes": None, "threads": None, "fds": None}
+    try:
+        if sys.platform.startswith("linux"):
+            values.update(_linux_resources())
+        elif sys.platform == "darwin":
+            values.update(_darwin_resources())
+        elif os.name == "nt":
+            values.update(_windows_resources())
+    except Exception:
+        pass
+    return values
+
+
+def hourly_slope(points) -> float:
+    """Least-squares slope of (seconds, value) points, per hour."""
+    n = len(points)
+    if n < 2:
+        return 0.0
+    mean_t = sum(t for t, _ in points) / n
+    mean_v = sum(v for _, v in points) / n
+    var = sum((t - mean_t) ** 2 for t, _ in points)
+    if var <= 0:
+        return 0.0
+    return sum((t - mean_t) * (v - mean_v) for t, v in points) / var * 3600.0
+
+
+# -------------------------------
+# PlayerWatchdog class
+# -------------------------------
+
+class PlayerWatchdog:
+    """
+    Samples process resources and the player heartbeat every interval
+    seconds, logs every sample as a JSON line and recovers the player
+    when it is wedged or leaking:
+
+    - stall: playback-time did not advance for stall_seconds while the
+      player should be playing (buffering_seconds while seeking or
+      waiting for the cache),
+    - unresponsive: the worker (and libmpv core behind it) did not
+      answer a ping for worker_seconds,
+    - leak: RSS, threads or file descriptors grew faster than LEAK_RATES
+      per hour in both halves of the last window_seconds (a one-time
+      ramp such as the demuxer cache filling up does not count).
+
+    Recovery takes a snapshot of file, position and effects from cached
+    state, terminates the player (confirmed or abandoned after
+    terminate_timeout), calls rebuild(snapshot) (may return a Future, e.g.
+    to run on the Qt thread) and waits for the new player to report a
+    position, all within recovery_timeout. Recoveries are at least
+    cooldown seconds apart.
+    """
+
+    def __init__(self, get_player, rebuild, log_path: str = None, interval: float = 5.0,
+                 stall_seconds: float = 15.0, buffering_seconds: float = 60.0, worker_seconds: float = 30.0,
+                 window_seconds: float = 3600.0, leak_rates: dict = None, terminate_timeout: float = 5.0,
+                 recovery_timeout: float = 20.0, cooldown: float = 600.0):
+        self.interval = interval
+        self.stall_seconds = stall_seconds
+        self.buffering_seconds = buffering_seconds
+        self.worker_seconds = worker_seconds
+        self.window_seconds = window_seconds
+        self.leak_rates = dict(LEAK_RATES if leak_rates is None else leak_rates)
+        self.terminate_timeout = terminate_timeout
+        self.recovery_timeout = recovery_timeout
+        self.cooldown = cooldown
+        self.stats = {"samples": 0, "recoveries": 0, "failed": 0, "last_reason": None}
+
+        self._get_player = get_player
+        self._rebuild = rebuild
+        self._history = deque()
+        self._player = None
+        self._position = None
+        self._progress_at = 0.0
+        self._ping_since = None
+        self._last_recovery = None
+        self._stop = threading.Event()
+        self._thread = None
+
+        self._log = None
+        if log_path:
+            try:
+                os.makedirs(os.path.dirname(log_path) or ".", exist_ok=True)
+                handler = RotatingFileHandler(log_path, maxBytes=8 * MiB, backupCount=5, encoding="utf-8")
+                handler.setFormatter(logging.Formatter("%(message)s"))
+                self._log = logging.getLogger(f"phosphor.watchdog.{id(self)}")
+                self._log.propagate = False
+                self._log.setLevel(logging.INFO)
+                self._log.addHandler(handler)
+            except OSError as e:
+                print(f"Watchdog log unavailable: {e}", flush=True)
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(self.recovery_timeout)
+        if self._log is not None:
+            for handler in self._log.handlers:
+                handler.close()
+
+    def _write(self, record: dict):
+        if self._log is not None:
+            self._log.info(json.dumps({"time": time.time(), **record}, default=str))
+
+    def _event(self, event: str, message: str, **fields):
+        print(f"Watchdog: {message}", flush=True)
+        self._write({"event": event, **fields})
+
+
+    # -------------------------------
+    # Sampling
+    # -------------------------------
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                reason = self.check()
+                if reason:
+                    self.recover(reason)
+            except Exception as e:
+                print(f"Watchdog check failed: {e}", flush=True)
+
+    def check(self):
+        """One sample: log it and return the reason to recover, or None."""
+        now = time.monotonic()
+        sample = {"event": "sample", **process_resources()}
+        player = self._get_player()
+        if player is not self._player:
+            # New or no player: heartbeat and trends start over
+            self._player = player
+            self._position = None
+            self._progress_at = now
+            self._history.clear()
+
+        reason = None
+        running = player is not None and player.running
+        if not running:
+            self._ping_since = None
+        else:
+            latest = player.telemetry.latest()
+            position = latest.get("playback-time")
+            playing = position is not None and not latest.get("pause") and not latest.get("eof-reached")
+            if position != self._position or not playing:
+                self._position = position
+                self._progress_at = now
+            waiting = latest.get("seeking") or latest.get("paused-for-cache")
+            stalled_for = now - self._progress_at
+            if self._ping_since is None:
+                self._ping_since = now
+            heartbeat_age = now - max(player.worker_heartbeat, self._ping_since)
+            player.ping()
+            sample.update(
+                playback_time=position,
+                paused=latest.get("pause"),
+                stalled_for=round(stalled_for, 1),
+                heartbeat_age=round(heartbeat_age, 1),
+            )
+            if stalled_for > (self.buffering_seconds if waiting else self.stall_seconds):
+                reason = f"stall: playback-time stuck at {position} for {stalled_for:.0f} s"
+            elif heartbeat_age > self.worker_seconds:
+                reason = f"unresponsive: no worker heartbeat for {heartbeat_age:.0f} s"
+
+        self._history.append((now, sample))
+        while self._history and now - self._history[0][0] > self.window_seconds:
+            self._history.popleft()
+        if reason is None and running:
+            reason = self._leak(sample)
+
+        self.stats["samples"] += 1
+        self._write(sample)
+        return reason
+
+    def _leak(self, sample: dict):
+        """Sustained growth over the full window, in both of its halves."""
+        if not self._history or self._history[-1][0] - self._history[0][0] < self.window_seconds * 0.95:
+            return None
+        middle = self._history[0][0] + (self._history[-1][0] - self._history[0][0]) / 2
+        for metric, rate in self.leak_rates.items():
+            points = [(t, s[metric]) for t, s in self._history if s.get(metric) is not None]
+            first = hourly_slope([p for p in points if p[0] <= middle])
+            second = hourly_slope([p for p in points if p[0] >= middle])
+            if first > rate and second > rate:
+                sample[f"{metric}_per_hour"] = round(min(first, second))
+                return f"leak: {metric} growing {min(first, second):.0f}/h (now {sample[metric]})"
+        return None
+
+
+    # -------------------------------
+    # Recovery
+    # -------------------------------
+
+    def recover(self, reason: str) -> bool:
+        """Tear down and rebuild the player at the same file, position and effects; True if it plays again."""
+        now = time.monotonic()
+        if self._last_recovery is not None and now - self._last_recovery < self.cooldown:
+            self._event("recovery_skipped", f"{reason} (cooldown)", reason=reason)
+            return False
+        self._last_recovery = now
+        self.stats["last_reason"] = reason
+        deadline = now + self.recovery_timeout
+
+        player = self._get_player()
+        snapshot = player.snapshot()
+        self._event("recovery_started", f"recovering player ({reason})", reason=reason, snapshot=snapshot)
+
+        confirmed = player.terminate(timeout=min(self.terminate_timeout, self.recovery_timeout / 2))
+        self._event("teardown", "old player " + ("terminated" if confirmed else "abandoned (shutdown not confirmed)"),
+                    confirmed=confirmed, seconds=round(time.monotonic() - now, 3))
+
+        ok = False
+        try:
+            result = self._rebuild(snapshot)
+            if isinstance(result, Future):
+                result.result(timeout=max(0.1, deadline - time.monotonic()))
+            ok = self._wait_playing(snapshot, deadline)
+        except Exception as e:
+            self._event("rebuild_failed", f"rebuild failed: {e}", error=str(e))
+
+        seconds = round(time.monotonic() - now, 3)
+        if ok:
+            self.stats["recoveries"] += 1
+            self._event("recovered", f"player recovered in {seconds} s", seconds=seconds)
+        else:
+            self.stats["failed"] += 1
+            self._event("recovery_failed", f"player not playing after {seconds} s", seconds=seconds)
+        return ok
+
+    def _wait_playing(self, snapshot: dict, deadline: float) -> bool:
+        """New player reports a position (file loaded and rendering) before the deadline."""
+        if not snapshot["paths"]:
+            return True
+        while time.monotonic() < deadline:
+            player = self._get_player()
+            if player is not None and player.telemetry.latest().get("playback-time") is not None:
+                return True
+            if self._stop.wait(0.1):
+                return False
+        return False
@@ -0,0 +1,59 @@
+//!PARAM CRT_CURVATURE_AMOUNT
+//!DESC Screen curvature strength
+//!TYPE float
+//!MINIMUM 0.000000
+//!MAXIMUM 0.100000
+0.050000
+
+//!PARAM CRT_CHROMA_OFFSET
+//!DESC Horizontal chromatic aberration
+//!TYPE float
+//!MINIMUM 0.000000
+//!MAXIMUM 0.004000
+0.002000
+
+//!PARAM CRT_VIGNETTE_STRENGTH
+//!DESC Vignette intensity
+//!TYPE float
+//!MINIMUM 0.125000
+//!MAXIMUM 0.875000
+0.500000
+
+//!PARAM CRT_VIGNETTE_POWER
+//!DESC Vignette falloff curve
+//!TYPE float
+//!MINIMUM 0.500000
+//!MAXIMUM 1.500000
+1.000000
+//!TEXTURE PHOSPHOR_CRT_LUT
+//!SIZE 64 64
+//!FORMAT rgba16f
+//!FILTER LINEAR
+//!BORDER CLAMP
+0000000000000000000000000000e3a1000000000000e9a500000000000073a8000000000000f5a90000000000007aab00000000000081ac00000000000047ad0000000000000fae000000000000d8ae000000000000a3af00000000000038b00000000000009fb000000000000007b100000000000070b1000000000000dab100000000000045b2000000000000b1b20000000000001eb30000000000008cb3000000000000fbb300000000000035b40000000000006eb4000000000000a7b4000000000000e1b40000000000001bb500000000000056b500000000000091b5000000000000cdb50000000000000ab600000000000047b600000000000085b6000000000000c3b600000000000003b700000000000042b700000000000083b7000000000000c4b700000000000003b800000000000025b800000000000046b800000000000068b80000000000008bb8000000000000aeb8000000000000d1b8000000000000f5b800000000000019b90000000000003eb900000000000063b900000000000089b9000000000000afb9000000000000d6b9000000000000fdb900000000000025ba0000000000004dba00000000000075ba0000000000009fba000000000000c9ba000000000000f3ba0000000000001ebb0000000000004abb00000000000077bb000000000000a4bb000000000000d1bb00000000000000bc000000000000e3a14300430000002ba486000c0100009da6c9005c020000b2a80c013204010025aa4f018d060100a1ab9301b808010092acd6016c0a020055ad1902320c02001bae5c024f0d0300e3ae9f028d0e0300adafe202ee0f04003cb02503b8100500a3b06803891106000bb1ab036c12070074b1ee035f130800deb132043214090048b27504bc140a00b4b2b8044f150b0021b3fb04ea150c008fb33e058d160e00feb3810539170f0037b4c405ee1710006fb4070655181200a8b44a06b8181300e2b48d061e1915001cb5d1068919170057b51407f919190092b557076c1a1b00ceb59a07e31a1c000bb6dd075f1b1e0048b61008df1b200086b63208321c2300c4b65308761c250004b77508bc1c270043b79608041d290084b7b8084f1d2c00c5b7d9089b1d2e0004b8fb08ea1d310025b81c093b1e330047b83e098d1e360069b85f09e21e39008bb88109391f3c00aeb8a309921f3f00d2b8c409ee1f4100f6b8e609252044001ab9070a552048003fb9290a86204b0064b94a0ab8204e0089b96c0aeb205100afb98d0a1e215500d6b9af0a53215800fdb9d10a89215b0025baf20ac0215f004dba140bf921630076ba350b322266009fba570b6c226a00c9ba780ba7226e00f4ba9a0be32272001fbbbb0b212376004abbdd0b5f237a0077bbfe0b9f237e00a4bb100cdf238200d2bb210c1024860000bc000000000000e9a50c01860000009da619021902010031a82503b80402005da9320432080400acaa3e058d0a070008ac4a06b80c0a00c1ac57076c0e0d007fad32083210110040aeb8084f11160004af3e098d121b00cbafc409ee1321004ab04a0ab8142700b0b0d10a89152e0017b1570b6c1635007fb1dd0b5f173d00e8b1320c3218450052b2750cbc184e00beb2b80c4f1958002ab3fb0cea19620097b33e0d8d1a6c0003b4810d391b77003bb4c40dee1b830073b4070e551c8f00acb44a0eb81c9c00e6b48d0e1e1da90020b5d10e891db7005ab5140ff91dc50096b5570f6c1ed400d1b59a0fe31ee3000eb6dd0f5f1ff3004bb61010df1f040189b6321032201501c7b653107620270106b77510bc20390146b7961004214b0187b7b8104f215f01c8b7d9109b21720105b8fb10ea21870126b81c113b229b0148b83e118d22b1016ab85f11e222c7018db881113923dd01b0b8a3119223f401d3b8c411ee230c02f7b8e611252424021bb9071255243c0240b929128624550265b94a12b8246f028bb96c12eb248902b1b98d121e25a402d7b9af125325c002feb9d1128925db0226baf212c025f8024eba1413f925150377ba351332263203a0ba57136c265003caba7813a7266f03f5ba9a13e3268e0320bbbb132127ae034cbbdd135f27ce0378bbfe139f27ee03a5bb1014df271004d3bb21141028320401bc00000000000073a85c02c9000100b2a8b804250304005da914071407080053aab8084a0a0f007aabe609ea0c170060ac140b140f21000dad210cd1102d00c2adb80c4a123a007cae4f0df6134a003aafe60dea145b00fcaf7d0ef2156e0061b0140f14178300c5b0ab0f27189a002bb12110d118b30092b16c108719cd00fab1b8104a1aea0063b203111a1b0801cdb24f11f61b280139b39a116f1c4a01a6b3e611ea1c6d010ab431126b1d930141b47d12f21dba017ab4c812801ee301b2b41413141f0e02ecb45f13ae1f3b0225b5ab132720690260b5f6137a2099029bb52114d120cc02d7b547142b21000313b66c148721360350b69214e7216d038eb6b8144a22a703ccb6dd14b122e2030bb703151a231f044bb7291586235e048bb74f15f6239f04cdb774153424e20407b89a156f24260529b8c015ac246c054ab8e615ea24b5056cb80b162a25ff058fb831166b254a06b2b85716ae259806d5b87d16f225e706f9b8a216382639071db9c81680268c0742b9ee16c926e10767b9141714271c088db9391760274808b3b95f17ae277508d9b98517fd27a30800baab172728d20828bad0175028020950baf6177a28330979ba0e18a5286509a2ba2118d1289709ccba3418fd28cb09f7ba47182b29ff0922bb59185929350a4dbb6c1887296b0a7abb7f18b729a20aa7bb9218e729db0ad5bba518182a140b02bc000000000000f5a932040c01020025aa320832040900acaa4a0ab80813007aab320c320c23003eac3e0d8d0e3600d1ac4a0eb8104e0071ad570f6c126a001bae321032148a00ccaeb8104f15af0084af3e118d16d80020b0c411ee17060180b04a12b8183801e2b0d11289196e0146b157136c1aa801abb1dd135f1be70112b23214321c2a027ab27514bc1c7102e3b2b8144f1dbd024eb3fb14ea1d0d03bab33e158d1e620313b48115391fba034bb4c415ee1f170482b4071655207904bbb44a16b820de04f4b48d161e2148052eb5d1168921b70568b51417f9212906a3b557176c22a006deb59a17e3221c071ab6dd175f239b0757b61018df23100895b6321832245408d3b6531876249a0812b77518bc24e30852b7961804252d0992b7b8184f257a09d3b7d9189b25c9090ab8fb18ea251a0a2cb81c193b266e0a4db83e198d26c30a6fb85f19e2261b0b92b881193927750bb5b8a3199227d00bd8b8c419ee27170cfcb8e6192528470c20b9071a5528790c45b9291a8628ab0c6ab94a1ab828de0c8fb96c1aeb28130db5b98d1a1e29480ddcb9af1a53297f0d03bad11a8929b70d2bbaf21ac029f00d53ba141bf929290e7cba351b322a640ea5ba571b6c2aa00ecfba781ba72ade0ef9ba9a1be32a1c0f24bbbb1b212b5b0f50bbdd1b5f2b9b0f7dbbfe1b9f2bdd0faabb101cdf2b1010d7bb211c102c321003bc0000000000007aab8d064f010400a1ab8d0a3e05110008acea0ce609260060ac8d0e3e0d4400d1ac181018106a0055adea10e6119800e9adbc110314cf0087ae8d123e150e0130af5f13a2165601dfaf18141818a7014ab08114f518ff01a7b0ea14e619610207b15315ec1aca0268b1bc15031c3c03ccb125169b1cb70331b28d163e1d3a0497b2f616eb1dc504ffb25f17a21e590569b3c817641ff605d3b3181818209b0620b44d188420480757b48118f520fe078eb4b6186a215e08c6b4ea18e621c108ffb41e196622290938b55319ec22940972b587197723040aadb5bc190324790ae8b5f0194e24f10a24b6251a9b246e0b60b6591aeb24ef0b9eb68d1a3e253a0cdcb6c21a93257f0c1bb7f61aeb25c50c5ab72b1b45260e0d9ab75f1ba226590ddbb7941b0227a60d0eb8c81b6427f60d30b8fc1bc927470e51b8181c18289b0e73b8331c4d28f00e96b84d1c8428480fb8b8671cbc28a20fdcb8811cf528fe0fffb89b1c2f292e1024b9b61c6a295e1048b9d01ca7298f106db9ea1ce629c11093b9041d252af410b9b91e1d662a2911dfb9391da82a5e1106ba531dec2a94112eba6d1d312bcc1156ba871d772b04127fbaa21dbe2b3e12a8babc1d032c7912d2bad61d282cb412fdbaf01d4e2cf11228bb0a1e742c2f1353bb251e9b2c6e1380bb3f1ec32cae13adbb591eeb2cef13dbbb731e142d181405bc00000000000081acb8089301070092acb80c4a061d00c1ac140f140b42000dadb8104a0e750071ade611ea10b700e9ad14131413070170ae2114d114660104afb8144a16d301a3af4f15f617500225b0e615ea18da027cb07d16f2197403d6b01417141b1c0433b1ab17271cd20492b12118d11c9705f3b16c18871d6b0656b2b8184a1e4e07bab203191a1f1f0821b34f19f61f9f0889b39a196f202609f2b3e619ea20b5092fb4311a6b214a0a65b47d1af221e70a9cb4c81a80228c0bd3b4141b14231c0c0cb55f1bae23750c45b5ab1b2724d20c7eb5f61b7a24330db9b5211cd124970df4b5471c2b25ff0d2fb66c1c87256b0e6cb6921ce725db0ea9b6b81c4a264e0fe7b6dd1cb126c40f25b7031d1a271f1064b7291d86275e10a4b74f1df6279f10e5b7741d3428e21013b89a1d6f28261134b8c01dac286c1156b8e61dea28b51178b80b1e2a29ff119ab8311e6b294a12bdb8571eae299812e0b87d1ef229e71204b9a21e382a391328b9c81e802a8c134db9ee1ec92ae11372b9141f142b1c1497b9391f602b4814bdb95f1fae2b7514e4b9851ffd2ba3140bbaab1f272cd21432bad01f502c02155abaf61f7a2c331583ba0e20a52c6515acba2120d12c9715d6ba3420fd2ccb1501bb47202b2dff152cbb5920592d351658bb6c20872d6b1684bb7f20b72da216b1bb9220e72ddb16dfbba520182e141707bc00000000000047ad6c0ad6010c0055ad6c0e57072e007fadd110210c6800c2ad6c12570fba001bae0314bc11220187aed1142114a10104af9e159e1538028eaf6c165717e60212b03917a518ab0361b00318bc198804b4b06a18f01a7b050bb1d118211c860665b13819d81ca807c1b19e199e1d700820b2051a731e190981b26c1a571fcc09e3b2d31a24208c0a48b3391ba520570baeb3a01b2d21170c0bb4031cbc21880c40b4371c5222ff0c76b46a1cf0227b0dacb49e1c9523fe0de3b4d11c2124860e1bb5041d7b24140f53b5381dd824a80f8db56b1d39252110c7b59e1d9e25701001b6d21d0726c3103db6051e7326191179b6381ee3267111b6b66c1e5727cc11f3b69f1ece272b1231b7d31e24288c1270b7061f6428f012b0b7391fa5285713f1b76d1fe828c11319b8a01f2d2917143ab8d31f73294e145cb80320bc2988147db81d20062ac214a0b83720522aff14c2b85020a02a3c15e6b86a20f02a7b1509b98420422bbc152db99e20952bfe1552b9b720ea2b411677b9d120212c86169cb9eb204d2ccc16c2b904217b2c1417e9b91e21a92c5d1710ba3821d82ca81737ba5121082df4175fba6b21392d211888ba85216b2d4818b1ba9e219e2d7018dbbab821d22d991806bbd221072ec31831bbeb213d2eee185cbb0522732e191989bb1f22ab2e4519b6bb3822e32e7119e4bb52221c2f9e1909bc0000000000000fae320c190211001bae32103208450040ae4a12b80c9c007cae321432101501ccae3e158d12b10130af4a16b8146f02a3af57176c16500312b032183218540458b0b8184f197a05a3b03e198d1ac306f3b0c419ee1b170846b14a1ab81cde089db1d11a891db709f6b1571b6c1ea00a52b2dd1b5f1f9b0bb1b2321c3220540c12b3751cbc20e30c74b3b81c4f217a0dd9b3fb1cea211a0e20b43e1d8d22c30e54b4811d3923750f89b4c41dee231710bfb4071e55247910f5b44a1eb824de102cb58d1e1e25481164b5d11e8925b7119db5141ff9252912d7b5571f6c26a01211b69a1fe3261c134cb6dd1f5f279b1388b61020df271014c4b632203228541402b7532076289a1440b77520bc28e3147eb7962004292d15beb7b8204f297a15feb7d9209b29c91520b8fb20ea291a1641b81c213b2a6e1662b83e218d2ac31684b85f21e22a1b17a6b88121392b7517c9b8a321922bd017ecb8c421ee2b17180fb9e621252c471833b90722552c791858b92922862cab187db94a22b82cde18a2b96c22eb2c1319c8b98d221e2d4819efb9af22532d7f1916bad122892db7193dbaf222c02df01965ba1423f92d291a8eba3523322e641ab7ba57236c2ea01ae1ba7823a72ede1a0bbb9a23e32e1c1b36bbbb23212f5b1b62bbdd235f2f9b1b8ebbfe239f2fdd1bbcbb1024df2f101ce9bb21241030321c0cbc000000000000d8ae4f0d5c021900e3ae4f11b808630004aff6134f0dde003aaf4f15b8108a0184afa2165f136802dfaff6174f15770325b0a5183917b80461b04f19b8182906a3b0f919f919cc07ebb0a21a5f1bd00837b14c1b761cd30986b1f61b4f1def0adab1501c3b1e110c31b2a51c391fb80c8ab2fa1c25206a0de6b24f1db820290e45b3a41d5321f50ea6b3f91df921cc0f04b44d1ea722581037b4a21e5f23d0106ab4f71e10244f119eb44c1f7624d311d3b4a11fe0245e1209b5f61f4f25ef1240b52520c225861378b550203b261114b0b57a20b8266314e9b5a5203927b81423b6cf20c02710155db6fa2025286a1599b624216d28c815d5b64f21b828291612b7792104298e1650b7a4215329f5168eb7ce21a5295f17cdb7f921f929cc1707b823224f2a1e1827b84d22a72a581848b87822022b941869b8a2225f2bd0188bb8cd22bf2b0f19adb8f722102c4f19d0b82223422c9019f3b84c23762cd31916b97723aa2c181a3ab9a123e02c5e1a5fb9cc23172da51a83b9f6234f2def1aa9b91024882d391bcfb92524c22d861bf5b93b24fe2dd31b1cba50243b2e111c44ba6524792e3a1c6cba7a24b82e631c94ba9024f82e8d1cbdbaa524392fb81ce7baba247c2fe31c12bbcf24c02f101d3dbbe52402303d1d68bbfa2425306a1d95bb0f254930991dc2bb24256d30c81df0bb39259230f91d0fbc000000000000a3af8d0e9f022200adaf8d123e098700cbafea14e60d3001fcaf8d163e111d0220b0181818144d034ab0ea18e615c1047cb0bc1903187906b4b08d1a3e193a08f3b05f1ba21a590937b1181c181c9b0a7fb1811cf51cfe0bccb1ea1ce61dc10c1cb2531dec1e940d70b2bc1d0320790ec7b2251e9b206e0f21b38d1e3e213a107db3f61eeb21c510dcb35f1fa22259111eb4c81f6423f61150b4182018249b1282b44d2084244813b6b48120f524fe13eab4b6206a255e1420b5ea20e625c11456b51e21662629158db55321ec269415c4b5872177270416fdb5bc210328791636b6f0214e28f11671b625229b286e17acb65922eb28ef17e7b68d223e293a1824b7c22293297f1861b7f622eb29c518a0b72b23452a0e19dfb75f23a22a59190fb89423022ba61930b8c823642bf61950b8fc23c92b471a71b81824182c9b1a93b833244d2cf01ab5b84d24842c481bd8b86724bc2ca21bfbb88124f52cfe1b1eb99b242f2d2e1c42b9b6246a2d5e1c66b9d024a72d8f1c8bb9ea24e62dc11cb0b90425252ef41cd6b91e25662e291dfcb93925a82e5e1d23ba5325ec2e941d4bba6d25312fcc1d73ba8725772f041e9bbaa225be2f3e1ec5babc250330791eeebad6252830b41e19bbf0254e30f11e44bb0a2674302f1f6fbb25269b306e1f9cbb3f26c330ae1fc9bb5926eb30ef1ff7bb73261431182013bc00000000000038b0ee0fe2022d003cb0ee13c409b4004ab0f2157d0e950161b0ee17c411d00280b0f51881146504a7b0f2197d165406d6b0f01a6a184f080bb1ee1bc419a00946b1761c4c1b1f0b86b1f51c811c650cccb1731d731d510d15b2f21d7d1e540e63b2711e9d1f6d0fb4b2f01e6a204f1008b36f1f1121f21060b3ee1fc421a011bab3362082225a120bb476204c231f133bb4b5201124ef136bb4f520812465149db43421f724d814d0b473217325511503b5b321f525d01538b5f2217d2654166db532220a27de16a4b571229d276d17dbb5b1221b28011813b6f0226a284f184cb62f23bc289f1886b66f231129f218c0b6ae2369294719fcb6ee23c429a01938b71724222afb1975b73624822a5a1ab3b75624e62abb1af2b776244c2b1f1b19b89524b52b851b39b8b524112cef1b59b8d524482c2d1c7ab8f524812c651c9cb81425bc2c9e1cbeb83425f72cd81ce0b85425352d141d03b97325732d511d26b99325b42d901d4ab9b325f52dd01d6eb9d325382e111e93b9f2257d2e541eb8b91226c32e981edeb932260a2fde1e05ba5126532f251f2bba71269d2f6d1f53ba9126e92fb71f7bbab1261b300120a3bad02642302820ccbaf0266a304f20f6ba10279330762021bb2f27bc309f204cbb4f27e630c82077bb6f271131f220a4bb8f273d311c21d1bbae2769314721ffbbce279631732117bc0000000000009fb0b81025033a00a3b0b8144a0aea00b0b01417140f0e02c5b0b8184a12a703e2b0e619ea14b50507b1141b14171c0833b1211cd118970965b1b81c4a1a4e0b9db14f1df61b9f0cdab1e61dea1cb50d1cb27d1ef21de70e63b2141f141f1c10aeb2ab1f2720d210fcb22120d12097114eb36c2087216b12a3b3b8204a224e13fbb303211a231f142bb44f21f6239f1459b49a216f24261589b4e621ea24b515bab431226b254a16ecb47d22f225e7161eb5c82280268c1752b5142314271c1887b55f23ae277518bdb5ab232728d218f4b5f6237a2833192bb62124d128971964b647242b29ff199db66c2487296b1ad7b69224e729db1a12b7b8244a2a4e1b4eb7dd24b12ac41b8ab703251a2b1f1cc8b72925862b5e1c03b84f25f62b9f1c23b87425342ce21c43b89a256f2c261d63b8c025ac2c6c1d84b8e625ea2cb51da6b80b262a2dff1dc7b831266b2d4a1eeab85726ae2d981e0cb97d26f22de71e30b9a226382e391f53b9c826802e8c1f78b9ee26c92ee11f9cb91427142f1c20c1b93927602f4820e7b95f27ae2f75200dba8527fd2fa32034baab272730d2205cbad0275030022184baf6277a303321acba0e28a5306521d5ba2128d1309721ffba3428fd30cb2129bb47282b31ff2154bb59285931352280bb6c2887316b22acbb7f28b731a222d9bb9228e731db2204bca528183214231bbc00000000000007b1891168034a000bb18915d10a290117b12718ab0f9d022bb18919d112a40446b1ec1a5315410768b1271cab17390992b1d81c38191c0bc1b1891dd11aa40cf6b13b1e501ce00d31b2ec1e531d410f70b29d1f711e6310b4b22720ab1f3911fcb280208020211248b3d82038211c1397b33121fd211514eab38921d122a41420b4e221b1233e154cb43b225024e0157ab49322ce248c16a8b4ec2253254117d8b44423df25ff1709b59d23712663183bb5f6230a27cc186fb52724ab273919a3b553242928ab19d8b580248028211a0eb6ac24da289c1a45b6d82438291c1b7db605259929a01bb6b63125fd29151cefb65d25652a5b1c2ab78925d12aa41c65b7b6253f2bf01ca2b7e225b12b3e1ddfb70e26132c8e1d0eb83b26502ce01d2eb867268e2c351e4eb89326ce2c8c1e6eb8bf26102de51e8fb8ec26532d411fb0b81827982d9f1fd2b84427df2dff1ff4b87127272e312017b99d27712e63203ab9c927bd2e97205db9f6270a2fcc2081b911285a2f0221a6b92728ab2f3921cbb93d28fd2f7121f1b953282930ab2117ba69285430e5213eba80288030212265ba9628ac305e228dbaac28da309c22b5bac2280831db22dfbad82838311c2308bbee2868315d2333bb05299931a0235ebb1b29cb31e42389bb3129fd311524b6bb472931323824e3bb5d2965325b2408bc73299a3280241fbc00000000000070b16c12ab035d0074b16c16570b73017fb1d1182110430392b16c1a5713cc05abb1031cbc158808ccb1d11c2118860af3b19e1d9e19700c20b26c1e571bcc0d52b2391fa51c570f8ab20320bc1d8810c7b26a20f01e7b1108b3d120212086124eb33821d820a81397b39e219e217014e4b30522732219151ab46c225723cc1544b4d32224248c166fb43923a52457179cb4a0232d251718cab40324bc258818f9b437245226ff1829b56a24f0267b195ab59e249527fe198db5d1242128861ac0b504257b28141bf5b53825d828a81b2ab66b253929211c60b69e259e29701c98b6d225072ac31cd0b60526732a191d09b73826e32a711d43b76c26572bcc1d7eb79f26ce2b2b1ebab7d326242c8c1ef7b70627642cf01e1ab83927a52c571f3ab86d27e82cc11f59b8a0272d2d17207ab8d327732d4e209ab80328bc2d8820bbb81d28062ec220ddb83728522eff20ffb85028a02e3c2122b96a28f02e7b2145b98428422fbc2168b99e28952ffe218cb9b728ea2f4122b1b9d12821308622d6b9eb284d30cc22fbb904297b30142321ba1e29a9305d2348ba3829d830a8236fba51290831f42397ba6b2939312124c0ba85296b314824e9ba9e299e31702412bbb829d23199243dbbd2290732c32468bbeb293d32ee2493bb052a73321925c0bb1f2aab324525edbb382ae33271250dbc522a1c339e2524bc000000000000dab15f13ee037200deb15f17dd0bc801e8b187196c100304fab15f1bdd13220712b29b1c2516920931b2871d6c18030c56b2731e051a760d81b25f1fdd1b220fb1b22520fa1c8310e6b29b20251e921121b311216f1fbe1260b387216c200314a3b3fd213121b514eab37322052276151ab4e922e922451641b45f23dd2322176ab4d5237024071894b42524fa248318c0b460248b250719edb49b24252692191bb5d624c626251a4ab511256f27be1a7bb54c2510285e1badb587256c28031cdfb5c225cd285a1c13b6fd253129b51c48b638269929141d7eb67326052a761db5b6ae26752adb1decb6e926e92a451e25b72427612bb11e5fb75f27dd2b221f99b79a272e2c961fd5b7d527702c072009b80828b42c442027b82528fa2c832046b84328422dc42066b860288b2d072186b87e28d72d4c21a6b89b28252e9221c7b8b928742edb21e9b8d628c62e25220bb9f428192f70222db911296f2fbe2250b92f29c62f0d2374b94c2910305e2398b96a293e30b123bcb987296c300324e1b9a5299c302e2406bac229cd305a242dbae029fe30872453bafd293131b5247aba1b2a6431e424a2ba382a99311425cbba562acf314425f4ba732a053276251dbb912a3d32a82548bbae2a7532db2572bbcc2aaf3210269ebbe92ae9324526cabb072b25337b26f7bb242b6133b12613bc422b9e33e9262abc00000000000045b2321432048a0048b23218320c2a0252b24a1ab810de0463b2321c321454087ab23e1d8d16c30a97b24a1eb818de0cbab2571f6c1aa00ee3b23220321c541012b3b8204f1d7a1145b33e218d1ec3127db3c421ee1f1714bab34a22b820de14fbb3d1228921b71520b457236c22a01644b4dd235f239b176ab432243224541892b47524bc24e318bbb4b8244f257a19e6b4fb24ea251a1a12b53e258d26c31a3fb581253927751b6db5c425ee27171c9db507265528791cceb54a26b828de1c00b68d261e29481d33b6d1268929b71d68b61427f929291e9db657276c2aa01ed3b69a27e32a1c1f0ab7dd275f2b9b1f42b71028df2b10207cb73228322c5420b6b75328762c9a20f1b77528bc2ce32016b89628042d2d2135b8b8284f2d7a2154b8d9289b2dc92173b8fb28ea2d1a2293b81c293b2e6e22b3b83e298d2ec322d4b85f29e22e1b23f6b88129392f752317b9a329922fd0233ab9c429ee2f17245db9e6292530472480b9072a55307924a4b9292a8630ab24c8b94a2ab830de24edb96c2aeb30132512ba8d2a1e31482538baaf2a53317f255fbad12a8931b72586baf22ac031f025aeba142bf9312926d6ba352b32326426ffba572b6c32a02629bb782ba732de2653bb9a2be3321c277ebbbb2b21335b27aabbdd2b5f339b27d6bbfe2b9f33dd2701bc102cdf33102818bc212c1034322830bc000000000000b1b2bc147504a600b4b2bc18750c9802beb21a1b0311d705cdb2bc1c75143109e3b2eb1df6160e0cffb21a1f0319d70d21b32420d31af30f48b3bc20751c311174b35321a41d9212a6b3eb21f61e0e14dcb382223620e8140bb41a230321d7152bb4b123e221db164cb42424d322f3176fb47024d523901894b4bc2475243119bbb408250825dc19e3b45325a425921a0db59f254826521b38b5eb25f6260e1c64b53726ad27791c92b582263628e81cc1b5ce269b285d1df1b51a270329d71d23b666277029561e55b6b127e229db1e89b6fd27582a641fbdb62428d32af31ff3b64a28522b43202ab77028d52b902061b796282e2cdf209ab7bc28752c3121d4b7e228bd2c852107b80829082ddc2125b82e29552d362243b85329a42d922262b87929f52df12281b89f29482e5223a1b8c5299e2eb623c1b8eb29f62e0e24e2b8112a502f432403b9372aad2f792425b95d2a0630b02447b9822a3630e8246ab9a82a683022258db9ce2a9b305d25b1b9f42ace309925d5b91a2b0331d725fab9402b393116261fba662b7031562645ba8c2ba93198266cbab12be231db2693bad72b1c321f27babafd2b58326427e3ba112c9532ab270cbb242cd332f32735bb372c12331e285fbb4a2c523343288abb5d2c93336928b6bb702cd5339028e2bb832c0c34b72808bc962c2e34df281fbca92c5134082936bc0000000000001eb34f15b804c50021b34f19b80c15032ab3f61b4f11ef0639b34f1db814290a4eb3a21e5f17d00c69b3f61f4f19ef0e89b3a520391bb810aeb34f21b81c2912d9b3f921f91dcc1304b4a2225f1fd0141eb44c237620d3153bb4f6234f21ef1659b450243b2211187ab4a5243923b8189cb4fa2425246a19c0b44f25b824291ae6b4a4255325f51a0db5f925f925cc1b36b54d26a726581c60b5a2265f27d01c8cb5f72610284f1db9b54c277628d31de7b5a127e0285e1e16b6f6274f29ef1e47b62528c229861f79b650283b2a1120acb67a28b82a6320e0b6a528392bb82015b7cf28c02b10214bb7fa28252c6a2182b724296d2cc821bab74f29b82c2922f3b77929042d8e2217b8a429532df52234b8ce29a52d5f2352b8f929f92dcc2371b8232a4f2e1e2490b84d2aa72e5824b0b8782a022f9424d0b8a22a5f2fd024f0b8cd2abf2f0f2511b9f72a10304f2533b9222b4230902555b94c2b7630d32578b9772baa3018269bb9a12be0305e26beb9cc2b1731a526e3b9f62b4f31ef2607ba102c883139272dba252cc231862752ba3b2cfe31d32779ba502c3b321128a0ba652c79323a28c8ba7a2cb8326328f0ba902cf8328d2819bba52c3933b82842bbba2c7c33e3286cbbcf2cc033102997bbe52c02343d29c3bbfa2c25346a29efbb0f2d493499290ebc242d6d34c82925bc392d9234f9293cbc0000000000008cb3ea15fb04e8008fb3ea19fb0ca00397b36f1c9a111408a6b3ea1dfb143f0bbab3641fc817a90dd3b36f209a191410f2b32d21a01b8c110bb4ea21fb1c3f1320b4a7224d1e961437b46423c81fa91550b41124b520da166bb46f249a21141889b4ce249322c918a8b42d25a0238c19cab48b2560245f1aedb4ea25fb243f1b12b548269f25171c38b5a7264d26961c60b5062706271c1d89b56427c827a91db4b5c3274a283e1ee0b51128b528da1e0eb6402825297d1f3db66f289a2914206db69f28142a6c209eb6ce28932ac920d0b6fd28172b292104b72d29a02b8c2138b75c29172cf4216eb78b29602c5f22a4b7bb29ac2ccd22dcb7ea29fb2c3f230ab8192a4c2db52327b8482a9f2d172445b8782af52d562462b8a72a4d2e962481b8d62aa82ed824a0b8062b062f1c25bfb8352b662f6225dfb8642bc82fa925ffb8942b1630f32520b9c32b4a303e2642b9f22b7f308b2664b9112cb530da2686b9282ced302a27a9b9402c25317d27cdb9582c5f31d127f1b96f2c9a31142816ba872cd73140283bba9f2c14326c2861bab62c53329a2887bace2c9332c928aebae62cd532f828d6bafd2c17332929feba152d5b335a2927bb2d2da0338c2950bb442de633c0297abb5c2d1734f429a5bb742d3b34292ad1bb8b2d60345f2afdbba32d8634952a15bcbb2dac34cd2a2cbcd22dd334062b43bc000000000000fbb38d163e050e01feb38d1a3e0d3a0403b4ea1ce611c1080ab48d1e3e153a0c13b4182018189b0e20b4ea20e619c1102fb4bc21031c791240b48d223e1d3a1454b45f23a21e59156ab4182418209b1682b48124f520fe179db4ea24e621c118bab45325ec229419d8b4bc250324791af9b425269b246e1b1bb58d263e253a1c3fb5f626eb25c51c64b55f27a226591d8cb5c8276427f61db4b5182818289b1edeb54d288428481f0ab68128f528fe1f36b6b6286a295e2065b6ea28e629c12094b61e29662a2921c4b65329ec2a9421f6b68729772b042229b7bc29032c79225db7f0294e2cf12292b7252a9b2c6e23c8b7592aeb2cef23ffb78d2a3e2d3a241cb8c22a932d7f2438b8f62aeb2dc52456b82b2b452e0e2573b85f2ba22e592591b8942b022fa625b0b8c82b642ff625cfb8fc2bc92f4726efb8182c18309b260fb9332c4d30f02630b94d2c8430482751b9672cbc30a22773b9812cf530fe2796b99b2c2f312e28b8b9b62c6a315e28dcb9d02ca7318f2800baea2ce631c12825ba042d2532f4284aba1e2d663229296fba392da8325e2996ba532dec329429bdba6d2d3133cc29e4ba872d7733042a0cbba22dbe333e2a35bbbc2d0334792a5fbbd62d2834b42a89bbf02d4e34f12ab4bb0a2e74342f2bdfbb252e9b346e2b06bc3f2ec334ae2b1cbc592eeb34ef2b33bc732e1435182c4bbc00000000000035b439178105390137b4391b810de4043bb46b1d3112810941b4391f8115e40c4bb484204d18a50f57b46b21311a811165b45222371c7e1376b43923811de41489b41024f71e31169eb484244d20a517b6b4f7243421a018d0b46b2531228119ecb4df254423761a09b5522637247e1b29b5c626d6244d1c4ab539278125e41c6db5ad273726861d92b51028f726311eb9b54a28c327e61ee0b584284d28a51f0ab6be28be28372034b6f7283429a02060b63129b0290e218eb66b29312a8121bcb6a529b82af921ecb6df29442b76221db7182ad62bf72250b7522a372c7e2383b78c2a852c0524b8b7c62ad62c4d24edb7002b2a2d972412b8392b812de4242eb8732bda2d34254ab8ad2b372e862567b8e72b962eda2585b8102cf72e3126a3b82d2c5c2f8a26c1b84a2cc32fe626e0b8672c1630442700b9842c4d30a52720b9a12c8530042841b9be2cbe30372862b9db2cf8306b2883b9f72c3431a028a6b9142d7131d628c8b9312db0310e29ecb94e2df031472910ba6b2d3132812934ba882d7432bc2959baa52db832f9297fbac22dfd32372aa5badf2d4433762accbafb2d8d33b62af4ba182ed633f72a1cbb352e11343a2b45bb522e37347e2b6ebb6f2e5e34c32b98bb8c2e8534052cc3bba92ead34282cefbbc62ed6344d2c0dbce32e0035722c24bc002f2a35972c3bbc1c2f5535be2c52bc0000000000006eb4ee17c40568016fb4ee1bc40da00573b4f21d7d12540a7ab4ee1fc415a00d82b4f520811865108eb4f2217d1a54129cb4f0226a1c4f14acb4ee23c41da015bfb476244c1f1f17d3b4f52481206518eab473257321511903b5f2257d22541a1eb571269d236d1b3bb5f0266a244f1c5ab56f271125f21c7bb5ee27c425a01d9db5362882265a1ec1b576284c271f1fe7b5b5281128ef1f0eb6f5288128652036b63429f728d82060b67329732951218cb6b329f529d021b9b6f2297d2a5422e7b6322a0a2bde2216b7712a9d2b6d2346b7b12a1b2c012478b7f02a6a2c4f24abb72f2bbc2c9f24dfb76f2b112df2240ab8ae2b692d472525b8ee2bc42da02541b8172c222efb255db8362c822e5a267ab8562ce62ebb2697b8762c4c2f1f27b5b8952cb52f8527d3b8b52c1130ef27f2b8d52c48302d2811b9f52c8130652831b9142dbc309e2852b9342df730d82873b9542d3531142994b9732d73315129b7b9932db4319029d9b9b32df531d029fcb9d32d3832112a20baf22d7d32542a45ba122ec332982a6aba322e0a33de2a8fba512e5333252bb5ba712e9d336d2bdcba912ee933b72b04bbb12e1b34012c2cbbd02e4234282c55bbf02e6a344f2c7ebb102f9334762ca8bb2f2fbc349f2cd3bb4f2fe634c82cffbb6f2f1135f22c15bc8f2f3d351c2d2cbcae2f6935472d43bcce2f9635732d5abc000000000000a7b4551807069b01a8b4551c070e6d06acb4801ec8123b0bb2b4552007166d0ebbb46a21b6180611c6b48022c81a3b13d3b495239e1cec14e3b45524071e6d16f5b4e024a11f111809b56a25b620061920b5f525b321131a38b58026c8223b1b52b50a27f6233e1c6fb595279e24ec1c8db510284c25a61dadb5552807266d1eceb59b28ce26421ff1b5e028a127112016b62529402888203db66a29b628062165b6b029312989218eb6f529b3291322b9b63a2a3a2aa422e5b6802ac82a3b2312b7c52a5c2bd92341b70a2bf62b3e2470b7502b4b2c9324a2b7952b9e2cec24d4b7da2bf32c472504b8102c4c2da6251eb8332ca82d082639b8552c072e6d2654b8782c692ed62670b89b2cce2e42278db8bd2c362fb027aab8e02ca12f1128c7b8022d08304c28e6b8252d4030882804b9482d7a30c62824b96a2db630062943b98d2df330472964b9b02d3131892985b9d22d7131ce29a6b9f52db331132ac8b9182ef6315b2aebb93a2e3a32a42a0eba5d2e8132ef2a32ba802ec8323b2b56baa22e1133892b7bbac52e5c33d92ba0bae82ea833152cc6ba0a2ff6333e2cedba2d2f2234682c15bb502f4b34932c3dbb722f7434bf2c65bb952f9e34ec2c8fbbb82fc834192db9bbda2ff334472de4bbfd2f2035762d08bc10304c35a62d1ebc21307a35d72d34bc3330a835082e4bbc4430d7353a2e63bc000000000000e1b4b8184a06d301e2b4b81c4a0e4e07e6b4141f14131c0cecb4b8204a164e0ff4b4e621ea18b511ffb41423141b1c140cb52124d11c97151bb5b8244a1e4e172cb54f25f61f9f1840b5e625ea20b51956b57d26f221e71a6db5142714231c1c87b5ab272724d21ca3b52128d124971dc0b56c2887256b1edfb5b8284a264e1f00b603291a271f2023b64f29f6279f2047b69a296f2826216db6e629ea28b52194b6312a6b294a22bcb67d2af229e722e7b6c82a802a8c2312b7142b142b1c243fb75f2bae2b75246db7ab2b272cd2249cb7f62b7a2c3325cdb7212cd12c9725feb7472c2b2dff2519b86c2c872d6b2633b8922ce72ddb264db8b82c4a2e4e2768b8dd2cb12ec42784b8032d1a2f1f28a1b8292d862f5e28bdb84f2df62f9f28dbb8742d3430e228f9b89a2d6f30262917b9c02dac306c2937b9e62dea30b52956b90b2e2a31ff2976b9312e6b314a2a97b9572eae31982ab8b97d2ef231e72adab9a22e3832392bfdb9c82e80328c2b20baee2ec932e12b44ba142f14331c2c68ba392f6033482c8dba5f2fae33752cb2ba852ffd33a32cd8baab2f2734d22cffbad02f5034022d26bbf62f7a34332d4ebb0e30a534652d77bb2130d134972da0bb3430fd34cb2dcabb47302b35ff2df5bb59305935352e10bc6c3087356b2e27bc7f30b735a22e3dbc9230e735db2e54bca5301836142f6bbc0000000000001bb51e198d0610021cb51e1d8d0e210820b5ae1f5f13a50c25b51e218d1621102eb566221e19731238b5ae235f1ba51445b57b24041d521653b51e258d1e211864b5c2252520391978b566261e21731a8db50a273222ce1ba4b5ae275f23a51cbdb529285324731dd8b57b280425521ef5b5cd28c225411f13b61e298d26212033b670296627a92055b6c2292528392179b6142a9f28d2219eb6662a1e297322c4b6b82aa5291c23ecb60a2b322ace2316b75c2bc52a442441b7ae2b5f2ba5246db7002c002c0a259ab7292c532c7325c9b7522caa2ce025f9b77b2c042d522615b8a42c622dc7262eb8cd2cc22d412748b8f62c262ebf2762b81e2d8d2e21287db8472df82e642899b8702d662fa928b5b8992dd72ff028d2b8c22d25303929efb8eb2d613085290db9142e9f30d2292bb93d2ede30212a4ab9662e1e31732a6ab98f2e6131c62a8ab9b82ea5311c2baab9e12eea31742bccb90a2f3232ce2bedb9332f7b32152c10ba5c2fc532442c33ba852f1133742c56baae2f5f33a52c7abad72faf33d72c9fba003000340a2dc5ba143029343e2debba29305334732d11bb3d307e34a92d39bb5230aa34e02d61bb6630d734192e89bb7b300435522eb3bb8f3033358c2eddbba4306235c72e04bcb8309235042f19bccd30c235412f30bce130f435802f46bcf6302636bf2f5dbc0a315936003075bc00000000000056b58919d106520257b5891dd10ea4085ab52720ab13390d60b58921d116a41068b5ec225319411372b52724ab1b39157eb5d824381d1c178db58925d11ea4189db53b265020e019b0b5ec265321411bc4b59d277122631cdbb52728ab23391df4b580288024211e0eb6d82838251c1f2ab63129fd25152048b68929d126a42068b6e229b1273e2189b63b2a5028e021acb6932ace288c22d0b6ec2a53294123f6b6442bdf29ff231db79d2b712a632446b7f62b0a2bcc2470b7272cab2b39259cb7532c292cab25c9b7802c802c2126f7b7ac2cda2c9c2613b8d82c382d1c272cb8052d992da02745b8312dfd2d15285eb85d2d652e5b2878b8892dd12ea42893b8b62d3f2ff028aeb8e22db12f3e29cab80e2e13308e29e7b83b2e5030e02904b9672e8e30352a22b9932ece308c2a40b9bf2e1031e52a5fb9ec2e5331412b7eb9182f98319f2b9eb9442fdf31ff2bbeb9712f2732312cdfb99d2f7132632c01bac92fbd32972c23baf62f0a33cc2c46ba11305a33022d6aba2730ab33392d8eba3d30fd33712db2ba53302934ab2dd8ba69305434e52dfeba80308034212e24bb9630ac345e2e4cbbac30da349c2e74bbc2300835db2e9cbbd83038351c2fc6bbee3068355d2ff0bb05319935a02f0dbc1b31cb35e42f23bc3131fd35153039bc47313136383050bc5d3165365b3067bc73319a3680307ebc00000000000091b5f9191407990292b5f91d140f330996b57a20f613d90d9bb5f92114173311a3b5772387191014adb57a24f61bd915b9b539256b1df617c7b5f925141f3319d7b5b8267a20951ae9b577278721101cfdb51b28b122ea1c13b67a28f623d91d2bb6da28ac24dd1e45b639296b25f61f60b69929382692207eb6f929142733219db6582afd27df21bdb6b82a7a289522e0b6172bfd28552304b7772b8729102429b7d62b182a7a2450b71b2cb12aea2478b74b2c502b5f25a2b77a2cf62bd925cdb7aa2c522c5926f9b7da2cac2cdd2613b80a2d0a2d67272bb8392d6b2df62743b8692dd02d45285cb8992d382e922875b8c92da42ee1288fb8f92d142f3329a9b8282e872f8729c5b8582efd2fdf29e0b8882e3c30382afdb8b82e7a30952a19b9e72ebb30f32a37b9172ffd30552b55b9472f4131b92b74b9772f8731102c93b9a62fcf31442cb3b9d62f18327a2cd3b903306432b22cf4b91b30b132ea2c16ba3330ff32242d38ba4b3050335f2d5aba6330a2339c2d7eba7a30f633d92da2ba92302634182ec6baaa305234592eecbac2307e349a2e12bbda30ac34dd2e38bbf230da34222f5fbb0a310a35672f87bb22313a35ae2fb0bb39316b35f62fd9bb51319d35203002bc6931d035453017bc813104366b302dbc99313836923043bcb1316e36b9305abcc931a436e13071bce131db360a3188bc000000000000cdb56c1a5707e602ceb56c1e570fcc09d1b5d1202114860ed7b56c225717cc11deb50324bc198814e8b5d124211c8616f4b59e259e1d701801b66c26571fcc1911b63927a520571b23b60328bc21881c36b66a28f0227b1d4cb6d1282124861e64b63829d824a81f7db69e299e25702098b6052a73261921b5b66c2a5727cc21d3b6d32a24288c22f3b6392ba528572315b7a02b2d29172438b7032cbc2988245db7372c522aff2483b76a2cf02a7b25abb79e2c952bfe25d4b7d12c212c8626feb7042d7b2c142715b8382dd82ca8272cb86b2d392d212843b89e2d9e2d70285bb8d22d072ec32873b8052e732e19298cb8382ee32e7129a6b86c2e572fcc29c0b89f2ece2f2b2adbb8d32e24308c2af7b8062f6430f02a13b9392fa530572b30b96d2fe830c12b4db9a02f2d31172c6bb9d32f73314e2c89b90330bc31882ca8b91d300632c22cc8b937305232ff2ce8b95030a0323c2d09ba6a30f0327b2d2bba84304233bc2d4dba9e309533fe2d6fbab730ea33412e93bad1302134862eb7baeb304d34cc2edbba04317b34142f00bb1e31a9345d2f26bb3831d834a82f4dbb51310835f42f74bb6b31393521309cbb85316b354830c4bb9e319e357030eebbb831d23599300cbcd2310736c33021bceb313d36ee3037bc0532733619314dbc1f32ab36453164bc3832e33671317bbc52321c379e3192bc0000000000000ab6e31a9a0739030bb6e31e9a0f710a0eb62b2147143f0f13b6e3229a1771121ab64e24f019081524b62b25471c3f172fb60726d21def183db6e3269a1f711a4cb6c027cf20141c5db64e28f021081d71b6bc282f23171e86b62b2947243f1f9db6992905254120b6b6072ad225ef20d0b6752aae26a921ecb6e32a9a2771220ab7522b4a2846232ab7c02bcf2814244bb7172c5c298b246eb74e2cf029082592b7852c8c2a8c25b8b7bc2c2f2b1726dfb7f32cda2ba82604b82b2d472c3f2719b8622da42cdd272eb8992d052d412845b8d02d692d96285cb8072ed22def2873b83e2e3e2e4a298bb8752eae2ea929a4b8ac2e222f0c2abeb8e32e9a2f712ad8b81a2f0b30da2af3b8522f4a30462b0eb9892f8c30b52b2ab9c02fcf30142c47b9f72f15314e2c64b917305c318b2c81b93330a531c92ca0b94e30f031082dbfb96a303d324a2ddeb985308c328c2dfeb9a130dd32d12d1fbabc302f33172e40bad83084335f2e62baf330da33a82e85ba0f311934f32ea8ba2b3147343f2fccba463175348d2ff1ba6231a434dd2f16bb7d31d43417303cbb99310535413062bbb43136356b3089bbd03169359630b1bbeb319d35c230dabb0732d235ef3001bc233207361c3117bc3e323e364a312cbc5a3276367a3142bc7532ae36a93158bc9132e836da316fbcac3222370c3286bcc8325d373e329dbc00000000000047b65f1bdd07910348b65f1fdd0f220b4bb687216c14031050b65f23dd17221357b69b24251a921560b687256c1c03186cb67326051e761979b65f27dd1f221b88b62528fa20831c99b69b282522921dacb611296f23be1ec0b687296c240320d7b6fd293125b520efb6732a0526762109b7e92ae926452225b75f2bdd27222342b7d52b7028072461b7252cfa28832482b7602c8b290725a4b79b2c252a9225c8b7d62cc62a2526edb7112d6f2bbe260ab84c2d102c5e271eb8872d6c2c032833b8c22dcd2c5a2848b8fd2d312db5285eb8382e992d142975b8732e052e76298cb8ae2e752edb29a4b8e92ee92e452abdb8242f612fb12ad6b85f2fdd2f222bf0b89a2f2e30962b0bb9d52f7030072c26b90830b430442c42b92530fa30832c5eb943304231c42c7bb960308b31072d99b97e30d7314c2db7b99b302532922dd6b9b9307432db2df5b9d630c632252e15baf4301933702e36ba11316f33be2e57ba2f31c6330d2f79ba4c3110345e2f9bba6a313e34b12fbfba87316c340330e2baa5319c342e3007bbc231cd345a302cbbe031fe34873052bbfd313135b53078bb1b326435e4309fbb383299351431c7bb5632cf354431f0bb7332053676310cbc91323d36a83122bcae327536db3137bccc32af3610324dbce932e936453263bc073325377b327abc24336137b13291bc42339e37e932a8bc00000000000085b6df1b1008ef0386b6df1f1010de0b89b6e72192146d108eb6df231018de1395b6eb24591a26169eb6e725921c6d18a9b6e326381e061ab6b6df271020de1bc4b66d282421fb1cd5b6eb285922261ee7b66929ae23701ffcb6e72992246d2012b7652a5d2532212ab7e32a3826062243b7612b2427eb225fb7df2b1028de237cb72e2c962871249ab76d2c2429fb24bab7ac2cbb298c25dcb7eb2c592a2626ffb72a2d002bc72612b8692dae2b702725b8a82d332c112839b8e72d922c6d284db8262ef62cce2862b8652e5d2d322978b8a42ec92d9a298fb8e32e382e062aa6b8222fac2e762abeb8612f242feb2ad6b8a02fa02f632befb8df2f1030de2b09b90f3052302f2c24b92e309630712c3fb94e30dc30b52c5ab96d302431fb2c76b98d306e31432d93b9ac30bb318c2db1b9cc300932d82dcfb9eb305932262eedb90b31ab32752e0dba2a310033c72e2dba4a3156331b2f4dba6931ae33702f6eba89310434c82f90baa83133341130b2bac83162343e30d6bae73192346d30f9ba0732c3349d301ebb2632f634ce3043bb46322935ff3068bb65325d3532318fbb853292356631b6bba432c9359a31debbc4320036d03103bce3323836063218bc033372363e322dbc2233ac36763242bc4233e836b03258bc61332437eb326ebc81336237263385bca033a03763339cbcc033df37a033b4bc000000000000c3b6321c32085404c4b632203210540cc7b64a22b814de10ccb6322432185414d3b63e258d1ac316dcb64a26b81cde18e7b657276c1ea01af3b632283220541c02b7b8284f217a1d12b73e298d22c31e24b7c429ee23172038b74a2ab824de204eb7d12a8925b72165b7572b6c26a0227eb7dd2b5f279b2399b7322c32285424b6b7752cbc28e324d4b7b82c4f297a25f3b7fb2cea291a260ab83e2d8d2ac3261cb8812d392b75272eb8c42dee2b172841b8072e552c792854b84a2eb82cde2868b88d2e1e2d48297db8d12e892db72993b8142ff92d292aa9b8572f6c2ea02ac0b89a2fe32e1c2bd8b8dd2f5f2f9b2bf0b81030df2f102c09b932303230542c23b9533076309a2c3db97530bc30e32c58b9963004312d2d73b9b8304f317a2d8fb9d9309b31c92dacb9fb30ea311a2ec9b91c313b326e2ee7b93e318d32c32e06ba5f31e2321b2f25ba81313933752f45baa3319233d02f65bac431ee33173086bae63125344730a8ba073255347930caba29328634ab30edba4a32b834de3011bb6c32eb34133135bb8d321e3548315abbaf3253357f3180bbd1328935b731a6bbf232c035f031cdbb1433f9352932f5bb3533323664320fbc57336c36a03224bc7833a736de3239bc9a33e3361c334ebcbb3321375b3364bcdd335f379b337abcfe339f37dd3391bc1034df371034a8bc213410383234c0bc00000000000003b7761c5308bf0404b776205310bf0c06b7b122dd1457110bb776245318bf1412b79325c21a6a171bb7b126dd1c571925b7ce279f1e451b31b776285320bf1c40b704297921021e50b79329c2226a1f61b7222a17247d2075b7b12add2457218ab73f2bb6254422a2b7ce2b9f264523bab72e2c9a272c24d5b7762c5328bf24f1b7bd2ce2285c2507b8042d7929022617b84c2d192ab12627b8932dc22a6a2738b8da2d732b17284ab8222e172c7d285db8692e782ce72870b8b12edd2c572984b8f82e472dcb2999b83f2fb62d442aaeb8872f282ec22ac5b8ce2f9f2e452bdbb80b301a2fcc2bf3b82e309a2f2c2c0bb952300f30742c24b976305330bf2c3db9993099300c2d57b9bd30e2305c2d72b9e1302c31ae2d8db904317931022ea9b92831c831582ec5b94c311932b12ee3b96f316c320d2f00ba9331c2326a2f1fbab7311933cb2f3ebada31733317305dbafe31cf3349307eba223217347d309fba45324734b130c0ba69327834e730e3ba8d32aa341f3106bbb132dd34573129bbd432123590314dbbf8324735cb3172bb1c337e35073298bb3f33b6354432bebb6333ee358332e6bb87332836c23207bcaa33633603331bbcce339f36453330bcf233dc36883345bc0b341a37cc335abc1c345a37093470bc2e349a372c3486bc4034db3750349dbc52340f387434b4bc643431389934ccbc00000000000042b7bc1c7508310543b7bc207510310d46b71a230315d7114bb7bc247518311552b7eb25f61a0e185ab71a27031dd71964b72428d31ef31b70b7bc287520311d7eb75329a421921e8eb7eb29f6220e20a0b7822a3624e820b3b71a2b0325d721c8b7b12be225db22dfb7242cd326f323f7b7702cd527902409b8bc2c7528312516b8082d0829dc2525b8532da429922634b89f2d482a522745b8eb2df62a0e2856b8372ead2b792867b8822e362ce8287ab8ce2e9b2c5d298db81a2f032dd729a1b8662f702d562ab5b8b12fe22ddb2acab8fd2f582e642be0b82430d32ef32bf7b84a30522f432c0eb97030d52f902c26b996302e30df2c3fb9bc307530312d58b9e230bd30852d72b908310831dc2d8cb92e315531362ea7b95331a431922ec3b97931f531f12edfb99f314832522ffcb9c5319e32b62f1abaeb31f6320e3038ba11325033433057ba3732ad33793077ba5d320634b03097ba82323634e830b8baa83268342231dabace329b345d31fcbaf432ce3499311fbb1a330335d73142bb40333935163267bb6633703556328bbb8c33a9359832b1bbb133e235db32d7bbd7331c361f33ffbbfd335836643313bc11349536ab3327bc2434d336f3333cbc373412371e3451bc4a345237433467bc5d34933769347dbc7034d537903493bc83340c38b734aabc96342e38df34c1bca93451380835d9bc00000000000083b7041d9608aa0584b704219610aa0d87b7862329155f128bb704259618aa1592b745262b1b6d189ab78627291d5f1aa4b76428061f561cb0b704299620aa1dbeb7a529ce212b1fcdb7452a2b236d20dfb7e62a56245a21f2b7862b29255f2203b8132c0e267a230eb8642c062756241ab8b42c0828fa2427b8042d9628aa2535b8552d2e29642643b8a52dce292b2752b8f52d782afc2762b8452e2b2b6d2873b8962ee72be12885b8e62e562c5a2997b8362fbd2cda29aab8862f292d5f2abdb8d72f992dea2ad2b813300e2e7a2be7b83c30882e082cfdb86430062f562c13b98c30892fa72c2ab9b4300830fa2c42b9dc304e30502d5ab904319630aa2d73b92c31e130062e8db955312e31642ea7b97d317d31c62ec2b9a531ce312b2fdeb9cd312232922ffab9f5317832fc2f17ba1d32d032353035ba45322b336d3053ba6d328833a63072ba9632e733e13091babe3224341d31b1bae63256345a31d2ba0e3389349931f4ba3633bd34da3116bb5e33f2341c3239bb863329355f325cbbaf336135a33280bbd7339935ea32a5bbff33d3353133cbbb13340e367a33f1bb28344a36c4330cbc3c348836083420bc5034c6362f3434bc64340637563449bc783447377e345ebc8c348937a73474bca034cc37d0348abcb4340838fa34a0bcc8342b382535b7bcdc344e385035cebcf03472387d35e6bc000000000000c4b74f1db8082906c5b74f21b810290ec8b7f6234f15ef12cdb74f25b8182916d3b7a2265f1bd018dbb7f6274f1def1ae5b7a528391fb81cf1b74f29b820291efeb7f929f921cc1f07b8a22a5f23d0200fb84c2b7624d32119b8f62b4f25ef2223b8502c3b2611242eb8a52c3927b8243ab8fa2c25286a2546b84f2db828292654b8a42d5329f52662b8f92df929cc2771b84d2ea72a582881b8a22e5f2bd02891b8f72e102c4f29a3b84c2f762cd329b5b8a12fe02c5e2ac7b8f62f4f2def2adbb82530c22d862befb850303b2e112c04b97a30b82e632c19b9a530392fb82c30b9cf30c02f102d47b9fa3025306a2d5eb924316d30c82d76b94f31b830292e8fb9793104318e2ea9b9a4315331f52ec3b9ce31a5315f2fdeb9f931f931cc2ff9b923324f321e3016ba4d32a732583032ba78320233943050baa2325f33d0306ebacd32bf330f318dbaf73210344f31acba223342349031ccba4c337634d331edba7733aa3418320ebba133e0345e3230bbcc331735a53253bbf6334f35ef3277bb1034883539339bbb2534c2358633c0bb3b34fe35d333e5bb50343b36113406bc653479363a3419bc7a34b83663342dbc9034f8368d3442bca5343937b83456bcba347c37e3346bbccf34c037103581bce53402383d3597bcfa3425386a35adbc0f3549389935c4bc24356d38c835dbbc39359238f935f3bc00000000000003b89b1dd908b10604b89b21d910b10e05b834247415871307b89b25d918b1160ab80227941b3a190eb83428741d871b13b8e8286d1f1f1d19b89b29d920b11e20b84f2a23223c2027b8022b94233a2130b8b52b9524532239b8342c7425872343b88e2c67266b244eb8e82c6d271f2559b8422d4328e12566b89b2dd928b12673b8f52d79298d2781b84f2e232a3c2890b8a82ed62ab828a0b8022f942b3a29b0b85c2f2d2cc329c1b8b52f952c532ad3b80830022de92ae6b83430742d872bf9b86130eb2d152c0db98e30672e6b2c22b9bb30e72ec32c37b9e8306d2f1f2d4db91531f72f7f2d64b942314330e12d7bb96e318d30472e93b99b31d930b12eacb9c83128311d2fc5b9f53179318d2fdfb92232cd310030fab94f3223323c3016ba7b327b32793032baa832d632b8304ebad5323433f8306cba023394333a318aba2f33f6337e31a8ba5c332d34c331c8ba893361340a32e8bab5339534533208bbe233cb349d322abb08340235e9324cbb1e343b3537336ebb34347435873392bb4b34af35d833b6bb6134eb351534dbbb78342836403400bc8e3467366b3413bca534a736963427bcbb34e736c3343bbcd1342937f1344fbce8346d371f3564bcfe34b1374e3579bc1535f7377f358fbc2b351f38af35a5bc42354338e135bbbc583568381436d2bc6e358d384736e9bc8535b3387b3601bd00000000000025b8ea1dfb083f0725b8ea21fb103f0f26b86f249a15141429b8ea25fb183f172cb86427c81ba91930b86f289a1d141c34b82d29a01f8c1d3ab8ea29fb203f1f41b8a72a4d22962048b8642bc823a92150b8112cb524da2259b86f2c9a25142463b8ce2c9326c9246eb82d2da0278c257ab88b2d60285f2686b8ea2dfb283f2793b8482e9f291728a1b8a72e4d2a9628b0b8062f062b1c29bfb8642fc82ba929cfb8c32f4a2c3e2ae0b81130b52cda2af2b84030252d7d2b04b96f309a2d142c17b99f30142e6c2c2bb9ce30932ec92c40b9fd30172f292d55b92d31a02f8c2d6bb95c311730f42d81b98b3160305f2e99b9bb31ac30cd2eb1b9ea31fb303f2fc9b919324c31b52fe3b948329f311730fcb97832f531563017baa7324d32963032bad632a832d8304eba063306331c316bba35336633623188ba6433c833a931a6ba94331634f331c5bac3334a343e32e4baf2337f348b3204bb1134b534da3224bb2834ed342a3346bb403425357d3368bb58345f35d1338abb6f349a351434aebb8734d7354034d2bb9f3414366c34f7bbb63453369a340ebcce349336c93421bce634d536f83435bcfd341737293549bc15355b375a355dbc2d35a0378c3572bc4435e637c03587bc5c351738f4359dbc74353b382936b3bc8b3560385f36c9bca33586389536e0bcbb35ac38cd36f8bcd235d33806370fbd00000000000046b83b1e1c09d60747b83b221c11d60f48b8ac24c01568144ab83b261c19d6174db8c927fc1b1f1a51b8ac28c01d681c56b87329d31f001e5cb83b2a1c21d61f62b8022b7822f52069b8c92bfc231f2271b8482cd52468237ab8ac2cc025682484b8102dbf262c258fb8732dd32700269ab8d72d7e28e326a6b83b2e1c29d627b3b89e2ec5296c28c1b8022f782af528d0b8662f352b8629dfb8c92ffc2b1f2aefb81630672cbf2a00b94830d52c682b11b97a30482d0c2c24b9ac30c02d682c37b9de303d2ec82c4ab91031bf2e2c2d5fb94131472f942d74b97331d32f002e89b9a53133306f2ea0b9d7317e30e32eb7b90932cc305a2fcfb93b321c31d62fe7b96c326f312a3000ba9e32c5316c301abad0321d32b03035ba02337832f53050ba3433d5323d316cba66333533863188ba97339733d131a5bac933fc331f32c3bafb3332346e32e2ba16346734bf3201bb2f349d34133321bb4834d534683341bb61340e35bf3362bb7a3448350c3484bb933483353a34a7bbac34c0356834cabbc534fe359834efbbde343d36c8340abcf7347e36fa341cbc1035bf362c3530bc293503375f3543bc41354737943557bc5a358d37c9356cbc7335d337003680bc8c350e38373696bca53533386f36abbcbe355838a836c1bcd7357e38e336d8bcf035a5381e37efbc0936cc385a3706bd2236f43897371ebd00000000000068b88d1e3e093a0869b88d223e113a106ab8ea24e615c1146cb88d263e193a186fb81828181c9b1a73b8ea28e61dc11c78b8bc290320791e7db88d2a3e213a2084b85f2ba22259218bb8182c18249b2293b8812cf524fe239cb8ea2ce625c124a6b8532dec269425b0b8bc2d03287926bbb8252e9b286e27c7b88d2e3e293a28d4b8f62eeb29c528e2b85f2fa22a5929f0b8c82f642bf629ffb81830182c9b2a0fb94d30842c482b20b98130f52cfe2b31b9b6306a2d5e2c43b9ea30e62dc12c56b91e31662e292d6ab95331ec2e942d7eb98731772f042e93b9bc310330792ea8b9f0314e30f12ebfb925329b306e2fd6b95932eb30ef2fedb98d323e313a3006bac23293317f301fbaf632eb31c53038ba2b3345320e3153ba5f33a23259316eba94330233a6318abac8336433f631a6bafc33c9334732c3ba183418349b32e1ba33344d34f032ffba4d34843448331ebb6734bc34a2333ebb8134f534fe335fbb9b342f352e3480bbb6346a355e34a2bbd034a7358f34c4bbea34e635c134e8bb04352536f43406bc1e356636293518bc3935a8365e352bbc5335ec3694353ebc6d353137cc3552bc87357737043666bca235be373e367abcbc35033879368fbcd6352838b436a4bcf0354e38f136babc0a3674382f37d0bc25369b386e37e7bc3f36c338ae37febc5936eb38ef3715bd7336143918382dbd0000000000008bb8e21e5f098d088bb8e2225f118d108db82a250b161f158fb8e2265f198d1892b84d28331c1c1b96b82a290b1e1f1d9ab8062a1d20f81ea0b8e22a5f218d20a6b8bf2bcd22c321adb84d2c33241c23b5b8bc2c14254d24beb82a2d0b261f25c7b8982d18270226d2b8062e1d28f826ddb8742eb9280028e9b8e22e5f298d28f6b8502f112a232903b9bf2fcd2ac32911b91630942b6b2a20b94d30332c1c2b30b98530a12cd72b41b9bc30142d4d2c52b9f3308d2db42c64b92a310b2e1f2d76b961318f2e8e2d8ab99831182f022e9eb9cf31a62f7b2eb3b906321d30f82ec8b93d326a307a2fdeb97432b9300030f5b9ab320b3145300dbae2325f318d3025ba1933b731d7303eba50331132233157ba88336d32723172babf33cd32c3318dbaf6332f331632a8ba163494336b32c5ba3234fb33c332e2ba4d3433341c33ffba6934693479331ebb8534a134d7333dbba034da341c345cbbbc3414354d347dbbd734503580349ebbf3348d35b434c0bb0e35cc35e934e3bb2a350b361f3503bc45354d36563515bc61358f368e3527bc7c35d336c8353abc9835183702364dbcb3355f373e3661bccf35a6377b3675bcea35f037b9368abc06361d38f8369ebc223643383837b4bc3d366a387a37c9bc59369138bc37e0bc7436b9380038f6bc9036e23822380dbdab360b39453825bdc736353969383dbd000000000000aeb8391f8109e408aeb839238111e410b0b86b2531168115b2b839278119e418b5b884284d1ca51bb8b86b29311e811dbdb8522a37207e1fc2b8392b8121e420c9b8102cf7223122d0b8842c4d24a523d8b8f72c3425a024e0b86b2d31268125eab8df2d44277626f4b8522e37287e27ffb8c62ed6284d280bb9392f8129e42817b9ad2f372a862925b91030f72a312a33b94a30c32be62a42b984304d2ca52b51b9be30be2c372c62b9f730342da02c73b93131b02d0e2d85b96b31312e812d97b9a531b82ef92daab9df31442f762ebeb91832d62ff72ed3b9523237307e2fe8b98c3285300530feb9c632d6304d3015ba00332a3197302dba39338131e43045ba7333da3134315dbaad333732863177bae7339632da3191ba1034f7323132acba2d345c338a32c8ba4a34c333e632e4ba67341634443301bb84344d34a5331ebba134853404343dbbbe34be3437345cbbdb34f8346b347bbbf7343435a0349cbb14357135d634bdbb3135b0350e35dfbb4e35f035473501bc6b353136813512bc88357436bc3524bca535b836f93537bcc235fd3637364abcdf35443776365dbcfb358d37b63671bc1836d637f73685bc353611383a3799bc523637387e37aebc6f365e38c337c3bc8c3685380538d9bca936ad382838efbcc636d6384d3806bde336003972381dbd00372a39973835bd1c375539be384dbd000000000000d1b8921fa3094009d2b89223a3114011d3b8ae255716e815d5b89227a3194019d8b8bc28671c1a1cdcb8ae29571ee81de0b8a02a50200520e6b8922ba3214021ecb8422c2223a522f3b8bc2c67241a24fbb8352d5425f72403b9ae2d5726e8250cb9272e7127ef2617b9a02e5028052822b9192ff4289d282db9922fa32940293ab906305d2aed2947b94230222ba52a55b97f30f22b672b64b9bc30672c1a2c73b9f830db2c862c83b93531542df72c94b97131d22d6d2da6b9ae31572ee82db8b9ea31e12e692eccb92732712fef2edfb9643203307a2ff4b9a0325030053009badd32a13050301fba1933f4309d3036ba56334a31ed304dba9233a331403165bacf33fe3195317eba06345d32ed3197ba2434be324832b1ba42342233a532ccba613489330533e8ba7f34f233673304bb9d342f34cc3321bbbc3467341a343ebbda34a0344f345cbbf834db3486347bbb16351635bd349bbb35355435f734bcbb533592353135ddbb7135d2356d35ffbb90351436aa3511bcae355736e83522bccc359b36283634bcea35e136693647bc09362837ab365abc27367137ef366dbc4536bb37343781bc643603387a3795bc82362938c137a9bca03650380538bebcbe3678382a38d3bcdd36a1385038e9bcfb36ca38763800bd1937f4389d3816bd38371e39c5382ebd56374a39ed3845bd7437763916395ebd000000000000f5b8ee1fc409a009f6b8ee23c411a011f7b8f2257d165416f9b8ee27c419a019fcb8f528811c651cffb8f2297d1e541e04b9f02a6a204f2009b9ee2bc421a0210fb9762c4c231f2316b9f52c812465241eb9732d7325512526b9f22d7d26542630b9712e9d276d273ab9f02e6a284f2845b96f2f1129f22850b9ee2fc429a0295db93630822a5a2a6ab976304c2b1f2b78b9b530112cef2b86b9f530812c652c96b93431f72cd82ca6b97331732d512db7b9b331f52dd02dc8b9f2317d2e542edab932320a2fde2eedb971329d2f6d2f01bab1321b30013016baf0326a304f302bba2f33bc309f3040ba6f331131f23057baae33693147316ebaee33c431a03186ba17342232fb319fba363482325a32b8ba5634e632bb32d2ba76344c331f33edba9534b533853308bbb5341134ef3324bbd53448342d3441bbf534813465345fbb1435bc349e347dbb3435f734d8349cbb543535351435bcbb733573355135dcbb9335b4359035fdbbb335f535d0350fbcd3353836113621bcf2357d36543632bc1236c336983645bc32360a37de3657bc5136533725376abc71369d376d377dbc9136e937b73791bcb1361b380138a5bcd03642382838babcf0366a384f38cebc103793387638e4bc2f37bc389f38fabc4f37e638c83810bd6f371139f23827bd8f373d391c393ebdae376939473956bdce37963973396fbd00000000000019b92520e609040a1ab92524e61104121bb93826a216c5161db92528e619041a20b92f299b1cb31c24b9382aa21ec51e28b9422b84209b202db9252ce621042233b9aa2c77239e233ab92f2d9b24b32442b9b42d9325b0254ab9382ea226c52653b9bd2ec927f2275db9422f84289b2868b9c62f2f294a2974b92530e629042a80b96830a82acb2a8db9aa30772b9e2b9bb9ed30282c3e2ca9b92f319b2cb32cb8b97131142d2f2dc8b9b431932db02dd9b9f631182e382eebb93832a22ec52efdb97b32332f582f10babd32c92ff22f23baff323330493038ba423384309b304dba8433d830f13062bac6332f314a3179ba04348931a63190ba2534e6310432a8ba473445326632c0ba6834a832cb32daba89340e333333f4baaa3477339e330ebbcb34e23306342abbed3428343e3446bb0e356134783462bb2f359b34b33480bb5035d734f0349ebb713514352f35bdbb923553356f35ddbbb4359335b035fdbbd535d535f3350fbcf6351836383620bc17365c367e3631bc3836a236c53643bc5936ea360e3755bc7b363337583768bc9c367d37a4377bbcbd36c937f2378ebcde360b382038a2bcff3633384938b6bc20375b387238cabc423784389b38dfbc6337ad38c638f5bc8437d838f1380bbda53703391d3921bdc6372f394a3938bde7375b39773950bd04388939a63968bd1538b739d53980bd0000000000003eb95520070a6d0a3fb9552407126d1240b98026c8163b1742b95528071a6d1a45b96a29b61c061d48b9802ac81e3b1f4db9952b9e20ec2052b9552c07226d2258b9e02ca12311245fb96a2db624062566b9f52db32513266eb9802ec8263b2778b90a2ff6273e2881b9952f9e28ec288cb910304c29a62998b95530072a6d2aa4b99b30ce2a422bb1b9e030a12b112cbeb92531402c882ccdb96a31b62c062ddcb9b031312d892decb9f531b32d132efcb93a323a2ea42e0eba8032c82e3b2f20bac5325c2fd92f33ba0a33f62f3e3046ba50334b3093305aba95339e30ec306fbada33f330473185ba10344c31a6319bba3334a8310832b2ba553407326d32caba78346932d632e3ba9b34ce324233fcbabd343633b03316bbe034a133113430bb023508344c344cbb25354034883468bb48357a34c63484bb6a35b6340635a2bb8d35f3344735c0bbb03531358935dfbbd2357135ce35ffbbf535b33513360fbc1836f6355b3620bc3a363a36a43631bc5d368136ef3642bc8036c8363b3754bca2361137893766bcc5365c37d93779bce836a83715388cbc0a37f6373e389fbc2d3722386838b3bc50374b389338c7bc72377438bf38dcbc95379e38ec38f1bcb837c838193906bdda37f33847391cbdfd372039763933bd10384c39a6394abd21387a39d73961bd3338a839083a79bd4438d7393a3a92bd00000000000063b98620290adb0a64b986242912db1265b9c926ee16b71767b98628291adb1a6ab9a729d01c5b1d6db9c92aee1eb71f72b9ea2bb720402177b9862c2922db227db9172dcc23572483b9a72dd0245b258bb9382ed3257b2693b9c92eee26b7279cb95a2f11288728a6b9ea2fb7284029b1b93e306a29072abcb98630292adb2ac8b9ce30f42abd2bd5b91731cc2b572ce3b95f31582cd62cf1b9a731d02c5b2d00baf0314e2de82d10ba3832d32d7b2e20ba81325d2e152f32bac932ee2eb72f44ba1133852f2f3056ba5a33113087306abaa2336330e2307ebaea33b730403193ba19340f31a131a8ba3e346a310732bfba6234c8316f32d6ba86342932db32edbaaa348d324b3306bbce34f432bd331fbbf2345e331a3439bb1735cc33573453bb3b351e3495346ebb5f355834d6348abb833593341735a7bba735d0345b35c4bbcc350e35a135e3bbf0354e35e83501bc14369035313611bc3836d3357b3621bc5c361736c73631bc81365d36153742bca536a536653754bcc936ee36b73765bced363937053878bc113785372f388abc3537d3375b389dbc5a3711388738b0bc7e373938b438c4bca2376338e238d9bcc6378c381039edbcea37b738403902bd0738e338703918bd19380f39a1392ebd2b383c39d43945bd3e386a39073a5cbd503898393a3a73bd6238c8396f3a8cbd7438f839a53aa4bd00000000000089b9b8204a0a4e0b89b9b8244a124e138bb9142714171c188db9b8284a1a4e1b8fb9e629ea1cb51d93b9142b141f1c2097b9212cd12097219cb9b82c4a224e23a2b94f2df6239f24a9b9e62dea24b525b0b97d2ef225e726b8b9142f14271c28c1b9ab2f2728d228cbb92130d1289729d6b96c3087296b2ae1b9b8304a2a4e2bedb903311a2b1f2cfab94f31f62b9f2c07ba9a316f2c262d16bae631ea2cb52d25ba31326b2d4a2e34ba7d32f22de72e45bac832802e8c2f56ba1433142f1c3068ba5f33ae2f75307abaab332730d2308ebaf6337a303331a2ba2134d1309731b7ba47342b31ff31ccba6c3487316b32e2ba9234e731db32f9bab8344a324e3311bbdd34b132c43329bb03351a331f3442bb293586335e345cbb4f35f6339f3477bb74353434e23492bb9a356f342635aebbc035ac346c35cabbe635ea34b535e8bb0b362a35ff3503bc31366b354a3612bc5736ae35983622bc7d36f235e73632bca2363836393743bcc83680368c3754bcee36c936e13765bc143714371c3877bc39376037483889bc5f37ae3775389cbc8537fd37a338afbcab372738d238c2bcd03750380239d6bcf6377a383339ebbc0e38a5386539ffbc2138d138973915bd3438fd38cb392abd47382b39ff3940bd59385939353a57bd6c3887396b3a6ebd7f38b739a23a86bd9238e739db3a9ebda538183a143bb7bd000000000000afb9eb206c0ac50bafb9eb246c12c513b1b9602739175f18b3b9eb286c1ac51bb5b9252a041d121eb9b9602b391f5f20bdb94d2ceb20f321c2b9eb2c6c22c523c8b9882d1024eb24cfb9252e04251226d6b9c32e12265827deb9602f39275f28e7b9fd2f3d282129f1b94d30eb28f329fbb99c30a529d42a06baeb306c2ac52b12ba3931402b632c1fba8831102ceb2c2dbad731872c7a2d3bba2532042d122e4aba7432882db12e59bac332122e582f6aba1133a22e03307bba6033392f5f308dbaaf33d72fbe309fbafd333d302131b2ba263492308831c6ba4d34eb30f331dbba753446316132f1ba9c34a531d43207bbc33407324b331ebbeb346c32c53335bb1235d43222344dbb39354033633467bb6135af33a63480bb88351034eb349bbbaf354b343135b6bbd73587347a35d2bbfe35c534c535efbb25360435123606bc4d364535603615bc74368835b13624bc9b36cc35043734bcc3361236583745bcea365936af3755bc1137a236033866bc3937ed36313878bc603739375f3889bc873787378e389cbcaf37d737be38aebcd6371438ef38c1bcfd373d382139d5bc123867385439e9bc263892388839fdbc3a38be38bd3912bd4d38eb38f33927bd613818392a3a3dbd75384639613a53bd883875399a3a6abd9c38a539d43a81bdb038d5390f3b99bdc338073a4b3bb2bdd738393a873bcbbd000000000000d6b91e218d0a210cd6b91e258d122114d7b9ae275f17a518d9b91e298d1a211cdcb9662a1e1d731edfb9ae2b5f1fa520e4b97b2c04215222e9b91e2d8d222124efb9c22d25243925f5b9662e1e257326fcb90a2f3226ce2705baae2f5f27a5280dba29305328732917ba7b300429522a21bacd30c229412b2dba1e318d2a212c38ba7031662ba92c45bac231252c392d52ba14329f2cd22d61ba66321e2d732e6fbab832a52d1c2f7fba0a33322ece2f8fba5c33c52e4430a0baae335f2fa530b2ba003400300a31c5ba293453307331d8ba5234aa30e031ecba7b340431523200bba4346231c73216bbcd34c23141332cbbf6342632bf3343bb1e358d3221345abb4735f832643472bb70356633a9348bbb9935d733f034a5bbc23525343935c0bbeb3561348535dbbb14369f34d235f7bb3d36de3421360abc66361e35733618bc8f366135c63627bcb836a5351c3737bce136ea35743747bc0a373236ce3757bc33377b36153868bc5c37c536443879bc8537113774388abcae375f37a5389cbcd737af37d738aebc003800380a39c1bc143829383e39d4bc293853387339e8bc3d387e38a939fcbc5238aa38e03910bd6638d738193a25bd7b380439523a3abd8f3833398c3a50bda4386239c73a67bdb8389239043b7dbdcd38c239413b95bde138f439803badbdf638263abf3bc5bd0a39593a003cdebd000000000000fdb95321af0a610cfdb95325af126114feb9fd278517ed1800ba5329af1a611c03baa82a391dd81e06bafd2b851fed200bbaa92c1e21b52210ba532daf22612416bafe2d3b248b251cbaa82e3925d82623ba532f512624282bbafd2f8527ed2834ba54306928c8293ebaa9301e29b52a48bafe30e029b32b53ba5331af2a612c5fbaa9318c2bf22c6cbafe313b2c8b2d79ba5332b62c2d2e87baa832392dd82e96bafd32c22d8c2fa5ba5333512e2430b5baa833e82e8630c6bafd33852fed30d8ba293414305931ebba54346930c831feba7e34c2303c3212bba9341e31b53226bbd4347d3132333cbbfe34e031b33352bb293546321c3468bb5335af32613480bb7e351c33a83498bba9358c33f234b1bbd335ff333d35cbbbfe353b348b35e5bb28367834db3500bc5336b6342d360ebc7e36f73481361cbca8363935d8362bbcd3367c3531373abcfd36c2358c374abc28370936e9375abc5337513624386abc7d379c3655387bbca837e83686388cbcd3373537b9389dbcfd378537ed38afbc1438d6372239c1bc293814385939d4bc3e383e389039e7bc54386938c839fbbc69389538023a0fbd7e38c2383c3a23bd9438f038783a38bda9381e39b53a4ebdbe384d39f33a64bdd4387d39323b7abde938ae39723b91bdfe38e039b33ba9bd1439123af53bc1bd2939463a1c3cdabd3e397a3a3e3cf3bd00000000000025ba8921d10aa40c25ba8925d112a41426ba2728ab17391928ba8929d11aa41c2bbaec2a531d411f2eba272cab1f392132bad82c38211c2337ba892dd122a4243dba3b2e5024e02544baec2e532541274bba9d2f7126632853ba2730ab2739295cba80308028212a65bad83038291c2b6fba3131fd29152c7aba8931d12aa42c86bae231b12b3e2d93ba3b32502ce02da0ba9332ce2c8c2eaebaec32532d412fbdba4433df2dff2fccba9d33712e6330dcbaf6330a2fcc30edba2734ab2f3931ffba53342930ab3111bb80348030213224bbac34da309c3238bbd83438311c334dbb05359931a03362bb3135fd31153478bb5d3565325b348fbb8935d132a434a6bbb6353f33f034bebbe235b1333e35d7bb0e3613348e35f1bb3b365034e03506bc67368e34353613bc9336ce348c3621bcbf361035e53630bcec36533541373ebc183798359f374dbc4437df35ff375dbc7137273631386dbc9d37713663387dbcc937bd3697388ebcf6370a37cc389fbc11385a370239b0bc2738ab373939c2bc3d38fd377139d5bc53382938ab39e8bc69385438e539fbbc80388038213a0ebd9638ac385e3a23bdac38da389c3a37bdc2380839db3a4cbdd83838391c3b62bdee3868395d3b78bd05399939a03b8fbd1b39cb39e43ba6bd3139fd39153cbdbd4739313a383cd6bd5d39653a5b3ceebd73399a3a803c08be0000000000004dbac021f20aea0c4dbac025f212ea144eba5028d017881950bac029f21aea1c53ba312b6d1dae1f56ba502cd01f88215aba082d512187235fbac02df222ea2465ba792e652439266cba312f6d25ae2773bae92f9126a6287bba5030d027882984baac3096287d2a8dba08315129872b97ba64311b2a522ca2bac031f22aea2caeba1c32d72b8d2dbaba7932652c392ec8bad532e62cef2ed6ba31336d2dae2fe4ba8d33fb2d3c30f4bae933912ea63004bb22342d2f143115bb5034d02f883126bb7e343d30003239bbac3496307d324cbbda34f23000335fbb08355131873374bb3635b4310a3489bb64351b3252349fbb923585329d34b6bbc035f232ea34cdbbee3563333a35e6bb1c36d7338d35ffbb4a362834e1350cbc79366534393619bca736a534923627bcd536e634ef3635bc033729354d3743bc31376d35ae3752bc5f37b335093861bc8d37fb353c3871bcbb374536703881bce9379136a63891bc0b38de36dc38a2bc22382d371439b3bc39387e374d39c4bc5038d0378839d6bc67381238c339e9bc7e383d38003afcbc953869383e3a0fbdac3896387d3a23bdc338c338be3a37bdda38f238003b4cbdf1382139433b61bd08395139873b76bd1f398239cc3b8dbd3639b4390a3ca3bd4d39e7392d3cbbbd64391b3a523cd2bd7b394f3a773cebbd9239853a9d3c04bea939bb3ac33c1dbe00000000000075baf921140b330d76baf9251413331577ba7a28f617d91979baf929141b331d7cba772b871d10207fba7a2cf61fd92183ba392d6b21f62388baf92d142333258ebab82e7a24952694ba772f872510289bba1b30b126ea28a3ba7a30f627d929acbada30ac28dd2ab5ba39316b29f62bc0ba9931382a922ccbbaf931142b332dd6ba5832fd2bdf2de3bab8327a2c952ef0ba1733fd2c552ffeba7733872d10300cbbd633182e7a301cbb1b34b12eea302cbb4b34502f5f313dbb7a34f62fd9314ebbaa345230593261bbda34ac30dd3274bb0a350a31673387bb39356b31f6339cbb6935d0314534b1bb993538329234c7bbc935a432e134debbf93514333335f5bb28368733873507bc5836fd33df3513bc88363c34383620bcb8367a3495362dbce736bb34f3363bbc1737fd34553749bc47374135b93757bc77378735103866bca637cf35443875bcd63718367a3885bc03386436b23895bc1b38b136ea38a5bc3338ff362439b6bc4b3850375f39c7bc6338a2379c39d9bc7a38f637d939ebbc92382638183afdbcaa385238593a10bdc2387e389a3a23bdda38ac38dd3a37bdf238da38223b4cbd0a390a39673b60bd22393a39ae3b76bd39396b39f63b8bbd51399d39203ca2bd6939d039453cb9bd8139043a6b3cd0bd9939383a923ce8bdb1396e3ab93c01bec939a43ae13c1abee139db3a0a3d33be0000000000009fba3222350b7e0d9fba322635137e15a0baa5280e182e1aa2ba322a351b7e1da5babe2ba21d4b20a8baa52c0e202e22acba6b2d85213524b1ba322e35237e25b7baf82e9024f426bdbabe2fa2254b28c5ba4230d0263129ccbaa5300e282e2ad5ba0831c228412bdfba6b318529352ce9bacf31562ad42cf4ba3232352b7e2dffba9532112c342e0cbbf832902cf42e19bb5b33152dbf2f27bbbe33a22d4b3035bb1134352ebb3045bb4234d02e313155bb7434722fad3165bba5340e302e3277bbd7346630b53289bb0835c23041339cbb3a352231d233b0bb6b3585313534c4bb9d35eb318334dabbcf355632d434f0bb0036c432283503bc323635337e350fbc6336aa33d8351bbc95361134343627bcc6365034923634bcf8369034f43642bc2937d13458374fbc5b371535bf375dbc8d375a3514386cbcbe37a2354b387abcf037ea3582388abc11383536bb3899bc29388236f638a9bc4238d0363139babc5b3820376e39cabc74387237ad39dcbc8c38c637ed39edbca5380e382e3affbcbe383a38713a12bdd7386638b53a25bdf0389438fa3a38bd0839c238413b4cbd2139f138893b61bd3a392239d23b76bd533953390f3c8bbd6b398539353ca1bd8439b8395b3cb7bd9d39eb39833ccebdb639203aab3ce6bdcf39563ad43cfebde7398c3afe3c17be003ac43a283d30be193afc3a533d4abe000000000000c9ba6c22570bcc0dc9ba6c265713cc15cabad1282118861accba6c2a571bcc1dcfba032cbc1d8820d2bad12c21208622d6ba9e2d9e217024dbba6c2e5723cc25e1ba392fa5245727e7ba0330bc258828eeba6a30f0267b29f6bad1302128862affba3831d828a82b08bb9e319e29702c12bb0532732a192d1dbb6c32572bcc2d29bbd332242c8c2e35bb3933a52c572f42bba0332d2d173050bb0334bc2d88305fbb3734522eff306ebb6a34f02e7b317ebb9e34952ffe318fbbd13421308632a0bb04357b301433b3bb3835d830a833c6bb6b3539312134d9bb9e359e317034eebbd2350732c33401bc0536733219350cbc3836e332713518bc6c365733cc3524bc9f36ce332b3630bcd33624348c363cbc06376434f03649bc3937a534573756bc6d37e834c13764bca0372d35173872bcd33773354e3880bc0338bc3588388fbc1d380636c2389ebc37385236ff38aebc5038a0363c39bebc6a38f0367b39cebc84384237bc39dfbc9e389537fe39f1bcb738ea37413a02bdd1382138863a15bdeb384d38cc3a27bd04397b38143b3abd1e39a9385d3b4ebd3839d838a83b62bd51390839f43b76bd6b393939213c8bbd85396b39483ca1bd9e399e39703cb7bdb839d239993ccebdd239073ac33ce5bdeb393d3aee3cfcbd053a733a193d15be1f3aab3a453d2ebe383ae33a713d47be523a1c3b9e3d61be000000000000f3baa722780b1d0ef4baa72678131d16f5bafd283418e11af7baa72a781b1d1ef9ba282cd61dc720fdbafd2c3420e12201bbd22db821ae2406bba72e78231d260bbb7c2fba24bd2712bb2830d625c72819bb93301027c82921bbfd303428e12a29bb6831ee28092c33bbd231b829ae2c3dbb3d32912a602d48bba732782b1d2e53bb1233372ce72e5fbb7c33ba2cbd2f6cbbe633442d50307abb2834d62dc73089bb5e346f2e443198bb9334102fc831a8bbc834b82f5132b9bbfd343430e132cabb33358f307733ddbb6835ee300934f0bb9d3551315a3402bcd235b831ae340cbc07362332063517bc3d369132603522bc72360333bd352dbca73678331d3639bcdc36f233813645bc12373734e73651bc4737783451375ebc7c37ba34bd376bbcb137fe34163879bce6374435503887bc0e388c358b3896bc2838d635c738a4bc433822360539b4bc5e386f364439c3bc7838be368539d3bc93381037c839e4bcad3863370c3af5bcc838b837513a06bde3380738983a18bdfd383438e13a2abd183961382b3b3dbd33398f38773b50bd4d39be38c43b64bd6839ee38093c78bd82391f39323c8dbd9d3951395a3ca2bdb8398439843cb7bdd239b839ae3ccebded39ed39da3ce4bd073a233a063dfcbd223a593a323d14be3d3a913a603d2cbe573ac93a8e3d45be723a033bbd3d5fbe8c3a3d3bed3d79be0000000000001ebbe3229a0b710e1fbbe3269a13711620bb2b2947183f1b22bbe32a9a1b711e24bb4e2cf01d082128bb2b2d47203f232cbb072ed221ef2431bbe32e9a23712636bbc02fcf2414283dbb4e30f025082944bbbc302f27172a4cbb2b3147283f2b54bb99310529412c5ebb0732d229ef2c68bb7532ae2aa92d72bbe3329a2b712e7ebb52334a2c462f8abbc033cf2c143097bb17345c2d8b30a5bb4e34f02d0831b4bb85348c2e8c31c3bbbc342f2f1732d3bbf334da2fa832e4bb2b3547303f33f5bb6235a430dd3304bc9935053141340dbcd0356931963417bc0736d231ef3421bc3e363e324a352cbc7536ae32a93537bcac3622330c3642bce3369a3371364ebc1a370b34da365abc52374a34463767bc89378c34b53774bcc037cf34143881bcf73715354e388fbc17385c358b389dbc3338a535c938abbc4e38f0350839babc6a383d364a39c9bc85388c368c39d9bca138dd36d139e9bcbc382f37173afabcd83884375f3a0bbdf338da37a83a1cbd0f391938f33a2ebd2b3947383f3b40bd463975388d3b53bd6239a438dd3b67bd7d39d438173c7abd99390539413c8fbdb43936396b3ca3bdd0396939963cb9bdeb399d39c23ccebd073ad239ef3ce5bd233a073a1c3dfcbd3e3a3e3a4a3d13be5a3a763a7a3d2bbe753aae3aa93d44be913ae83ada3d5dbeac3a223b0c3e77bec83a5d3b3e3e92be0000000000004abb2123bb0bc80e4abb2127bb13c8164cbb59295918a11b4dbb212bbb1bc81e50bb742c0a1e4c2153bb592d5920a12358bb3d2eeb2131255cbb212fbb23c82662bb0230e5244b2868bb74300a264c296fbbe6304f27692a77bb59315928a12b80bbcb311b297a2c89bb3d32eb29312d93bbaf32cc2af62d9ebb2133bb2bc82eaabb93335d2ca82fb6bb0234e52c4b30c3bb3b34742dc830d1bb74340a2e4c31dfbbad34a92ed731efbbe6344f2f6932ffbb2035fd2f023308bc59355930a13310bc9235b830243419bccb351b317a3423bc04368131d4342dbc3d36eb31313537bc76365a32923542bcaf36cc32f6354dbce83642335d3658bc2137bb33c83664bc5a371c34363770bc93375d34a8377dbccc37a0340e388abc0238e5344b3897bc1f382b358838a5bc3b387435c838b3bc5838be350939c1bc74380a364c39d0bc913859369139e0bcad38a936d739efbcca38fb361f3a00bde6384f37693a10bd0339a537b43a21bd2039fd37023b33bd3c392b38503b45bd59395938a13b57bd75398838f33b6abd9239b838243c7dbdae39e9384e3c91bdcb391b397a3ca6bde7394d39a73cbbbd043a8139d43cd0bd203ab639023de6bd3d3aeb39313dfcbd593a223a613d14be763a5a3a923d2bbe923a923ac33d43beaf3acc3af63d5cbecb3a063b293e76bee83a423b5d3e90be043b7e3b923eabbe00000000000077bb5f23dd0b220f77bb5f27dd13221778bb87296c18031c7abb5f2bdd1b221f7dbb9b2c251e922180bb872d6c20032484bb732e0522762589bb5f2fdd2322278ebb2530fa24832895bb9b30252692299cbb11316f27be2aa4bb87316c28032cacbbfd313129b52cb6bb7332052a762dc0bbe932e92a452ecabb5f33dd2b222fd6bbd533702c0730e2bb2534fa2c8330efbb60348b2d0731fdbb9b34252e923106bcd634c62e25320dbc11356f2fbe3215bc4c3510305e331ebc87356c30033427bcc235cd305a3430bcfd353131b53439bc38369931143543bc7336053276354dbcae367532db3558bce936e932453663bc24376133b1366ebc5f37dd3322377abc9a372e34963786bcd5377034073893bc0838b4344438a0bc2538fa348338adbc43384235c438bbbc60388b350739c9bc7e38d7354c39d8bc9b3825369239e7bcb9387436db39f6bcd638c636253a06bdf4381937703a16bd11396f37be3a27bd2f39c6370d3b38bd4c3910385e3b4abd6a393e38b13b5cbd87396c38033c6ebda5399c382e3c81bdc239cd385a3c95bde039fe38873ca9bdfd393139b53cbdbd1b3a6439e43cd2bd383a9939143de8bd563acf39443dfebd733a053a763d15be913a3d3aa83d2cbeae3a753adb3d44becc3aaf3a103e5cbee93ae93a453e75be073b253b7b3e8fbe243b613bb13ea9be423b9e3be93ec4be000000000000a4bb9f23fe0b7f0fa4bb9f27fe137f17a5bbb7297f18371ca7bb9f2bfe1b7f1faabbc32c3f1edb21adbbb72d7f203724b1bbab2e1f22bd25b6bb9f2ffe237f27bcbb49300f25be28c2bbc3303f26db29c9bb3d318f27162bd1bbb7317f28372cd9bb31324729f32ce3bbab321f2abd2dedbb2533072b962ef7bb9f33fe2b7f2f01bc0c34832c3b3008bc49340f2dbe300ebc8634a32d493115bcc3343f2edb311cbc0035e32e753224bc3d358f2f16332cbc7a352130be3334bcb7357f3037343dbcf435e130933446bc31364731f33450bc6e36b13156355abcab361f32bd3564bce836913228366fbc2537073396367abc62378133093785bc9f37fe337f3791bcdb374034f8379dbc0c3883343b38aabc2b38c8347c38b7bc49380f35be38c4bc683858350239d2bc8638a3354939e0bca538f0359139efbcc3383f36db39febce2389036273a0dbd0039e336753a1dbd1e393837c43a2ebd3d398f37163b3ebd5b39e737693b50bd7a392138be3b61bd983950380b3c73bdb7397f38373c86bdd539b038653c99bdf439e138933cadbd123a1439c23cc1bd313a4739f33cd6bd4f3a7b39243debbd6e3ab139563d01be8c3ae739893d17beab3a1f3abd3d2ebec93a573af23d45bee83a913a283e5dbe063bcb3a5e3e76be253b073b963e8fbe433b433bcf3ea9be623b813b093fc4be803bbf3b433fdfbe000000000000d1bbdf23100cde0fd2bbdf271014de17d3bbe72992186d1cd5bbdf2b101cde1fd7bbeb2c591e2622dbbbe72d92206d24dfbbe32e38220626e4bbdf2f1024de27e9bb6d302425fb28f0bbeb305926262af7bb6931ae27702bffbbe73192286d2c04bc65325d29322d08bce332382a062e0dbc6133242beb2e13bcdf33102cde2f18bc2e34962c71301fbc6d34242dfb3025bcac34bb2d8c312cbceb34592e263233bc2a35002fc7323bbc6935ae2f703343bca835333011344bbce73592306d3454bc2636f630ce345dbc65365d31323567bca436c9319a3571bce336383206367bbc2237ac32763686bc61372433eb3691bca037a03363379cbcdf371034de37a8bc0f3852342f38b4bc2e3896347138c1bc4e38dc34b538cebc6d382435fb38dbbc8d386e354339e9bcac38bb358c39f8bccc380936d83906bdeb385936263a15bd0b39ab36753a25bd2a390037c73a35bd4a3956371b3b45bd6939ae37703b56bd89390438c83b68bda8393338113c79bdc83962383e3c8cbde73992386d3c9ebd073ac3389d3cb2bd263af638ce3cc5bd463a2939ff3cdabd653a5d39323deebd853a9239663d04bea43ac9399a3d1abec43a003ad03d30bee33a383a063e47be033b723a3e3e5fbe223bac3a763e77be423be83ab03e90be613b243beb3ea9be813b623b263fc4bea03ba03b633fdfbec03bdf3ba03ffabe00000000000000bc1024210c211000bc10282114211801bc182aa518a51c02bc102c211c212003bc142d731e732205bc182ea520a52407bc1c2f5222522609bc1030212421280cbc9230392539290fbc14317326732a13bc9631ce27ce2b17bc1832a528a52c1bbc9a327329732d1fbc1c33522a522e24bc9e33422b422f2abc1034212c213030bc5134a92ca93036bc9234392d39313cbcd334d22dd23143bc1435732e73324bbc55351c2f1c3352bc9635ce2fce335abcd7354430443463bc1836a530a5346bbc59360a310a3575bc9a36733173357ebcdb36e131e13588bc1c375232523692bc5d37c832c8369dbc9e3742334237a8bcdf37c033c037b4bc103821342138c0bc313864346438ccbc5138a934a938d9bc7238f034f038e6bc923839353939f3bcb3388535853901bdd338d235d2390fbdf4382236223a1ebd14397336733a2dbd3539c736c73a3dbd55391c371c3b4dbd76397437743b5ebd9639ce37ce3b6fbdb7391538153c80bdd7394438443c92bdf8397438743ca4bd183aa538a53cb7bd393ad738d73ccbbd593a0a390a3ddebd7a3a3e393e3df3bd9a3a7339733d08bebb3aa939a93d1dbedb3ae139e13d33befc3a193a193e4abe1c3b523a523e61be3d3b8c3a8c3e79be5d3bc83ac83e92be7e3b043b043fabbe9e3b423b423fc4bebf3b803b803fdfbedf3bc03bc03ffabe003c003c004016bf
+
+//!HOOK MAIN
+//!BIND HOOKED
+//!BIND PHOSPHOR_CRT_LUT
+//!DESC Phosphor CRT Effect
+
+vec4 hook() {
+    vec2 uv = HOOKED_pos;
+
+    // ===== Fetch: screen curvature + chromatic aberration =====
+    vec2 n = uv * 2.0 - 1.0;
+    vec4 lut = texture(PHOSPHOR_CRT_LUT, abs(n) * 0.9843750 + 0.0078125);
+    vec3 warp = vec3(sign(n.x), sign(n.y), sign(n.y)) * lut.rgb;
+    float k = CRT_CURVATURE_AMOUNT;
+    vec2 cuv = (n + k * vec2(warp.x, warp.y + k * (warp.z + k * n.y * warp.x * warp.x)) + 1.0) * 0.5;
+    float r = HOOKED_texOff(cuv + vec2( CRT_CHROMA_OFFSET, 0.0)).r;
+    float g = HOOKED_tex(cuv).g;
+    float b = HOOKED_texOff(cuv + vec2(-CRT_CHROMA_OFFSET, 0.0)).b;
+    vec4 col = vec4(r, g, b, 1.0);
+
+    // ===== CRT vignette: pow(1 - dist, power) from the baked log2 =====
+    float vignette = exp2(CRT_VIGNETTE_POWER * lut.a);
+    col.rgb *= mix(1.0, vignette, CRT_VIGNETTE_STRENGTH);
+
+    return col;
+}
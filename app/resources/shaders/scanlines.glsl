@@ -0,0 +1,46 @@
+//!PARAM SCAN_DENSITY
+//!DESC Vertical scanline frequency
+//!TYPE float
+//!MINIMUM 300.000000
+//!MAXIMUM 900.000000
+600.000000
+
+//!PARAM SCAN_DARK_LEVEL
+//!DESC Brightness of dark scanlines
+//!TYPE float
+//!MINIMUM 0.820000
+//!MAXIMUM 0.820000
+0.820000
+
+//!PARAM SCAN_BRIGHT_LEVEL
+//!DESC Brightness between scanlines
+//!TYPE float
+//!MINIMUM 1.050000
+//!MAXIMUM 1.050000
+1.050000
+
+//!PARAM SCAN_STRENGTH
+//!DESC Overall scanline intensity
+//!TYPE float
+//!MINIMUM 0.000000
+//!MAXIMUM 2.000000
+1.000000
+
+//!HOOK MAIN
+//!BIND HOOKED
+//!DESC Scanlines Overlay
+
+vec4 hook() {
+    vec4 c = HOOKED_tex(HOOKED_pos);
+
+    // ===== Scanline pattern =====
+    float scan = sin(HOOKED_pos.y * SCAN_DENSITY) * 0.5 + 0.5;
+
+    // Interpolate between dark and bright regions
+    float modulation = mix(SCAN_DARK_LEVEL, SCAN_BRIGHT_LEVEL, scan);
+
+    // Apply scanline modulation with brightness compensation
+    c.rgb *= mix(1.0, modulation, SCAN_STRENGTH);
+
+    return c;
+}
@@ -0,0 +1,55 @@
+//!PARAM VHS_GRAIN_STRENGTH
+//!DESC Pixel noise intensity
+//!TYPE float
+//!MINIMUM 0.000000
+//!MAXIMUM 0.060000
+0.030000
+
+//!PARAM VHS_FLICKER_STRENGTH
+//!DESC Frame-based brightness flicker
+//!TYPE float
+//!MINIMUM 0.000000
+//!MAXIMUM 0.020000
+0.010000
+
+//!PARAM VHS_LINE_DENSITY
+//!DESC Number of horizontal glitch lines
+//!TYPE float
+//!MINIMUM 10.000000
+//!MAXIMUM 10.000000
+10.000000
+
+//!PARAM VHS_GLITCH_AMOUNT
+//!DESC Horizontal glitch displacement strength
+//!TYPE float
+//!MINIMUM 0.000000
+//!MAXIMUM 0.040000
+0.020000
+//!TEXTURE PHOSPHOR_NOISE
+//!SIZE 64 64
+//!FORMAT r8
+//!FILTER NEAREST
+//!BORDER REPEAT
+bafdad9c6ec5247c8d195838cca3635fc64bb6be8082ecd0b9f260a74cdeaf2bd130c9544319f8a169c993085d9ed538ed6c3afa8b613e6c0db8706315e5d955ff763f14d38522290e9d6432b8dc196c4c61d89f711bbb1605408271d23430bbbf3e8c9b1ba78293a2df5dd446dee4c630429d8e364bcf06b10a2e21251b866928c4ada79388edafbce0946a6e35b04b7b276da4b6313400ac775f4001651d3c52350e13de99f50903bc03192d2bba58bd627394bad68529877d6b9d8e228469da1520871e4b63ef8834e95560e204e9d3330b4d95f319e4f945c9a65639051b023f0d980be9ce384a6c30f704212168ff2da005c93441252176f595855763c7038cedf005616dc32d4b00ae3e0871d69a9ea028af2140ebba617a0b769120a3daa26dfe5744a50184374360569626cc6ca8f9b026330bc06d0e74b1a89737ce2c9ec1b45f42393dccf48861989e50f9614667af3bdb930c6b36768f4b787aa7de4ec98b7b10c8e9e332dca7895b92bf6909e7dedebfb10c53ce0fa8d753f0c7d10c069d3274193cb28708970c6fa90bb519c483e34fd6ac8364917a330ad3f2ffe47cc0635e47e7f9119d41888c8ef894dd41f7d4ad62c4d6868da1c5d8c5e98effc388645e74f7a8054aadfc57e6ec68eb2cafbf9f0ba6caafcb919c4a2688e1e8157a30b291e58dbc38e1ca72d71d1d8bc9e7d77b03fb6d8035dbbf9a75d271ccee069ef052e0cec5762fb03ba1980d58df9a16d6d78d83539a2d0aaa8acf8097624d00fae1473b6e69ddfce4c2429f1fe0b8dfec3e2b49d05cb67dd5294120648ca3a2d73ca63470fd392aa52c1e908a9ff510738136513b25cfcfa959581f9ca27e2d80d23ea99314fdc3bce4aa8be405adba718edf6e15dbe280ad2c4608546ea90930be0eb19ba2732ec4780a9ac2fc25218ceac969b0033dce8b51a140a0039f15b4ede943266642f2cf74720d259fa38291e143ed64686a61e97d942d10935077e957219edf35a4ed6514b4fa50269af05da57d56d7b4839afef50bc1670e886b788761a66f7d3debf0f3952358638abfce8be503bc1dcbb0c245da2d1269ae2b0b4c5aeebb5bd03b512ebef90348406b6bc762d2c2b4ca6a671997b980765478593e4627dce76659e747b410767ab42b168ae2722efcde7106f8d0ab136bfa63a831a4fe06e23749f2449e01b777396f1713d7457066ae874fc5f53989195615e488ec5feceb11a792d7f8ef889955787d866f26cfcaa69bbe29cb8d54d5bc9fda96684716f3cc078173b808d89d5d8093cda5adac9544e52c4b8f08e261895c84af8154efcee2cf222ed861968c7b55b1196fbb02e772f7d5dfecbf1a31d79a83a9bf8d5cd12a4abbe0f352d893d9f512eda6a4e73afb5d5adb8fb82b5236b8fb57c40c8dc92fcae09129978b7e9bacb5f6699f9bfe63da59ea42ec5ca874d238e380cc4e1484740818beb0312764fce4dda8b77489570381f2f7b3d2c35eb91a5d93fb69adf3e65a2c18fdfa68e33c29432f0bb3852527b965427540c8dd1b7941d5b893a80a8197429d8c2818cfe6d6c5cb787ff73e834ae8cec5fa7ac60eef220fedbb297a5bc2ec8f0ef5f929b27a3787e431792d2b6c2d57fb1f84b5363f4fc8810541ef6613b23dfaec6759fe34df8fcde71e5995e445b282920dc7e12a22638d22f5334fc2f05e52be22cf04de3447e2b2664c6ed3928190d24e3e792c48dd3c83027c1f05988633e2c32b5cce3ea9b7b1d00c4bebd9fdd52bd3b2885b0e45096d13662d2963d25a40f60b136305ddb8d1c2dabff6d4ccaae7352384de7c8d320603c6921845794db3ded92cb454973772c5ffeecd5a8ab0592838dd23b151f846ece38ef2fb0f27d110a61e1b35b3f1af4aba876e824d63dacb54043b9df40bad7099d19f845167be34fc64ca0af0973d96dc66c09c8e4c3334748372b3c014d9f446984f652f1487e551a56a185cfcbca276034978e739969d978a3c43dd68ae7f0f05bf828d4b9adccbf6dc65c4d4a744272138b354d4c1b82fc93d27f53cc3f8acebef5d4038e57284e7bcd2c88e246d7cc2fb9075c7990e49311760a540baa82acb9b472e044a6783d2eea8ef3bcc92549dc76c4557c1bc84943736960da7930f6eda7809c13069d387a532b2a02d38357a467ebcd8e66d6bf993ebb9ec362e5d816ce2696e4eeedeffc83a7ee3a3226b54d9ac97f2c488c3ee4003ced336b5fe3aa75925d8272ae8e5785c32db5ebb62342dd951da3c21e0094402d7b04459c2668369d5edae960460399162cd35cd62bac9013e83ef706ec29b540388ec8a93880fa659fd87be917223238beb56fcbd8d395aa27597920a77587b1be8e2265e906f590904fb389f7297a67e6730a94dc176af01036e5864a6cd688e456597ae602cc9bdd33e5e045b8f1d2b524d4174c46081bfeb20a31b956d74199021aa70b425cff632b329187945d588d86b60f822cdcebc285c58e38f44d0fed3051b36598c2ae9588016a4ce1111a87f5d626552fcc71d5866d7adec010489cd5073f86134dd770cad688d3c32c8761b238a45d246392acfb6e984372b8eee6471aa43847280f6c53decdb7f3609e223b68d9ed69159ebd7739118924d347b8a5403f8b7c5e95526a6fe911d83957997ba281dc1e5e8021689bf5f39e71178268709d7a5e81b1adc27b7a868867220c4fe517ddf9def705e3011581478041d7de1ee7dc54f6b48e9787530dcd0ffdd0df83884b9cd8706a17caf1f7283e68833c12396471e999f98886ceac68b0fb3c7f3293c1b8a56920c0327c9d92a6d59c460451e1773709fd891d446181091b5050aa3819ccd62e893983692fc49148254484bb94577f50ed8a6b4bc19f50b8c9e637c8932aa5bf361c9db4d9dce14493269755f8a9ac40adbe7b3646de9654e94079207bd4d5bcfe7c578622f8d8deb3fc44594b7561307ee8087914a8380c0514804087a5ed79020a581fcfc4e93be774e39a19f8ad72a7c415a20fb1fd823c53b2b383229873e9eeaa701293a7054454b4e9a5d37a7d18513c61fdf7af6d8f181f9a185e5268d7ce6463bebfc6372477b4b22b165fff54e814b68c9dd638c73f4037ee2b88252f82beeac8761b16afe7db73962c9cfeda7118c7a8c0dfe361bed694737f50e6c84eed61bed5a7e47071c3ca761f103b434ef30fcf604ca43f5b22e937658ad5e16bf0dc4f14d04ee6b9d45c809c69d6fd43276829e760a41b4af304e3fe233dc46294d9e161773c459394254ada51e1c672656926ea7140e2e479abc92b985c76726f6cbed041e5c651038e06a55ba1567ac12ce6351fb56c244d95b6600d1e6725376789398250777927146c1c8d6dd69b46370d330c44a983a1e0991fee1c6ed9cd15f85971274b321d69c1d7b5b431c3b0a2326468b707523776e9b8fea5c8e49a5102bfbfbfb1f9fbc2aac093564ef5ebcdda42d7449c9da89f37354ffbd35f063f55dc6112805bb42b740c8bc0644d788d108121e26b2a71ba4822172b58ca82c4d95ae05ce88c178253aa263d073de319c763d706d67f0079a78bd89d82c7510d8b52516f5a21062f075c50ef8eca0e40813fb90be2c4346ca4ca384a578330a02205e1ad388764d5f9069cd53b0034882f780fcea755d4a50793e603bc8f07a12d3c0637aceb6f7955520165633e754400b96df72b758214049b310dff6909f28b654f42bfaa2c782c826b93c9f530d20ba73e1fd1098226718a034e02edce86c99a42cd98676142cfe67bb506ed822e9724b8b3c2ac972a8212371f6ec5ecfdb76a0aa477a90233950f4f3ab101c7170d5e9ecd7bd9c3024a7ba59bdb881fcef0344afb780cb123fc9b35aa8ea6654691c7625d70fcc7d31989b01841e2c0a9b6383f4e271c4b150a2be5596a60d5f7c45b06385cf7bd904ee3306d23ccdedd99e55c4e355cd384c9ecea1787f4ac6662be3d44e8d87463766619e0ffbeebfe9c9f4497327edba1e519b4202b725335f4555183adbb6564d9ef2f44d5e637c18ab38d491d8dbd41e3f023097b9bf00332f388977ecf0806870e65482c72e557748faa0a5a7cb9d5de08d0f5e2515c0a33c726ee326de47dd5cf662cc5d34dc22799629da8cbb4cccc2c91b5c2e95b2ad75802a0da3f028d5597eef5948fc341d9a0df59fb172c0141840ddab3d467bfa1ce91d9357dfcee1dd42dcaefbb3db06dc6550079b2f8a46018beaaab918b006b21ce0b326d435cc0cb0f7dad79ca96723f5ad434b7aac99dc7f1f4dc31b2da045dc4ce8474b47d0df66d5647f6baf57db5645808538b850c986df63d279e9d2cf0894a715cd6753f584c03efcb9519b0450d95fc3e5c0d0ae0525c61cf02e61eb06b60f35f9c1d491d0c895c077e0c11ad304215c49ac749959b1dbb5691b5015189f1bdd6be15e0f68287b849876a9998608fe2177f0a2d7f15362794dd1926b4316e0964449fa03eaa1d410dcadb9e68c5ed92bcbd87996a502a7b92a3b447922eb9f1ffd6683dc41f3c4b8b962949d8981d94b508af62d11689d31a8ae97d4230473c38c6b1f6451317cd3e9670fee5948d6c41941077de13c9a55d0d1abf2359d77c8601f8b924f18c1b113c5b5612299d95138ec6b5df53b2ddbb9bd682607b493149b260c473a83deedb93dda238e1a6f4698b5cbac1c87684bc63b70161349b83c1eb401655e53c4efa7d9c0e35a8bf3e18d7bd06cc59352aba99727665ca6c1eacc098e4d351abbebb5b1ccffff232002739c08e363ac6c03ff59f851e100117506f75050c58a25a65c497530616a1dbd1be0969f2d313c7c353d549ef20d5d5f7650d8d4df026856b3749c4f891ab97a8aa853eae35cd8f3e703535ccabcb36e40f74185c7ea6b8c23b23a33eba2dbfb089103b546a22c7474c2bb7a0ba8dbe7c9ebfc0fd06efcb716be694be7964224815bcfb230d41d5f29f1b98c10cecfdd4b92d417a37fdb411ed8ce0cd17eb5bfa9a40ffd69f6e3429a51ae6cce9542f9328b2c5e25e2ecde0eaad70248f3a40a4da851123fc5497068effc2e092d569fa5bd792256f02f417a4b0bfa28f6d7ef92cfdedc23dc429190eb68083f258627fb501d06721d7b2e6919fd625fd6195a43ebb9d3234631f8bd07c43054e3ecbda46354792624e96ecf94997a98f80702995c90cdef4e85b31fbbfc4bab6391a52700e078ae707176a66709269cc29ea2171838a150ced88e56572483d0056999b830070843d49bba90460236150e04f27a3c25117ab5d72049a6e939c3143cf9036baf2f9f2151c19de2781ba6b7a9c31f2022ea3aefd12242504d875175e553139660f7f8eb20343b699cfb00882cadc059bfd9e0dcf1689232c39cbc22ecf2406e6de7967651a06220d1f0e1568301137760cd5a286ee9a8877bb15012cb2e535c9d6b5d2249a17797ea8d8a3b6e4dc02cc7c2e656609e81a3b6ace593adae9cdc39876dad26e9bb8eba3156c821b01ab6e47f65fba951e1c793db00034ae1752fa07fb040c6f0cb8b1c4c89f9f269a1ad490fbc0cb7bed89066c690e8d834c59d8ab63107bdfee5a39f580fa84348794fb585e3202896bb1080192314e1a324e960519b95d41edd9d1a4d83c9d06ec42ec3ce52f492940bc521d96e6aa45430bbff9ed30416d8fb9edd1c62fb1d1347873274b05f0398e3639c8f75a9244efba823ea4a149aa124377f6b8f9b91848e7f109da43d48d831b30d246ce8860f3b4dfd20eef31663aba637de9d52dc34052f3f8f242b3b29f382c2989395ea6a96c4dc04129305
+
+//!HOOK MAIN
+//!BIND HOOKED
+//!BIND PHOSPHOR_NOISE
+//!DESC VHS: dynamic grain + horizontal glitch
+
+vec4 hook() {
+    vec4 col = HOOKED_tex(HOOKED_pos);
+
+    // ===== Grain, flicker and glitch lines =====
+    float noise_frame = mod(float(frame), 4096.0);
+    vec2 noise_offset = mod(vec2(37.0, 23.0) * noise_frame + vec2(0.0, 29.0) * floor(noise_frame / 64.0), 64.0);
+    vec2 flicker_texel = vec2(mod(noise_frame, 64.0), floor(noise_frame / 64.0));
+    float grain = (texture(PHOSPHOR_NOISE, (floor(HOOKED_pos * HOOKED_size) + noise_offset + 0.5) / 64.0).r - 0.5)
+        * VHS_GRAIN_STRENGTH;
+    float flicker = (texture(PHOSPHOR_NOISE, (flicker_texel + 0.5) / 64.0).r - 0.5) * VHS_FLICKER_STRENGTH;
+    float glitch = step(0.98, fract(HOOKED_pos.y * VHS_LINE_DENSITY + mod(float(frame), 50.0) * 0.02))
+        * VHS_GLITCH_AMOUNT;
+    col.rgb += grain + flicker - glitch;
+
+    return clamp(col, 0.0, 1.0);
+}
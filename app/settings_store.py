@@ -0,0 +1,184 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2026 Michael Gasche
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+
+# File:        settings_store.py
+# Version:     1.0
+# Author:      Michael Gasche
+# Created:     2026-10
+# Product:     Phosphor
+# Description: Coalescing, atomic settings file writer running off the UI thread.
+
+
+import os
+import json
+import stat
+import tempfile
+import threading
+import time
+
+
+def _read_umask() -> int:
+    """Process umask; os.umask can only read it by setting it, so this runs once at import."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("Umask:"):
+                    return int(line.split()[1], 8)
+    except (OSError, ValueError):
+        pass
+    mask = os.umask(0o022)
+    os.umask(mask)
+    return mask
+
+
+# Read on the main thread while the module is imported, before any worker can create files
+UMASK = _read_umask()
+
+
+def _file_mode(path: str) -> int:
+    """Mode of the existing file, else what a plain open() would create."""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except OSError:
+        return 0o666 & ~UMASK
+
+
+def write_json_atomic(path: str, data):
+    """
+    Atomic JSON write: temp file in the same directory, fsync, rename.
+    The file keeps its mode (mkstemp would leave it 0600).
+    """
+    directory = os.path.dirname(path) or "."
+    fd, tmp = tempfile.mkstemp(prefix=f".{os.path.basename(path)}-", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp, _file_mode(path))
+        os.replace(tmp, path)
+    except Exception:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+# -------------------------------
+# SettingsStore class
+# -------------------------------
+
+class SettingsStore:
+    """
+    Settings dict persisted as JSON. save() only marks the data dirty;
+    a background thread writes at most once per min_interval, always via
+    temp file + rename so a crash never leaves a truncated file.
+    """
+
+    def __init__(self, path: str, defaults: dict = None, min_interval: float = 0.5):
+        self.path = path
+        self.data = dict(defaults or {})
+        self.min_interval = min_interval
+
+        self._cond = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._pending = False
+        self._closed = False
+        self._last_write = 0.0
+
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+
+    # -------------------------------
+    # Public API
+    # -------------------------------
+
+    def load(self) -> bool:
+        """Merge the settings file into data; returns False if missing or unreadable."""
+        try:
+            with open(self.path, "r") as f:
+                self.data.update(json.load(f))
+            return True
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            print(f"Settings file unreadable, using defaults: {e}", flush=True)
+            return False
+
+    def save(self):
+        """Schedule a write of the current data (coalesced)."""
+        with self._cond:
+            self._pending = True
+            self._cond.notify()
+
+    def flush(self):
+        """Write pending changes now (blocking)."""
+        self._write_pending()
+
+    def close(self):
+        """Flush pending changes and stop the writer thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join(timeout=2.0)
+        self._write_pending()
+
+
+    # -------------------------------
+    # Writer
+    # -------------------------------
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+
+                # Rate limit: let further changes pile up until the interval has passed
+                delay = self._last_write + self.min_interval - time.monotonic()
+                while delay > 0 and not self._closed:
+                    self._cond.wait(delay)
+                    delay = self._last_write + self.min_interval - time.monotonic()
+                if self._closed:
+                    return
+
+            self._write_pending()
+
+    def _write_pending(self):
+        with self._write_lock:
+            with self._cond:
+                if not self._pending:
+                    return
+                self._pending = False
+                snapshot = dict(self.data)
+            self._write(snapshot)
+            self._last_write = time.monotonic()
+
+    def _write(self, data: dict):
+        try:
+            write_json_atomic(self.path, data)
+        except Exception as e:
+            print(f"Settings write failed: {e}", flush=True)
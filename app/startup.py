@@ -0,0 +1,98 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2026 Michael Gasche
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+
+# File:        startup.py
+# Version:     1.0
+# Author:      Michael Gasche
+# Created:     2026-10
+# Product:     Phosphor
+# Description: Per-phase startup timing (time-to-first-window, time-to-first-frame).
+
+
+import os
+import json
+import time
+import threading
+
+
+# Optional JSON report file (kiosk boot scripts)
+REPORT_ENV = "PHOSPHOR_STARTUP_REPORT"
+
+
+# -------------------------------
+# StartupTimer class
+# -------------------------------
+
+class StartupTimer:
+    """
+    Records named startup phases relative to process start (the import
+    of this module). The report is printed once every expected phase
+    has been marked, and written as JSON if PHOSPHOR_STARTUP_REPORT is set.
+    """
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.marks = {}
+        self._expected = set()
+        self._reported = False
+        self._lock = threading.Lock()
+
+    def expect(self, *names):
+        """Phases that must be marked before the report is emitted."""
+        with self._lock:
+            self._expected.update(names)
+
+    def mark(self, name: str):
+        """Record a phase (first mark wins); reports when all expected phases are in."""
+        with self._lock:
+            if name in self.marks:
+                return
+            self.marks[name] = time.perf_counter() - self.start
+            done = not self._reported and self._expected <= set(self.marks)
+            if done:
+                self._reported = True
+        if done:
+            self.report()
+
+    def report(self) -> dict:
+        with self._lock:
+            phases = sorted(self.marks.items(), key=lambda item: item[1])
+
+        print("Startup timing:", flush=True)
+        previous = 0.0
+        for name, t in phases:
+            print(f"  {name:<16} {t * 1000:8.1f} ms  (+{(t - previous) * 1000:.1f} ms)", flush=True)
+            previous = t
+
+        result = {name: round(t * 1000, 1) for name, t in phases}
+        path = os.environ.get(REPORT_ENV)
+        if path:
+            try:
+                with open(path, "w") as f:
+                    json.dump({"unit": "ms", "phases": result}, f, indent=2)
+            except OSError as e:
+                print(f"Startup report not written: {e}", flush=True)
+        return result
+
+
+# Process-wide timer, started when phosphor.py imports this module
+STARTUP = StartupTimer()
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Round-trip latency benchmark of the JSON-RPC control server (control_server.py).
+
+Measures single calls, batches and many concurrent clients with a local
+client. By default a server with no-op methods runs in this process, and
+its dispatcher hops to one executor thread like the Qt thread in the app.
+--connect measures a running Phosphor instance instead (read-only
+"ping"/"status" calls):
+
+    python benchmark_control.py --clients 1 8 32
+    PHOSPHOR_CONTROL=1 python ../phosphor.py &
+    python benchmark_control.py --connect ~/.Phosphor/control.sock
+"""
+import os
+import sys
+import json
+import math
+import time
+import argparse
+import platform
+import tempfile
+import threading
+
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+# Server and client are shared with the app
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from control_server import ControlClient, ControlServer, default_address
+
+
+def percentiles(values, points=(50, 95, 99)):
+    """Nearest-rank percentiles in milliseconds (values in seconds)."""
+    if not values:
+        return {f"p{p}": None for p in points}
+    ordered = sorted(values)
+    result = {}
+    for p in points:
+        index = min(len(ordered) - 1, max(0, math.ceil(p / 100.0 * len(ordered)) - 1))
+        result[f"p{p}"] = ordered[index] * 1000.0
+    return result
+
+
+# Calls per request: read-only ones for a running instance, plus player commands locally
+CASES = {
+    "ping": [("ping", {})],
+    "status": [("status", {})],
+    "seek": [("seek", {"seconds": 1.0})],
+    "preset+seek": [("preset", {"name": "80s TV"}), ("seek", {"seconds": 30.0, "mode": "absolute"})],
+}
+REMOTE_CASES = ["ping", "status"]
+
+
+def local_server(directory: str, tcp: bool):
+    """Server with no-op player methods; dispatch hops to one thread (like the Qt thread)."""
+    state = {"paused": False, "position": 0.0, "levels": {}}
+
+    def seek(seconds: float, mode: str = "relative"):
+        state["position"] = seconds if mode == "absolute" else state["position"] + seconds
+        return True
+
+    methods = {
+        "ping": lambda: True,
+        "status": lambda: dict(state),
+        "pause": lambda: state.update(paused=True) or True,
+        "seek": seek,
+        "set_level": lambda effect, level: state["levels"].update({effect: level}) or level,
+        "preset": lambda name: True,
+    }
+    executor = ThreadPoolExecutor(max_workers=1)
+    address = "127.0.0.1:0" if tcp else default_address(directory)
+    server = ControlServer(methods, address, dispatch=lambda fn: executor.submit(fn))
+    server.start()
+    return server, executor
+
+
+def run_calls(address: str, case: str, count: int, batch: int = 1):
+    """Round-trip times of count requests (the case calls repeated batch times, as one batch if several)."""
+    calls = CASES[case] * batch
+    client = ControlClient(address)
+    times = []
+    try:
+        for _ in range(count):
+            started = time.perf_counter()
+            if len(calls) > 1:
+                responses = client.batch(calls)
+                errors = [r["error"] for r in responses if "error" in r]
+                if errors:
+                    raise RuntimeError(f"{case}: {errors[0]['message']}")
+            else:
+                method, params = calls[0]
+                client.call(method, **params)
+            times.append(time.perf_counter() - started)
+    finally:
+        client.close()
+    return times
+
+
+def run_case(address: str, case: str, clients: int, count: int, batch: int):
+    """clients connections in parallel, count requests each; latency percentiles and throughput."""
+    results = [None] * clients
+
+    def worker(index):
+        results[index] = run_calls(address, case, count, batch)
+
+    run_calls(address, case, 20, batch)  # warm-up (connection setup, first dispatch)
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(clients)]
+    started = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    seconds = time.perf_counter() - started
+
+    times = [t for r in results for t in r]
+    return {
+        "case": case,
+        "clients": clients,
+        "batch": batch,
+        "calls_per_request": len(CASES[case]) * batch,
+        "requests": len(times),
+        "calls_per_second": len(times) * len(CASES[case]) * batch / seconds if seconds > 0 else 0.0,
+        "latency_ms": percentiles(times),
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the control server round-trip latency.")
+    parser.add_argument("--connect", help="address of a running instance (socket path or host:port)")
+    parser.add_argument("--tcp", action="store_true", help="local server on loopback TCP instead of a Unix socket")
+    parser.add_argument("--clients", nargs="+", type=int, default=[1, 8, 32], help="concurrent client connections")
+    parser.add_argument("--batches", nargs="+", type=int, default=[1, 8], help="calls per request")
+    parser.add_argument("--count", type=int, default=500, help="requests per client")
+    parser.add_argument("--output", default="bench_control.json")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    server = executor = None
+    with tempfile.TemporaryDirectory(prefix="phosphor-control-") as tmp:
+        if args.connect:
+            address, cases = os.path.expanduser(args.connect), REMOTE_CASES
+        else:
+            server, executor = local_server(tmp, args.tcp)
+            address, cases = server.address, list(CASES)
+
+        results = []
+        try:
+            for case in cases:
+                for batch in args.batches:
+                    for clients in args.clients:
+                        r = run_case(address, case, clients, args.count, batch)
+                        results.append(r)
+                        lat = r["latency_ms"]
+                        print(f"{case:<11} batch {batch:<3} clients {clients:<3}: "
+                              f"p50 {lat['p50']:7.3f} ms p95 {lat['p95']:7.3f} ms p99 {lat['p99']:7.3f} ms "
+                              f"{r['calls_per_second']:9.0f} calls/s", flush=True)
+        finally:
+            if server is not None:
+                server.stop()
+                executor.shutdown()
+
+    report = {
+        "system": {
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "python": platform.python_version(),
+        },
+        "address": address,
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Wrote {args.output}", flush=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmark of the NumPy reference renderer (player/reference.py).
+
+Renders batches of synthetic frames for every effect combination and
+records frames/s and megapixels/s per resolution and batch size. Runs on
+any CPU, no GPU or mpv needed:
+
+    python benchmark_reference.py --resolutions 360p 720p --batches 1 8
+"""
+import sys
+import json
+import time
+import argparse
+import platform
+
+from pathlib import Path
+
+# Renderer and parameter tables are shared with the player
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import numpy as np
+
+from player.reference import ReferenceRenderer, test_pattern
+from player.shader_builder import EFFECTS, EFFECT_SETS
+
+RESOLUTIONS = {
+    "thumb": (320, 180),
+    "360p": (640, 360),
+    "720p": (1280, 720),
+    "1080p": (1920, 1080),
+}
+
+
+def run_case(resolution, effects, batch, frames, level):
+    width, height = RESOLUTIONS[resolution]
+    renderer = ReferenceRenderer(effects, {e: level for e in EFFECTS})
+    source = np.repeat(test_pattern(width, height)[None], batch, axis=0)
+
+    # First call builds the per-size geometry (not measured)
+    renderer.render(source, 0)
+
+    rendered = 0
+    started = time.perf_counter()
+    while rendered < frames:
+        renderer.render(source, rendered)
+        rendered += batch
+    seconds = time.perf_counter() - started
+
+    fps = rendered / seconds if seconds > 0 else 0.0
+    return {
+        "resolution": resolution,
+        "effects": list(effects),
+        "batch": batch,
+        "level": level,
+        "frames": rendered,
+        "fps": fps,
+        "megapixels_per_second": fps * width * height / 1e6,
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the NumPy reference renderer.")
+    parser.add_argument("--resolutions", nargs="+", default=["thumb", "720p"], choices=list(RESOLUTIONS))
+    parser.add_argument("--batches", nargs="+", type=int, default=[1, 8], help="frames per render() call")
+    parser.add_argument("--frames", type=int, default=48, help="frames rendered per case")
+    parser.add_argument("--level", type=float, default=0.0)
+    parser.add_argument("--output", default="bench_reference.json")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    results = []
+    for resolution in args.resolutions:
+        for effects in EFFECT_SETS:
+            for batch in args.batches:
+                r = run_case(resolution, effects, batch, args.frames, args.level)
+                results.append(r)
+                print(f"{resolution:>5} batch {batch:<3} {' + '.join(effects) or 'clean':<22}: "
+                      f"{r['fps']:8.1f} fps {r['megapixels_per_second']:8.1f} MP/s", flush=True)
+
+    report = {
+        "system": {
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+        },
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Wrote {args.output}", flush=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
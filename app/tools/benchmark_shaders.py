@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Render-throughput benchmark for every effect combination and level.
+
+Plays synthetic testsrc2 sources untimed through vo=gpu-next with the same
+shader selection as the player and records sustained fps, frame-time
+percentiles (wall clock and mpv's GPU pass timers) and libmpv CPU time per case.
+
+GPU-less Linux (Mesa llvmpipe):
+    xvfb-run -a -s "-screen 0 3840x2160x24" python benchmark_shaders.py --software
+"""
+import os
+import sys
+import json
+import math
+import time
+import locale
+import argparse
+import platform
+import tempfile
+import threading
+
+from pathlib import Path
+
+# Shader selection and parameter tables are shared with the player
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from player.effects import chain_shader_files, fused_shader_files
+from player.shader_builder import EFFECTS, EFFECT_PLACEMENTS, EFFECT_SETS, format_shader_opts, shader_opts
+
+RESOLUTIONS = {
+    "720p": (1280, 720),
+    "1080p": (1920, 1080),
+    "4k": (3840, 2160),
+}
+
+SOURCE_FPS = 60
+
+
+def percentiles(values, points=(50, 95, 99)):
+    """Nearest-rank percentiles in milliseconds (values in seconds)."""
+    if not values:
+        return {f"p{p}": None for p in points}
+    ordered = sorted(values)
+    result = {}
+    for p in points:
+        index = min(len(ordered) - 1, max(0, math.ceil(p / 100.0 * len(ordered)) - 1))
+        result[f"p{p}"] = ordered[index] * 1000.0
+    return result
+
+
+def gpu_frame_times(passes):
+    """Per-frame GPU time (seconds) summed over all fresh render passes."""
+    fresh = (passes or {}).get("fresh") or []
+    series = [p.get("samples") or [] for p in fresh]
+    if not series:
+        return []
+    length = min(len(s) for s in series)
+    series = [s[len(s) - length:] for s in series]
+    return [sum(frame) / 1e9 for frame in zip(*series)]
+
+
+def mpv_cpu_seconds():
+    """
+    CPU time of libmpv's native threads: Python threads (the harness and
+    the event callbacks) are left out on Linux; elsewhere the whole process.
+    """
+    if not sys.platform.startswith("linux"):
+        return time.process_time()
+    python = {t.native_id for t in threading.enumerate()}
+    total = 0
+    for tid in os.listdir("/proc/self/task"):
+        if int(tid) in python:
+            continue
+        try:
+            with open(f"/proc/self/task/{tid}/stat") as f:
+                fields = f.read().rsplit(")", 1)[1].split()
+        except OSError:
+            continue  # thread ended meanwhile
+        total += int(fields[11]) + int(fields[12])  # utime + stime
+    return total / os.sysconf("SC_CLK_TCK")
+
+
+def run_case(mpv, args, shader_dir, resolution, effects, level, mode):
+    width, height = RESOLUTIONS[resolution]
+    total = args.warmup + args.frames
+
+    kwargs = dict(
+        vo=args.vo,
+        audio="no",
+        osc=False,
+        hwdec="no",
+        untimed=True,
+        keep_open=True,
+        geometry=f"{width}x{height}",
+        input_default_bindings=False,
+        loglevel="error",
+    )
+    if args.gpu_api:
+        kwargs["gpu_api"] = args.gpu_api
+    player = mpv.MPV(**kwargs)
+
+    try:
+        levels = {e: level for e in EFFECTS}
+        player["glsl-shader-opts"] = format_shader_opts(shader_opts(levels))
+        if mode == "fused":
+            player.glsl_shaders = fused_shader_files(shader_dir, effects, placement=args.placement,
+                                                     lowres_lines=args.lowres_lines)
+        else:
+            player.glsl_shaders = chain_shader_files(effects, args.placement, shader_dir)
+
+        # Frame counter changes arrive as property events (no polling in the harness);
+        # the first warmup frames (shader compile) are ignored
+        marks = []
+        cpu_marks = []
+
+        def on_frame(name, n):
+            now = time.perf_counter()
+            if n is not None and n >= args.warmup:
+                if not cpu_marks:
+                    cpu_marks.append(mpv_cpu_seconds())
+                marks.append((now, n))
+
+        player.observe_property("estimated-frame-number", on_frame)
+        player.play(f"av://lavfi:testsrc2=size={width}x{height}:rate={SOURCE_FPS}:duration={total / SOURCE_FPS}")
+        try:
+            player.wait_for_property("eof-reached", lambda eof: eof, timeout=args.timeout)
+        except TimeoutError:
+            print(f"Case timed out after {args.timeout:g} s", flush=True)
+        cpu = mpv_cpu_seconds() - cpu_marks[0] if cpu_marks else 0.0
+        player.unobserve_property("estimated-frame-number", on_frame)
+        passes = player["vo-passes"]
+    finally:
+        player.terminate()
+
+    frame_times = []
+    for (t0, n0), (t1, n1) in zip(marks, marks[1:]):
+        frame_times += [(t1 - t0) / (n1 - n0)] * (n1 - n0)
+
+    frames = marks[-1][1] - marks[0][1] if len(marks) > 1 else 0
+    seconds = marks[-1][0] - marks[0][0] if len(marks) > 1 else 0.0
+    return {
+        "resolution": resolution,
+        "effects": list(effects),
+        "level": level,
+        "mode": mode,
+        "placement": args.placement,
+        "lowres_lines": args.lowres_lines,
+        "frames": frames,
+        "fps": frames / seconds if seconds > 0 else 0.0,
+        "frame_time_ms": percentiles(frame_times),
+        "gpu_time_ms": percentiles(gpu_frame_times(passes)),
+        "cpu_seconds": cpu,
+        "cpu_ms_per_frame": cpu * 1000.0 / frames if frames else None,
+    }
+
+
+def compare(results, baseline_file, tolerance):
+    """Cases whose fps dropped by more than tolerance versus the baseline."""
+    with open(baseline_file, "r") as f:
+        baseline = json.load(f)
+
+    def key(r):
+        return (r["resolution"], tuple(r["effects"]), r["level"], r["mode"],
+                r.get("placement", "source"), r.get("lowres_lines", 0))
+
+    old = {key(r): r for r in baseline.get("results", [])}
+    regressions = []
+    for r in results:
+        before = old.get(key(r))
+        if before and before["fps"] > 0 and r["fps"] < before["fps"] * (1.0 - tolerance):
+            regressions.append((r, before))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark Phosphor shader combinations.")
+    parser.add_argument("--resolutions", nargs="+", default=list(RESOLUTIONS), choices=list(RESOLUTIONS))
+    parser.add_argument("--levels", nargs="+", type=float, default=[-5.0, 0.0, 5.0])
+    parser.add_argument("--modes", nargs="+", default=["fused", "chain"], choices=["fused", "chain"])
+    parser.add_argument("--placement", default="source", choices=list(EFFECT_PLACEMENTS),
+                        help="run effects at source or output resolution")
+    parser.add_argument("--lowres-lines", type=int, default=0,
+                        help="render scanlines/VHS at this height and upscale (fused mode, 0 = off)")
+    parser.add_argument("--frames", type=int, default=300, help="measured frames per case")
+    parser.add_argument("--warmup", type=int, default=30, help="frames skipped per case (shader compile)")
+    parser.add_argument("--timeout", type=float, default=120.0, help="seconds per case")
+    parser.add_argument("--vo", default="gpu-next")
+    parser.add_argument("--gpu-api", default="opengl")
+    parser.add_argument("--software", action="store_true", help="force Mesa's software rasterizer (llvmpipe)")
+    parser.add_argument("--output", default="bench_shaders.json")
+    parser.add_argument("--compare", help="baseline JSON; exit 1 on fps regressions")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="allowed fps drop vs. baseline")
+    args = parser.parse_args(argv)
+
+    if args.software:
+        os.environ["LIBGL_ALWAYS_SOFTWARE"] = "1"
+        os.environ.setdefault("GALLIUM_DRIVER", "llvmpipe")
+    if sys.platform.startswith("linux") and not (os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY")):
+        print("No display found; run under xvfb-run (see module docstring).", flush=True)
+        return 2
+
+    locale.setlocale(locale.LC_NUMERIC, "C")
+    import mpv
+
+    shader_dir = Path(tempfile.gettempdir()) / "Phosphor" / "bench"
+    results = []
+    for resolution in args.resolutions:
+        for effects in EFFECT_SETS:
+            # Clean has no shader: one case is enough
+            levels = args.levels if effects else [0.0]
+            modes = args.modes if effects else ["fused"]
+            for mode in modes:
+                for level in levels:
+                    r = run_case(mpv, args, shader_dir, resolution, effects, level, mode)
+                    results.append(r)
+                    print(f"{resolution:>5} {mode:<5} {' + '.join(effects) or 'clean':<22} {level:+.1f}: "
+                          f"{r['fps']:7.1f} fps  p95 {r['frame_time_ms']['p95'] or 0:6.2f} ms  "
+                          f"cpu {r['cpu_ms_per_frame'] or 0:5.2f} ms/frame", flush=True)
+
+    report = {
+        "meta": {
+            "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "vo": args.vo,
+            "gpu_api": args.gpu_api,
+            "software_gl": args.software,
+            "frames": args.frames,
+            "warmup": args.warmup,
+        },
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {args.output}", flush=True)
+
+    if args.compare:
+        regressions = compare(results, args.compare, args.tolerance)
+        for r, before in regressions:
+            print(f"REGRESSION {r['resolution']} {r['mode']} {'+'.join(r['effects'])} {r['level']:+.1f}: "
+                  f"{before['fps']:.1f} -> {r['fps']:.1f} fps", flush=True)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
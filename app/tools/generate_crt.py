@@ -1,65 +1,36 @@
 #!/usr/bin/env python3
+import sys
 from pathlib import Path
 
-# Underlying values for CRT
-BASE_PARAMS = {
-    "CURVATURE_AMOUNT": 0.05,   # Screen curvature strength
-    "CHROMA_OFFSET": 0.002,     # Horizontal chromatic aberration
-    "VIGNETTE_STRENGTH": 0.5,   # Vignette intensity
-    "VIGNETTE_POWER": 1.0       # Vignette falloff
-}
-
-# Scale -5 to +5
-SCALE = list(range(-5, 6))
+# Parameter tables are shared with the player (fused shader builder)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from player.shader_builder import CRT_LUT_TEXTURE, PARAM_DESCS, crt_lines, crt_lut_block, param_block
 
 SHADER_DIR = Path("../../shaders")
 SHADER_DIR.mkdir(parents=True, exist_ok=True)
 
-for i in SCALE:
-    if i == 0:
-        filename = SHADER_DIR / "crt_base_0.glsl"
-    else:
-        filename = SHADER_DIR / f"crt_base_{i}.glsl"
+filename = SHADER_DIR / "crt_base.glsl"
+
+# Strength is set at runtime via glsl-shader-opts (levels -5..+5, see shader_builder.py)
+params = "\n".join(param_block("crt", key, desc) for key, desc in PARAM_DESCS["crt"].items())
 
-    # Scaling: +/-20% per level
-    curvature = BASE_PARAMS["CURVATURE_AMOUNT"] * (1 + 0.2 * i)
-    chroma = BASE_PARAMS["CHROMA_OFFSET"] * (1 + 0.2 * i)
-    vignette_strength = min(max(BASE_PARAMS["VIGNETTE_STRENGTH"] * (1 + 0.15 * i), 0.0), 1.0)
-    vignette_power = max(BASE_PARAMS["VIGNETTE_POWER"] * (1 + 0.1 * i), 0.1)
+# Warp basis and vignette falloff depend on screen position only: baked into a lookup texture.
+# The baking lives in shader_builder.py because the fused shader and the reference renderer embed the same table
+lut = crt_lut_block()
 
-    content = f"""//!HOOK MAIN
+content = params + lut + f"""
+//!HOOK MAIN
 //!BIND HOOKED
+//!BIND {CRT_LUT_TEXTURE}
 //!DESC Phosphor CRT Effect
 
-// ===== CRT parameters =====
-const float CURVATURE_AMOUNT      = {curvature:.4f};  // Screen curvature strength
-const float CHROMA_OFFSET         = {chroma:.4f};  // Horizontal chromatic aberration
-const float VIGNETTE_STRENGTH     = {vignette_strength:.4f};  // Vignette intensity
-const float VIGNETTE_POWER        = {vignette_power:.4f};  // Vignette falloff curve
-
 vec4 hook() {{
     vec2 uv = HOOKED_pos;
 
-    // ===== Screen curvature =====
-    vec2 n = uv * 2.0 - 1.0;
-    n.x *= 1.0 + CURVATURE_AMOUNT * (n.y * n.y);
-    n.y *= 1.0 + CURVATURE_AMOUNT * (n.x * n.x);
-    vec2 cuv = (n + 1.0) * 0.5;
-
-    // ===== Chromatic aberration =====
-    float r = HOOKED_texOff(cuv + vec2( CHROMA_OFFSET, 0.0)).r;
-    float g = HOOKED_tex(cuv).g;
-    float b = HOOKED_texOff(cuv + vec2(-CHROMA_OFFSET, 0.0)).b;
-    vec3 col = vec3(r, g, b);
-
-    // ===== Vignette =====
-    float dist = distance(uv, vec2(0.5));
-    float vignette = pow(1.0 - dist, VIGNETTE_POWER);
-    col *= mix(1.0, vignette, VIGNETTE_STRENGTH);
-
-    return vec4(col, 1.0);
+{chr(10).join(crt_lines("HOOKED", "uv"))}
+    return col;
 }}
 """
-    with open(filename, "w") as f:
-        f.write(content)
-    print(f"Generated {filename}")
+with open(filename, "w") as f:
+    f.write(content)
+print(f"Generated {filename}")
@@ -1,57 +1,39 @@
 #!/usr/bin/env python3
+import sys
 from pathlib import Path
 
-# Base values for scan lines
-BASE_PARAMS = {
-    "SCANLINE_DENSITY": 600.0,
-    "DARK_LEVEL": 0.82,
-    "BRIGHT_LEVEL": 1.05,
-    "STRENGTH": 1.0
-}
-
-# Scale from -5 to +5
-SCALE = list(range(-5, 6))
+# Parameter tables are shared with the player (fused shader builder)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from player.shader_builder import PARAM_DESCS, param_block
 
 SHADER_DIR = Path("../../shaders")
 SHADER_DIR.mkdir(parents=True, exist_ok=True)
 
-for i in SCALE:
-    if i == 0:
-        filename = SHADER_DIR / "scanlines_0.glsl"
-    else:
-        filename = SHADER_DIR / f"scanlines_{i}.glsl"
+filename = SHADER_DIR / "scanlines.glsl"
 
-    # Calculate parameter changes
-    # SCANLINE_DENSITY ±10% per step
-    density = BASE_PARAMS["SCANLINE_DENSITY"] * (1 + 0.1 * i)
-    # STRENGTH ±0.2 per step, clamp between 0 and 2
-    strength = min(max(BASE_PARAMS["STRENGTH"] * (1 + 0.2 * i), 0.0), 2.0)
+# Strength is set at runtime via glsl-shader-opts (levels -5..+5, see shader_builder.py)
+params = "\n".join(param_block("scanlines", key, desc) for key, desc in PARAM_DESCS["scanlines"].items())
 
-    content = f"""//!HOOK MAIN
+content = params + """
+//!HOOK MAIN
 //!BIND HOOKED
 //!DESC Scanlines Overlay
 
-// ===== Scanline parameters =====
-const float SCANLINE_DENSITY = {density:.1f};  // Vertical scanline frequency
-const float DARK_LEVEL       = {BASE_PARAMS['DARK_LEVEL']:.2f};  // Brightness of dark scanlines
-const float BRIGHT_LEVEL     = {BASE_PARAMS['BRIGHT_LEVEL']:.2f};  // Brightness between scanlines
-const float STRENGTH         = {strength:.2f};  // Overall scanline intensity
-
-vec4 hook() {{
+vec4 hook() {
     vec4 c = HOOKED_tex(HOOKED_pos);
 
     // ===== Scanline pattern =====
-    float scan = sin(HOOKED_pos.y * SCANLINE_DENSITY) * 0.5 + 0.5;
+    float scan = sin(HOOKED_pos.y * SCAN_DENSITY) * 0.5 + 0.5;
 
     // Interpolate between dark and bright regions
-    float modulation = mix(DARK_LEVEL, BRIGHT_LEVEL, scan);
+    float modulation = mix(SCAN_DARK_LEVEL, SCAN_BRIGHT_LEVEL, scan);
 
     // Apply scanline modulation with brightness compensation
-    c.rgb *= mix(1.0, modulation, STRENGTH);
+    c.rgb *= mix(1.0, modulation, SCAN_STRENGTH);
 
     return c;
-}}
+}
 """
-    with open(filename, "w") as f:
-        f.write(content)
-    print(f"Generated {filename}")
+with open(filename, "w") as f:
+    f.write(content)
+print(f"Generated {filename}")
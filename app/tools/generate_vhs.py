@@ -1,67 +1,37 @@
 #!/usr/bin/env python3
+import sys
 from pathlib import Path
 
-# Underlying values for VHS
-BASE_PARAMS = {
-    "GRAIN_STRENGTH": 0.03,
-    "FLICKER_STRENGTH": 0.01,
-    "LINE_DENSITY": 10.0,
-    "GLITCH_AMOUNT": 0.02
-}
-
-# Scale -5 to +5
-SCALE = list(range(-5, 6))
+# Parameter tables are shared with the player (fused shader builder)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from player.shader_builder import NOISE_TEXTURE, PARAM_DESCS, noise_texture_block, param_block, vhs_noise_lines
 
 SHADER_DIR = Path("../../shaders")
 SHADER_DIR.mkdir(parents=True, exist_ok=True)
 
-for i in SCALE:
-    if i == 0:
-        filename = SHADER_DIR / "vhs_noise_0.glsl"
-    else:
-        filename = SHADER_DIR / f"vhs_noise_{i}.glsl"
+filename = SHADER_DIR / "vhs_noise.glsl"
+
+# Strength is set at runtime via glsl-shader-opts (levels -5..+5, see shader_builder.py)
+params = "\n".join(param_block("vhs", key, desc) for key, desc in PARAM_DESCS["vhs"].items())
 
-    # Scale calculations
-    grain = max(BASE_PARAMS["GRAIN_STRENGTH"] * (1 + 0.2 * i), 0.0)
-    flicker = max(BASE_PARAMS["FLICKER_STRENGTH"] * (1 + 0.2 * i), 0.0)
-    glitch = max(BASE_PARAMS["GLITCH_AMOUNT"] * (1 + 0.2 * i), 0.0)
+# Noise comes from a seeded, embedded texture instead of per-pixel sin hashes (same output on every GPU)
+noise = noise_texture_block()
 
-    content = f"""//!HOOK MAIN
+content = params + noise + f"""
+//!HOOK MAIN
 //!BIND HOOKED
+//!BIND {NOISE_TEXTURE}
 //!DESC VHS: dynamic grain + horizontal glitch
 
-// ===== VHS parameters =====
-const float GRAIN_STRENGTH   = {grain:.4f};  // Pixel noise intensity
-const float FLICKER_STRENGTH = {flicker:.4f};  // Frame-based brightness flicker
-const float LINE_DENSITY     = {BASE_PARAMS['LINE_DENSITY']:.1f};  // Number of horizontal glitch lines
-const float GLITCH_AMOUNT    = {glitch:.4f};  // Horizontal glitch displacement strength
-
 vec4 hook() {{
     vec4 col = HOOKED_tex(HOOKED_pos);
 
-    // ===== Noise generation =====
-    float grain = (
-        fract(
-            sin(dot(HOOKED_pos.xy + float(frame), vec2(12.9898, 78.233)))
-            * 43758.5453
-        ) - 0.5
-    ) * GRAIN_STRENGTH;
-
-    // Subtle frame-to-frame flicker
-    float flicker = (
-        fract(sin(float(frame) * 12.9898) * 43758.5453) - 0.5
-    ) * FLICKER_STRENGTH;
-
-    // Horizontal glitch lines
-    float yPos = HOOKED_pos.y * LINE_DENSITY;
-    float glitch = step(0.98, fract(yPos + float(frame) * 0.02)) * GLITCH_AMOUNT;
-
-    // ===== Apply effect =====
-    col.rgb += grain + flicker - glitch;
+    // ===== Grain, flicker and glitch lines =====
+{chr(10).join(vhs_noise_lines("HOOKED_pos", "HOOKED_size"))}
 
     return clamp(col, 0.0, 1.0);
 }}
 """
-    with open(filename, "w") as f:
-        f.write(content)
-    print(f"Generated {filename}")
+with open(filename, "w") as f:
+    f.write(content)
+print(f"Generated {filename}")
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Loopback HTTP server with a bandwidth limit, to test cache profiles against
+a slow source (NAS/SMB-like) without a network share:
+
+    python slow_http_server.py ~/Videos --rate 2.5 --latency 0.05
+    mpv http://127.0.0.1:8765/clip.mp4   (or open the URL in Phosphor)
+
+Supports Range requests, so mpv can seek.
+"""
+import os
+import sys
+import time
+import argparse
+import mimetypes
+
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import unquote, urlparse
+
+CHUNK = 64 * 1024
+
+
+class ThrottledHandler(BaseHTTPRequestHandler):
+    root = "."
+    rate = 1.0 * 1024 * 1024  # bytes per second, per connection
+    latency = 0.0  # seconds before each response
+
+    def _resolve(self):
+        path = unquote(urlparse(self.path).path).lstrip("/")
+        full = os.path.realpath(os.path.join(self.root, path))
+        if not full.startswith(os.path.realpath(self.root) + os.sep) or not os.path.isfile(full):
+            return None
+        return full
+
+    def _range(self, size):
+        """(start, end) inclusive from a "bytes=a-b" header, or None for the whole file."""
+        header = self.headers.get("Range")
+        if not header or not header.startswith("bytes="):
+            return None
+        first = header[len("bytes="):].split(",")[0].strip()
+        start, _, end = first.partition("-")
+        if start:
+            start, end = int(start), int(end) if end else size - 1
+        else:
+            start, end = max(0, size - int(end)), size - 1
+        return start, min(end, size - 1)
+
+    def do_HEAD(self):
+        self._serve(body=False)
+
+    def do_GET(self):
+        self._serve(body=True)
+
+    def _serve(self, body):
+        full = self._resolve()
+        if full is None:
+            self.send_error(404)
+            return
+        if self.latency:
+            time.sleep(self.latency)
+
+        size = os.path.getsize(full)
+        try:
+            byte_range = self._range(size)
+        except ValueError:
+            byte_range = None
+        if byte_range and byte_range[0] >= size:
+            self.send_response(416)
+            self.send_header("Content-Range", f"bytes */{size}")
+            self.end_headers()
+            return
+
+        start, end = byte_range or (0, size - 1)
+        self.send_response(206 if byte_range else 200)
+        self.send_header("Content-Type", mimetypes.guess_type(full)[0] or "application/octet-stream")
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Content-Length", str(end - start + 1))
+        if byte_range:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+        self.end_headers()
+        if not body:
+            return
+
+        # Throttle: send CHUNK-sized pieces paced to the configured rate
+        with open(full, "rb") as f:
+            f.seek(start)
+            remaining = end - start + 1
+            began = time.perf_counter()
+            sent = 0
+            while remaining > 0:
+                data = f.read(min(CHUNK, remaining))
+                if not data:
+                    break
+                try:
+                    self.wfile.write(data)
+                except (BrokenPipeError, ConnectionResetError):
+                    return  # mpv closes connections when it seeks
+                sent += len(data)
+                remaining -= len(data)
+                ahead = sent / self.rate - (time.perf_counter() - began)
+                if ahead > 0:
+                    time.sleep(ahead)
+
+    def log_message(self, fmt, *args):
+        print(f"{self.address_string()} {fmt % args} (Range: {self.headers.get('Range', '-')})", flush=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve a folder over loopback HTTP with a bandwidth limit.")
+    parser.add_argument("root", help="folder to serve")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--rate", type=float, default=1.0, help="MiB/s per connection (default: 1.0)")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added before each response")
+    args = parser.parse_args(argv)
+
+    ThrottledHandler.root = args.root
+    ThrottledHandler.rate = args.rate * 1024 * 1024
+    ThrottledHandler.latency = args.latency
+
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), ThrottledHandler)
+    print(f"Serving {args.root} on http://127.0.0.1:{args.port}/ at {args.rate} MiB/s", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
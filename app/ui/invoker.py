@@ -0,0 +1,65 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2026 Michael Gasche
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+
+# File:        invoker.py
+# Version:     1.0
+# Author:      Michael Gasche
+# Created:     2026-10
+# Product:     Phosphor
+# Description: Runs callables of other threads on the Qt thread and returns their result as a future.
+
+
+from concurrent.futures import Future
+
+from PySide6.QtCore import QObject, Qt, Signal
+
+
+# --------------------------------------------------------------
+# QtInvoker class
+# --------------------------------------------------------------
+class QtInvoker(QObject):
+    """
+    invoke(fn) may be called from any thread; fn runs on the thread owning
+    this object (create it on the Qt thread) and the returned Future
+    resolves with its result or exception. Used as the control server's
+    dispatcher, so remote commands touch widgets and the player exactly
+    like UI events do.
+    """
+
+    _call = Signal(object, object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._call.connect(self._run, Qt.QueuedConnection)
+
+    def invoke(self, fn) -> Future:
+        future = Future()
+        self._call.emit(fn, future)
+        return future
+
+    def _run(self, fn, future):
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn())
+        except BaseException as e:
+            future.set_exception(e)
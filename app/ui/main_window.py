@@ -30,15 +30,26 @@
 
 import os
 import sys
-import json
 
-from threading import Thread
+from contextlib import nullcontext
 
-from helper import get_resource_path, check_metal_support
+from capabilities import CapabilityProbe
+from control_server import CONTROL_ENV, INVALID_PARAMS, ControlServer, RpcError, default_address
+from helper import get_resource_path
+from player import libmpv
+from player.cache import CACHE_BUDGET, MiB
 from player.mpv_player import MPVPlayer
-
-from PySide6.QtCore import QSize, Qt
-from PySide6.QtGui import QPixmap, QAction, QIcon
+from player.playlist import collect_videos, dialog_filter
+from player.wall import WALL_MAX_TILES, VideoWall, WallScheduler
+from player.watchdog import PlayerWatchdog
+from settings_store import SettingsStore
+from startup import STARTUP
+from ui.invoker import QtInvoker
+from ui.stats_panel import StatsPanel
+from ui.wall_panel import WallPanel
+
+from PySide6.QtCore import QSize, Qt, QTimer
+from PySide6.QtGui import QPixmap, QAction, QIcon, QPalette
 from PySide6.QtWidgets import (
     QApplication,
     QCheckBox,
@@ -70,6 +81,23 @@ APP_NAME = "Phosphor"
 APP_VERSION = "1.0"
 FULL_TITLE = f"{APP_NAME} {APP_VERSION}"
 
+# Rendering, decoding, caching and service settings
+FUSED_SHADERS = True  # one single-pass shader instead of the CRT/Scanline/VHS chain
+EFFECT_PLACEMENT = "source"  # "source" (video resolution) or "output" (window resolution, cost bounded by the display)
+LOWRES_LINES = 0  # render scanlines/VHS at this height and upscale (e.g. 480; 0 = full resolution)
+PERSISTENT_PLAYER = True  # reuse one MPV instance across file opens
+DECODE_STRATEGY = "auto"  # "auto", "software", "auto-copy" or a backend (see player/decoder.py)
+CACHE_PROFILE = "auto"  # "auto", "low-memory", "local-disk" or "network-share" (see player/cache.py)
+CACHE_MEMORY_BUDGET_MB = 1024  # demuxer cache memory shared by all players
+THUMBNAIL_INTERVAL = 10.0  # seconds between seek-bar thumbnails (0 = off)
+THUMBNAIL_CACHE_MB = 256  # thumbnail disk cache next to settings.json (least recently used are evicted)
+WALL_GPU_BUDGET_MPPS = 250  # video wall: shaded megapixels per second shared by all tiles
+WALL_CPU_TARGET = 0.8  # video wall: process CPU load (share of all cores) the scheduler stays under
+CONTROL_SERVER = False  # local JSON-RPC control socket for show control (PHOSPHOR_CONTROL=1 also enables it)
+CONTROL_ADDRESS = ""  # "" = control.sock next to settings.json (127.0.0.1:47800 on Windows), or "host:port"
+WATCHDOG_INTERVAL = 5.0  # seconds between watchdog samples (resources, heartbeat; logs/watchdog.jsonl); 0 = off
+WATCHDOG_RECOVERY_TIMEOUT = 20.0  # seconds a wedged or leaking player may take to be rebuilt and play again
+
 # Presets Definition
 PRESETS = {
     "Clean":      {"crt": False, "scan": False, "vhs": False},
@@ -78,10 +106,8 @@ PRESETS = {
 }
 CUSTOM_PRESET_NAME = "Custom"
 
-# Shader Stage Files
-CRT_STAGES = {i: get_resource_path(f"shaders/crt_base_{i}.glsl") for i in range(-5, 6)}
-SCANLINE_STAGES = {i: get_resource_path(f"shaders/scanlines_{i}.glsl") for i in range(-5, 6)}
-VHS_STAGES = {i: get_resource_path(f"shaders/vhs_noise_{i}.glsl") for i in range(-5, 6)}
+# Slider resolution: steps per shader level (-5.0 .. +5.0 in 0.1 steps)
+SLIDER_STEPS = 10
 
 # Map shader names from UI to MPVPlayer keys
 SHADER_KEY_MAP = {
@@ -175,7 +201,7 @@ class MainWindow(QMainWindow):
         controls_row.addStretch(10)
         self.open_btn = QPushButton()
         self.open_btn.setFixedSize(BTN_SIZE, BTN_SIZE)
-        self.open_btn.setIcon(QPixmap(get_resource_path("open.png")))
+        self.open_btn.setIcon(QIcon(get_resource_path("open.png")))
         self.open_btn.setIconSize(QSize(
             BTN_SIZE - ICON_PADDING,
             BTN_SIZE - ICON_PADDING
@@ -184,8 +210,9 @@ class MainWindow(QMainWindow):
         self.play_btn = QPushButton()
         self.play_btn.setFixedSize(BTN_SIZE, BTN_SIZE)
         self.play_btn.setFlat(True)
-        self.play_icon = QPixmap(get_resource_path("play.png"))
-        self.pause_icon = QPixmap(get_resource_path("pause.png"))
+        # QIcon decodes the PNG lazily, on first paint
+        self.play_icon = QIcon(get_resource_path("play.png"))
+        self.pause_icon = QIcon(get_resource_path("pause.png"))
         self.play_btn.setIcon(self.play_icon)
         self.play_btn.setIconSize(QSize(
             BTN_SIZE - ICON_PADDING,
@@ -201,25 +228,25 @@ class MainWindow(QMainWindow):
         # Shader sliders
         layout_control.addWidget(QLabel("CRT Shader Strength"))
         self.crt_slider = QSlider(Qt.Horizontal)
-        self.crt_slider.setMinimum(-5)
-        self.crt_slider.setMaximum(5)
-        self.crt_slider.setTickInterval(1)
+        self.crt_slider.setMinimum(-5 * SLIDER_STEPS)
+        self.crt_slider.setMaximum(5 * SLIDER_STEPS)
+        self.crt_slider.setTickInterval(SLIDER_STEPS)
         self.crt_slider.setTickPosition(QSlider.TicksBelow)
         layout_control.addWidget(self.crt_slider)
 
         layout_control.addWidget(QLabel("Scanline Shader Strength"))
         self.scan_slider = QSlider(Qt.Horizontal)
-        self.scan_slider.setMinimum(-5)
-        self.scan_slider.setMaximum(5)
-        self.scan_slider.setTickInterval(1)
+        self.scan_slider.setMinimum(-5 * SLIDER_STEPS)
+        self.scan_slider.setMaximum(5 * SLIDER_STEPS)
+        self.scan_slider.setTickInterval(SLIDER_STEPS)
         self.scan_slider.setTickPosition(QSlider.TicksBelow)
         layout_control.addWidget(self.scan_slider)
 
         layout_control.addWidget(QLabel("VHS Shader Strength"))
         self.vhs_slider = QSlider(Qt.Horizontal)
-        self.vhs_slider.setMinimum(-5)
-        self.vhs_slider.setMaximum(5)
-        self.vhs_slider.setTickInterval(1)
+        self.vhs_slider.setMinimum(-5 * SLIDER_STEPS)
+        self.vhs_slider.setMaximum(5 * SLIDER_STEPS)
+        self.vhs_slider.setTickInterval(SLIDER_STEPS)
         self.vhs_slider.setTickPosition(QSlider.TicksBelow)
         layout_control.addWidget(self.vhs_slider)
         layout_control.addSpacing(8)
@@ -238,7 +265,7 @@ class MainWindow(QMainWindow):
         self.crt_cb.toggled.connect(self.update_preset_combobox)
         self.scan_cb.toggled.connect(self.update_preset_combobox)
         self.vhs_cb.toggled.connect(self.update_preset_combobox)
-        self.audio_cb = QCheckBox("Retro Audio (set before loading)")
+        self.audio_cb = QCheckBox("Retro Audio")
         checkbox_layout = QVBoxLayout()
         checkbox_layout.setContentsMargins(4, 0, 0, 0)
         checkbox_layout.setSpacing(8)
@@ -262,6 +289,12 @@ class MainWindow(QMainWindow):
 
         # ---------------- Player ----------------
         self.player = None
+        # Native window that is never shown: shader prewarm instances render into it
+        self.prewarm_host = QWidget()
+        self.prewarm_host.setAttribute(Qt.WA_NativeWindow)
+        self.prewarm_host.setAttribute(Qt.WA_DontShowOnScreen)
+        self.wall = None
+        CACHE_BUDGET.set_total(CACHE_MEMORY_BUDGET_MB * MiB)
         self.retro_audio_enabled = False
 
         # ---------------- Connect signals ----------------
@@ -271,15 +304,15 @@ class MainWindow(QMainWindow):
         self.scan_cb.toggled.connect(self.on_scan_toggled)
         self.vhs_cb.toggled.connect(self.on_vhs_toggled)
         self.audio_cb.toggled.connect(self.on_audio_toggled)
-        self.crt_slider.valueChanged.connect(lambda val: self.on_shader_slider_change("CRT Shader", val))
-        self.scan_slider.valueChanged.connect(lambda val: self.on_shader_slider_change("Scanline Shader", val))
-        self.vhs_slider.valueChanged.connect(lambda val: self.on_shader_slider_change("VHS Shader", val))
+        self.crt_slider.valueChanged.connect(lambda val: self.on_shader_slider_change("CRT Shader", val / SLIDER_STEPS))
+        self.scan_slider.valueChanged.connect(lambda val: self.on_shader_slider_change("Scanline Shader", val / SLIDER_STEPS))
+        self.vhs_slider.valueChanged.connect(lambda val: self.on_shader_slider_change("VHS Shader", val / SLIDER_STEPS))
         self.preset_box.currentIndexChanged.connect(self.on_preset_changed)
 
         # ---------------- Settings ----------------
         self.settings_file = self._get_settings_file()
         self.last_dir = ""
-        self.settings = {
+        self.settings_store = SettingsStore(self.settings_file, {
             "last_dir": "",
             "crt_cb": False,
             "scan_cb": False,
@@ -288,34 +321,75 @@ class MainWindow(QMainWindow):
             "crt_slider": 0,
             "scan_slider": 0,
             "vhs_slider": 0
-        }
+        })
+        self.settings = self.settings_store.data
         self._load_settings()
         self._apply_settings_to_ui()
 
+        # ---------------- Capabilities (probed once, cached per machine) ----------------
+        self.capabilities = CapabilityProbe(os.path.join(os.path.dirname(self.settings_file), "capabilities.json"))
+        self.capabilities.start()
+
+        # ---------------- Remote control (optional) ----------------
+        self.invoker = QtInvoker(self)
+        self.control_server = None
+        if CONTROL_SERVER or os.environ.get(CONTROL_ENV) == "1":
+            self._start_control_server()
+
+        # ---------------- Watchdog (long runs: stalls, leaks) ----------------
+        self.watchdog = None
+        if WATCHDOG_INTERVAL:
+            self.watchdog = PlayerWatchdog(
+                lambda: self.player,
+                lambda snapshot: self.invoker.invoke(lambda: self._rebuild_player(snapshot)),
+                log_path=os.path.join(os.path.dirname(self.settings_file), "logs", "watchdog.jsonl"),
+                interval=WATCHDOG_INTERVAL,
+                recovery_timeout=WATCHDOG_RECOVERY_TIMEOUT,
+            )
+            self.watchdog.start()
+
+        # ---------------- Startup: window first, libmpv in the background ----------------
+        STARTUP.mark("main_window")
+        QTimer.singleShot(0, self._on_first_window)
+
         # ---------------- Keyboard Shortcuts ----------------
         if not ON_SCREEN_CONTROLLER:
             QShortcut(QKeySequence("Space"), self, activated=self.toggle_play, context=Qt.ApplicationShortcut)
-            QShortcut(QKeySequence("Right"), self, activated=lambda: self.player.mpv.command("seek", 10, "relative"), context=Qt.ApplicationShortcut)
-            QShortcut(QKeySequence("Left"), self, activated=lambda: self.player.mpv.command("seek", -10, "relative"), context=Qt.ApplicationShortcut)
-            QShortcut(QKeySequence("Up"), self, activated=lambda: self.player.mpv.command("add", "volume", 5), context=Qt.ApplicationShortcut)
-            QShortcut(QKeySequence("Down"), self, activated=lambda: self.player.mpv.command("add", "volume", -5), context=Qt.ApplicationShortcut)
-            QShortcut(QKeySequence("F"), self, activated=lambda: self.player.mpv.command("cycle", "fullscreen"), context=Qt.ApplicationShortcut)
+            QShortcut(QKeySequence("Right"), self, activated=lambda: self.player.command("seek", 10, "relative"), context=Qt.ApplicationShortcut)
+            QShortcut(QKeySequence("Left"), self, activated=lambda: self.player.command("seek", -10, "relative"), context=Qt.ApplicationShortcut)
+            QShortcut(QKeySequence("Up"), self, activated=lambda: self.player.command("add", "volume", 5), context=Qt.ApplicationShortcut)
+            QShortcut(QKeySequence("Down"), self, activated=lambda: self.player.command("add", "volume", -5), context=Qt.ApplicationShortcut)
+            QShortcut(QKeySequence("F"), self, activated=lambda: self.player.command("cycle", "fullscreen"), context=Qt.ApplicationShortcut)
+
+
+    # --------------------------------------------------------------
+    # Startup
+    # --------------------------------------------------------------
+
+    def _on_first_window(self):
+        """Event loop is running and the window is shown: load libmpv off the UI thread."""
+        STARTUP.mark("first_window")
+        libmpv.prewarm(on_done=lambda error: STARTUP.mark("libmpv_loaded"))
+
+    def open_on_start(self, files):
+        """Open files given on the command line once the window is up (several loop as a playlist)."""
+        STARTUP.expect("first_frame")
+        playlist = files if len(files) > 1 else None
+        QTimer.singleShot(0, lambda: self._open_video_file(files[0], playlist=playlist, loop=True))
+
+    def _on_playback_started(self):
+        STARTUP.mark("first_frame")
 
 
     # --------------------------------------------------------------
     # QT Dark Mode Detection
     # --------------------------------------------------------------
 
+    @staticmethod
     def qt_is_dark(reference: QWidget | None = None) -> bool:
-        if reference is None:
-            w = QWidget()
-            w.ensurePolished()
-            color = w.palette().color(w.backgroundRole())
-        else:
-            reference.ensurePolished()
-            color = reference.palette().color(reference.backgroundRole())
-
-        return color.lightness() < 128
+        """Dark mode from the application (or a widget's) palette; no widget is polished."""
+        palette = reference.palette() if reference is not None else QApplication.palette()
+        return palette.color(QPalette.Window).lightness() < 128
     
     # --------------------------------------------------------------
     # Menu setup
@@ -329,6 +403,28 @@ class MainWindow(QMainWindow):
     def setup_menu(self):
         menubar = self.menuBar()
 
+        # File Menu
+        file_menu = menubar.addMenu("&File")
+        file_menu.addAction(self.create_action("Open Video...", self.open_file))
+        file_menu.addAction(self.create_action("Play Folder (Loop)...", self.open_folder))
+        file_menu.addAction(self.create_action("Add to Queue...", self.queue_files))
+        file_menu.addSeparator()
+        file_menu.addAction(self.create_action("Next in Queue", lambda: self.player and self.player.playlist_next()))
+        file_menu.addAction(self.create_action("Previous in Queue", lambda: self.player and self.player.playlist_prev()))
+        file_menu.addSeparator()
+        file_menu.addAction(self.create_action("Video Wall...", self.open_wall))
+        file_menu.addAction(self.create_action("Stop Video Wall", self.stop_wall))
+
+        # View Menu
+        view_menu = menubar.addMenu("&View")
+        self.stats_action = self.create_action("Playback Stats", self.toggle_stats_panel)
+        self.stats_action.setCheckable(True)
+        view_menu.addAction(self.stats_action)
+        view_menu.addAction(self.create_action("Export Telemetry...", self.export_telemetry))
+        self.wall_stats_action = self.create_action("Video Wall Stats", self.toggle_wall_panel)
+        self.wall_stats_action.setCheckable(True)
+        view_menu.addAction(self.wall_stats_action)
+
         # Help Menu
         help_menu = menubar.addMenu("&Help")
         help_menu.addAction(self.create_action("About", self.show_about))
@@ -353,6 +449,34 @@ class MainWindow(QMainWindow):
         
         box.exec()
 
+    # --------------------------------------------------------------
+    # Telemetry
+    # --------------------------------------------------------------
+
+    def toggle_stats_panel(self, checked: bool):
+        if not hasattr(self, "stats_panel"):
+            self.stats_panel = StatsPanel(lambda: self.player, self)
+        self.stats_panel.setVisible(checked)
+
+    def toggle_wall_panel(self, checked: bool):
+        if not hasattr(self, "wall_panel"):
+            self.wall_panel = WallPanel(lambda: self.wall, self)
+        self.wall_panel.setVisible(checked)
+
+    def export_telemetry(self):
+        if not self.player:
+            self.show_info("Export Telemetry", "No video loaded.")
+            return
+        file, _ = QFileDialog.getSaveFileName(
+            self, "Export Telemetry", os.path.join(self.last_dir or "", "telemetry.jsonl"), "JSON Lines (*.jsonl)"
+        )
+        if file:
+            try:
+                count = self.player.export_telemetry(file)
+                self.show_info("Export Telemetry", f"{count} samples written to:\n{file}")
+            except Exception as e:
+                self.show_error("Export Telemetry", f"Export failed:\n{e}")
+
     # --------------------------------------------------------------
     # Message Boxes
     # --------------------------------------------------------------
@@ -391,11 +515,19 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event):
         try:
+            if self.watchdog:
+                self.watchdog.stop()
+                self.watchdog = None
             if self.player:
                 self.player.terminate()
                 self.player = None
+            self.stop_wall()
+            if self.control_server:
+                self.control_server.stop()
+                self.control_server = None
         except Exception as e:
             self.show_error("Error", f"Close error:\n{e}")
+        self.settings_store.close()
         event.accept()
 
     if not ON_SCREEN_CONTROLLER:
@@ -406,15 +538,15 @@ class MainWindow(QMainWindow):
             if key == Qt.Key_Space:
                 self.player.toggle_pause()
             elif key == Qt.Key_Right:
-                self.player.mpv.command("seek", 10, "relative")
+                self.player.command("seek", 10, "relative")
             elif key == Qt.Key_Left:
-                self.player.mpv.command("seek", -10, "relative")
+                self.player.command("seek", -10, "relative")
             elif key == Qt.Key_Up:
-                self.player.mpv.command("add", "volume", 5)
+                self.player.command("add", "volume", 5)
             elif key == Qt.Key_Down:
-                self.player.mpv.command("add", "volume", -5)
+                self.player.command("add", "volume", -5)
             elif key == Qt.Key_F:
-                self.player.mpv.command("cycle", "fullscreen")
+                self.player.command("cycle", "fullscreen")
 
 
     # --------------------------------------------------------------
@@ -427,7 +559,16 @@ class MainWindow(QMainWindow):
 
         self.player.toggle_pause()
         self.is_paused = not self.is_paused
+        self._update_play_button()
 
+    def set_paused(self, paused: bool):
+        if not self.player:
+            return
+        self.player.set_pause(paused)
+        self.is_paused = paused
+        self._update_play_button()
+
+    def _update_play_button(self):
         if self.is_paused:
             self.play_btn.setIcon(self.play_icon)
         else:
@@ -443,18 +584,21 @@ class MainWindow(QMainWindow):
             self.player.enable_crt(enabled)
         self.settings["crt_cb"] = enabled
         self._save_settings()
+        self._sync_wall()
 
     def on_scan_toggled(self, enabled: bool):
         if self.player:
             self.player.enable_scanlines(enabled)
         self.settings["scan_cb"] = enabled
         self._save_settings()
+        self._sync_wall()
 
     def on_vhs_toggled(self, enabled: bool):
         if self.player:
             self.player.enable_vhs(enabled)
         self.settings["vhs_cb"] = enabled
         self._save_settings()
+        self._sync_wall()
 
     def on_audio_toggled(self, enabled: bool):
         self.retro_audio_enabled = enabled
@@ -490,14 +634,7 @@ class MainWindow(QMainWindow):
     # --------------------------------------------------------------
 
     def on_shader_slider_change(self, shader_name, slider_value):
-        """Select the corresponding static shader file based on slider value (-5..5)."""
-        stage_files = {
-            "CRT Shader": CRT_STAGES,
-            "Scanline Shader": SCANLINE_STAGES,
-            "VHS Shader": VHS_STAGES
-        }
-        file = stage_files[shader_name].get(slider_value, None)
-
+        """Set the shader strength (-5.0..5.0); applied as shader parameters, no reload."""
         # Save the slider value in settings
         if shader_name == "CRT Shader":
             self.settings["crt_slider"] = slider_value
@@ -511,14 +648,17 @@ class MainWindow(QMainWindow):
         if self.player:
             key = SHADER_KEY_MAP[shader_name]
             self.player.set_shader_level(key, slider_value)
+        self._sync_wall()
 
     def on_preset_changed(self, index):
         preset_name = self.preset_box.currentText()
         if preset_name in PRESETS:
             state = PRESETS[preset_name]
-            self.crt_cb.setChecked(state["crt"])
-            self.scan_cb.setChecked(state["scan"])
-            self.vhs_cb.setChecked(state["vhs"])
+            # One shader chain update for the whole preset
+            with self.player.batch() if self.player else nullcontext():
+                self.crt_cb.setChecked(state["crt"])
+                self.scan_cb.setChecked(state["scan"])
+                self.vhs_cb.setChecked(state["vhs"])
 
 
     # --------------------------------------------------------------
@@ -527,16 +667,47 @@ class MainWindow(QMainWindow):
 
     def open_file(self):
         file, _ = QFileDialog.getOpenFileName(
-            self, "Open Video", self.last_dir or "", "Videos (*.mp4 *.mkv *.avi *.mov)"
+            self, "Open Video", self.last_dir or "", dialog_filter()
         )
         if file:
             self._open_video_file(file)
 
-    def _open_video_file(self, file):
-        """Open a video file and initialize MPV player with static shader files (-5..+5 stages)."""
+    def open_folder(self):
+        """Play all videos of a folder as a looping playlist (signage mode)."""
+        folder = QFileDialog.getExistingDirectory(self, "Play Folder", self.last_dir or "")
+        if not folder:
+            return
+        files = [str(f) for f in collect_videos([folder])]
+        if not files:
+            self.show_info("Play Folder", "No video files found in this folder.")
+            return
+        self._open_video_file(files[0], playlist=files, loop=True)
 
-        # --- Metal check ---
-        if sys.platform == "darwin" and not check_metal_support():
+    def queue_files(self):
+        """Append videos to the running playlist (or start one)."""
+        files, _ = QFileDialog.getOpenFileNames(
+            self, "Add to Queue", self.last_dir or "", dialog_filter()
+        )
+        if not files:
+            return
+        if self.player and self.player.mpv:
+            for file in files:
+                self.player.append(file)
+        else:
+            self._open_video_file(files[0], playlist=files)
+
+    def _open_video_file(self, file, playlist=None, loop=False):
+        """
+        Open a video file (or a playlist starting with it) and initialize the
+        MPV player with shader strengths (-5.0..+5.0).
+        """
+
+        # --- Metal check (result of the startup capability probe) ---
+        if not self.capabilities.metal_ready():
+            # First launch on an Intel Mac: GPU check still running, retry without blocking the UI
+            QTimer.singleShot(200, lambda: self._open_video_file(file, playlist, loop))
+            return
+        if not self.capabilities.metal_supported():
             self.show_error(
                 "Metal Support Required",
                 "Your Mac's GPU is not compatible with Phosphor's Metal-based rendering.\n\n"
@@ -545,47 +716,223 @@ class MainWindow(QMainWindow):
             )
             return
 
-        self.audio_cb.setEnabled(False)
-        
-        if self.player:
-            self.player.terminate()
-            self.player = None
-        QApplication.processEvents()
+        # A running persistent player is reused as is (effects and retro audio are live)
+        if not (self.player and PERSISTENT_PLAYER):
+            if self.player:
+                self.player.terminate()
+                self.player = None
+            QApplication.processEvents()
+            self._create_player()
+
+        # Save last directory
+        self.last_dir = os.path.dirname(file)
+        self.settings["last_dir"] = self.last_dir
+        self._save_settings()
+
+        # ---------------- Load video last ----------------
+        # Queued on the player's worker thread; a newer open cancels this one
+        if playlist:
+            self.player.load_playlist(playlist, loop=loop)
+        else:
+            self.player.load(file)
+        self.is_paused = False
+        self.play_btn.setIcon(self.pause_icon)
 
+        # ---------------- Apply slider strengths in one update ----------------
+        with self.player.batch():
+            self.player.set_shader_level("crt", self.settings.get("crt_slider", 0))
+            self.player.set_shader_level("scanlines", self.settings.get("scan_slider", 0))
+            self.player.set_shader_level("vhs", self.settings.get("vhs_slider", 0))
+
+    def _create_player(self):
+        """New MPV player with the app settings and the checkbox effects."""
         self.player = MPVPlayer(
             wid=None,  # no embedding for all platforms
             retro_audio=self.audio_cb.isChecked(),
             osc=ON_SCREEN_CONTROLLER,
-            settings=self.settings
+            settings=self.settings,
+            fused=FUSED_SHADERS,
+            cache_dir=os.path.dirname(self.settings_file),
+            decoder=DECODE_STRATEGY,
+            cache_profile=CACHE_PROFILE,
+            placement=EFFECT_PLACEMENT,
+            lowres_lines=LOWRES_LINES,
+            thumbnail_interval=THUMBNAIL_INTERVAL,
+            thumbnail_cache_bytes=THUMBNAIL_CACHE_MB * MiB,
+            prewarm_wid=int(self.prewarm_host.winId())
         )
 
         # Connect error signal
         self.player.error_signal.connect(self.show_error)
+        self.player.playback_started.connect(self._on_playback_started)
 
         # ---------------- Apply checkbox activation first ----------------
-        self.player.enable_crt(self.settings.get("crt_cb", False))
-        self.player.enable_scanlines(self.settings.get("scan_cb", False))
-        self.player.enable_vhs(self.settings.get("vhs_cb", False))
-        self.player.enable_retro_audio(self.settings.get("audio_cb", False))
+        with self.player.batch():
+            self.player.enable_crt(self.settings.get("crt_cb", False))
+            self.player.enable_scanlines(self.settings.get("scan_cb", False))
+            self.player.enable_vhs(self.settings.get("vhs_cb", False))
+            self.player.enable_retro_audio(self.settings.get("audio_cb", False))
+
+    def _rebuild_player(self, snapshot: dict):
+        """Watchdog recovery (Qt thread): the old player is already terminated or abandoned."""
+        self.player = None
+        self._create_player()
+        self.player.restore(snapshot)
+        self.is_paused = snapshot["paused"]
+        self._update_play_button()
 
-        # Save last directory
-        self.last_dir = os.path.dirname(file)
-        self.settings["last_dir"] = self.last_dir
-        self._save_settings()
 
-        def load_and_apply_shaders():
-            # ---------------- Load video last ----------------
-            self.player.load(file)
-            self.is_paused = False
-            self.play_btn.setIcon(self.pause_icon)
-            QApplication.processEvents()
-            # ---------------- Preload shaders according to slider values ----------------
-            # ⚡ Important: call on_shader_slider_change AFTER enabling checkboxes
-            self.on_shader_slider_change("CRT Shader", self.settings.get("crt_slider", 0))
-            self.on_shader_slider_change("Scanline Shader", self.settings.get("scan_slider", 0))
-            self.on_shader_slider_change("VHS Shader", self.settings.get("vhs_slider", 0))
+    # --------------------------------------------------------------
+    # Video Wall
+    # --------------------------------------------------------------
+
+    def open_wall(self):
+        """Play the videos of a folder as a grid of looping tiles (up to WALL_MAX_TILES)."""
+        folder = QFileDialog.getExistingDirectory(self, "Video Wall", self.last_dir or "")
+        if not folder:
+            return
+        clips = [str(f) for f in collect_videos([folder])][:WALL_MAX_TILES]
+        if not clips:
+            self.show_info("Video Wall", "No video files found in this folder.")
+            return
+
+        self.stop_wall()
+        screen = QApplication.primaryScreen().geometry()
+        self.wall = VideoWall(
+            clips,
+            (screen.x(), screen.y(), screen.width(), screen.height()),
+            cache_dir=os.path.dirname(self.settings_file),
+            scheduler=WallScheduler(WALL_GPU_BUDGET_MPPS, WALL_CPU_TARGET),
+            fused=FUSED_SHADERS,
+            lowres_lines=LOWRES_LINES,
+            prewarm_wid=int(self.prewarm_host.winId()),
+        )
+        self.wall.start(*self._wall_effects())
+        self.wall_stats_action.setChecked(True)
+        self.toggle_wall_panel(True)
+
+    def _wall_effects(self):
+        """(effects, levels) of the current settings, applied to every tile."""
+        effects = [e for e, key in (("crt", "crt_cb"), ("scanlines", "scan_cb"), ("vhs", "vhs_cb"))
+                   if self.settings.get(key, False)]
+        levels = {
+            "crt": self.settings.get("crt_slider", 0),
+            "scanlines": self.settings.get("scan_slider", 0),
+            "vhs": self.settings.get("vhs_slider", 0),
+        }
+        return effects, levels
+
+    def _sync_wall(self):
+        if self.wall:
+            self.wall.apply_effects(*self._wall_effects())
+
+    def stop_wall(self):
+        if self.wall:
+            self.wall.stop()
+            self.wall = None
+
 
-        Thread(target=load_and_apply_shaders, daemon=True).start()
+    # --------------------------------------------------------------
+    # Remote Control
+    # --------------------------------------------------------------
+
+    def _start_control_server(self):
+        """JSON-RPC methods run on the Qt thread, like UI events; a batch shares one shader update."""
+        def dispatch(fn):
+            def run():
+                with self.player.batch() if self.player else nullcontext():
+                    return fn()
+            return self.invoker.invoke(run)
+
+        address = CONTROL_ADDRESS or default_address(os.path.dirname(self.settings_file))
+        self.control_server = ControlServer(self.control_methods(), address, dispatch=dispatch)
+        self.control_server.start()
+
+    def control_methods(self) -> dict:
+        """Methods of the control server; params are passed as keywords."""
+        effect_boxes = {"crt": self.crt_cb, "scanlines": self.scan_cb, "vhs": self.vhs_cb, "audio": self.audio_cb}
+        level_sliders = {"crt": self.crt_slider, "scanlines": self.scan_slider, "vhs": self.vhs_slider}
+
+        def require_player():
+            if not self.player:
+                raise RpcError(INVALID_PARAMS, "No video loaded")
+            return self.player
+
+        def lookup(table, name, what):
+            if name not in table:
+                raise RpcError(INVALID_PARAMS, f"Unknown {what} {name!r} (expected one of {', '.join(table)})")
+            return table[name]
+
+        def open_(path: str = None, paths: list = None, loop: bool = False):
+            files = list(paths or []) or ([path] if path else [])
+            if not files:
+                raise RpcError(INVALID_PARAMS, "open needs path or paths")
+            self._open_video_file(files[0], playlist=files if len(files) > 1 or loop else None, loop=loop)
+            return {"opened": files}
+
+        def seek(seconds: float, mode: str = "relative"):
+            if mode not in ("relative", "absolute", "relative-percent", "absolute-percent"):
+                raise RpcError(INVALID_PARAMS, f"Unknown seek mode {mode!r}")
+            require_player().command("seek", float(seconds), mode)
+            return True
+
+        def set_effect(effect: str, enabled: bool):
+            lookup(effect_boxes, effect, "effect").setChecked(bool(enabled))
+            return True
+
+        def set_level(effect: str, level: float):
+            level = max(-5.0, min(5.0, float(level)))
+            lookup(level_sliders, effect, "effect").setValue(round(level * SLIDER_STEPS))
+            return level
+
+        def preset(name: str):
+            lookup(PRESETS, name, "preset")
+            self.preset_box.setCurrentText(name)
+            return True
+
+        def toggle_pause():
+            require_player()
+            self.toggle_play()
+            return self.is_paused
+
+        def set_paused(paused: bool):
+            require_player()
+            self.set_paused(bool(paused))
+            return True
+
+        def telemetry():
+            player = require_player()
+            return {
+                "latest": player.telemetry.latest(),
+                "cache": player.cache_usage(),
+                "thumbnails": player.thumbnail_progress(),
+                "fps_cap": player.fps_cap,
+            }
+
+        def status():
+            return {
+                "loaded": bool(self.player and self.player.mpv),
+                "paused": self.is_paused,
+                "preset": self.preset_box.currentText(),
+                "effects": {name: box.isChecked() for name, box in effect_boxes.items()},
+                "levels": {name: slider.value() / SLIDER_STEPS for name, slider in level_sliders.items()},
+                "server": dict(self.control_server.stats) if self.control_server else {},
+                "watchdog": dict(self.watchdog.stats) if self.watchdog else {},
+            }
+
+        return {
+            "open": open_,
+            "play": lambda: set_paused(False),
+            "pause": lambda: set_paused(True),
+            "toggle_pause": toggle_pause,
+            "seek": seek,
+            "set_effect": set_effect,
+            "set_level": set_level,
+            "preset": preset,
+            "telemetry": telemetry,
+            "status": status,
+            "ping": lambda: True,
+        }
 
 
     # --------------------------------------------------------------
@@ -605,13 +952,8 @@ class MainWindow(QMainWindow):
         return os.path.join(base, "settings.json")
 
     def _load_settings(self):
-        try:
-            with open(self.settings_file, "r") as f:
-                data = json.load(f)
-                self.settings.update(data)
-                self.last_dir = self.settings.get("last_dir", "")
-        except Exception:
-            pass
+        self.settings_store.load()
+        self.last_dir = self.settings.get("last_dir", "")
 
     def _apply_settings_to_ui(self):
         """Apply loaded settings to checkboxes and sliders."""
@@ -619,15 +961,12 @@ class MainWindow(QMainWindow):
         self.scan_cb.setChecked(self.settings.get("scan_cb", False))
         self.vhs_cb.setChecked(self.settings.get("vhs_cb", False))
         self.audio_cb.setChecked(self.settings.get("audio_cb", False))
-        self.crt_slider.setValue(self.settings.get("crt_slider", 0))
-        self.scan_slider.setValue(self.settings.get("scan_slider", 0))
-        self.vhs_slider.setValue(self.settings.get("vhs_slider", 0))
+        self.crt_slider.setValue(round(self.settings.get("crt_slider", 0) * SLIDER_STEPS))
+        self.scan_slider.setValue(round(self.settings.get("scan_slider", 0) * SLIDER_STEPS))
+        self.vhs_slider.setValue(round(self.settings.get("vhs_slider", 0) * SLIDER_STEPS))
 
         self.update_preset_combobox()
 
     def _save_settings(self):
-        try:
-            with open(self.settings_file, "w") as f:
-                json.dump(self.settings, f)
-        except Exception:
-            pass
+        """Coalesced, atomic write from the settings store's background thread."""
+        self.settings_store.save()
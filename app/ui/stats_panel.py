@@ -0,0 +1,97 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2026 Michael Gasche
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+
+# File:        stats_panel.py
+# Version:     1.0
+# Author:      Michael Gasche
+# Created:     2026-10
+# Product:     Phosphor
+# Description: Small playback stats panel fed by the player's telemetry.
+
+
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtGui import QFontDatabase
+from PySide6.QtWidgets import QLabel, QVBoxLayout, QWidget
+
+from player.cache import MiB
+
+
+# --------------------------------------------------------------
+# StatsPanel class
+# --------------------------------------------------------------
+class StatsPanel(QWidget):
+
+    def __init__(self, get_player, parent=None, interval_ms: int = 500):
+        """get_player returns the current MPVPlayer (or None)."""
+        super().__init__(parent, Qt.Tool)
+        self.setWindowTitle("Playback Stats")
+        self._get_player = get_player
+
+        self.label = QLabel()
+        self.label.setFont(QFontDatabase.systemFont(QFontDatabase.FixedFont))
+        self.label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(12, 12, 12, 12)
+        layout.addWidget(self.label)
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(interval_ms)
+        self.timer.timeout.connect(self.refresh)
+
+    def showEvent(self, event):
+        self.refresh()
+        self.timer.start()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self.timer.stop()
+        super().hideEvent(event)
+
+    def refresh(self):
+        player = self._get_player()
+        if not player:
+            self.label.setText("No video loaded")
+            return
+
+        t = player.telemetry.latest()
+        cache = player.cache_usage()
+        thumbs = player.thumbnail_progress()
+
+        def fmt(value, spec="{}"):
+            return "-" if value is None else spec.format(value)
+
+        rows = [
+            ("Dropped (VO)", fmt(t.get("frame-drop-count"))),
+            ("Dropped (decoder)", fmt(t.get("decoder-frame-drop-count"))),
+            ("Delayed (VO)", fmt(t.get("vo-delayed-frame-count"))),
+            ("A/V sync", fmt(t.get("avsync"), "{:+.3f} s")),
+            ("Filter fps", fmt(t.get("estimated-vf-fps"), "{:.2f}")),
+            ("Cache", fmt(cache.get("duration"), "{:.1f} s")),
+            ("Cache profile", fmt(cache.get("profile"))),
+            ("Cache fill", fmt(cache.get("fill"), "{:.0%}")),
+            ("Cache memory", fmt(cache.get("total_bytes") and cache["total_bytes"] / MiB, "{:.1f} MiB")),
+            ("Underrun", fmt(cache.get("underrun"))),
+            ("Thumbnails", f"{thumbs['done']}/{thumbs['total']}" if thumbs["total"] else "-"),
+            ("Effects", " + ".join(player._enabled_effects()) or "none"),
+        ]
+        self.label.setText("\n".join(f"{name:<18} {value}" for name, value in rows))
@@ -0,0 +1,90 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2026 Michael Gasche
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+
+# File:        wall_panel.py
+# Version:     1.0
+# Author:      Michael Gasche
+# Created:     2026-10
+# Product:     Phosphor
+# Description: Per-tile stats of the video wall (frame caps, drops, starving tiles).
+
+
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtGui import QFontDatabase
+from PySide6.QtWidgets import QLabel, QVBoxLayout, QWidget
+
+
+# --------------------------------------------------------------
+# WallPanel class
+# --------------------------------------------------------------
+class WallPanel(QWidget):
+
+    def __init__(self, get_wall, parent=None, interval_ms: int = 1000):
+        """get_wall returns the running VideoWall (or None)."""
+        super().__init__(parent, Qt.Tool)
+        self.setWindowTitle("Video Wall Stats")
+        self._get_wall = get_wall
+
+        self.label = QLabel()
+        self.label.setFont(QFontDatabase.systemFont(QFontDatabase.FixedFont))
+        self.label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(12, 12, 12, 12)
+        layout.addWidget(self.label)
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(interval_ms)
+        self.timer.timeout.connect(self.refresh)
+
+    def showEvent(self, event):
+        self.refresh()
+        self.timer.start()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self.timer.stop()
+        super().hideEvent(event)
+
+    def refresh(self):
+        wall = self._get_wall()
+        if not wall:
+            self.label.setText("No video wall running")
+            return
+
+        def fmt(value, spec="{}"):
+            return "-" if value is None else spec.format(value)
+
+        scheduler = wall.scheduler
+        lines = [
+            f"Budget {scheduler.factor:.0%} of {scheduler.gpu_budget_mpps:g} MP/s, "
+            f"CPU {fmt(scheduler.cpu_load, '{:.0%}')} (target {scheduler.cpu_target:.0%})",
+            "",
+            f"{'Tile':<5}{'Clip':<24}{'Cap':>7}{'fps':>7}{'Drop VO':>9}{'Drop dec':>10}{'Drops/s':>9}",
+        ]
+        for s in wall.tile_stats():
+            lines.append(
+                f"{s['id']:<5}{s['clip'][:23]:<24}{fmt(s['fps_cap'], '{:.1f}') if s['fps_cap'] else 'full':>7}"
+                f"{fmt(s['fps'], '{:.1f}'):>7}{fmt(s['dropped_vo']):>9}{fmt(s['dropped_decoder']):>10}"
+                f"{s['drop_rate']:>9.1f}{'  STARVING' if s['starving'] else ''}"
+            )
+        self.label.setText("\n".join(lines))
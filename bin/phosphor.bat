@@ -27,7 +27,7 @@ SET LANG=C
 echo ==> Locale: LC_NUMERIC=%LC_NUMERIC%, LANG=%LANG%
 
 REM --- 5. Run the main Phosphor Python script ---
-python app\phosphor.py
+python app\phosphor.py %*
 
 ENDLOCAL
 pause
@@ -18,4 +18,4 @@ export LANG=C
 echo "Locale: LC_NUMERIC=$LC_NUMERIC, LANG=$LANG"
 
 # Run the main Phosphor Python script
-python app/phosphor.py
+python app/phosphor.py "$@"
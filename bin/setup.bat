@@ -47,7 +47,7 @@ python -m pip install --upgrade pip setuptools wheel
 
 REM --- 7. Install required packages ---
 echo ==> Installing required packages...
-pip install PySide6 pyinstaller python-mpv
+pip install PySide6 pyinstaller python-mpv numpy
 
 REM --- 8. Check installed packages ---
 echo ==> Installed packages:
@@ -52,7 +52,7 @@ pip install --upgrade pip setuptools wheel
 
 # --- 8. Install required packages ---
 echo "==> Installing required packages..."
-pip install PySide6 pyinstaller python-mpv
+pip install PySide6 pyinstaller python-mpv numpy
 
 # --- 9. Check installed packages ---
 echo "==> Installed packages:"
@@ -0,0 +1,77 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2026 Michael Gasche
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+
+# File:        test_reference.py
+# Version:     1.0
+# Author:      Michael Gasche
+# Created:     2026-10
+# Product:     Phosphor
+# Description: Reference renderer against the committed golden images and fixed expectations.
+
+
+import sys
+
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+from player.reference import ReferenceRenderer, test_pattern as pattern, to_uint8, write_or_check_goldens
+from player.shader_builder import EFFECTS, shader_opts
+
+GOLDENS = Path(__file__).resolve().parent / "goldens" / "reference.npz"
+
+
+def test_goldens_match():
+    assert write_or_check_goldens(GOLDENS, check=True) == 0
+
+
+def test_goldens_detect_changes(monkeypatch):
+    # A slightly different parameter table must not pass the check
+    import player.reference as reference
+
+    def shifted(levels):
+        opts = shader_opts(levels)
+        opts["SCAN_STRENGTH"] = min(1.0, opts["SCAN_STRENGTH"] + 0.1)
+        return opts
+
+    monkeypatch.setattr(reference, "shader_opts", shifted)
+    assert write_or_check_goldens(GOLDENS, check=True) > 0
+
+
+def test_clean_is_identity():
+    source = pattern(48, 27)
+    assert np.array_equal(to_uint8(ReferenceRenderer(()).render(source)), source)
+
+
+def test_scanlines_on_flat_frame():
+    height, width = 27, 48
+    opts = shader_opts({e: 5.0 for e in EFFECTS})
+    out = ReferenceRenderer(("scanlines",), {e: 5.0 for e in EFFECTS}).render(np.full((height, width, 3), 0.5))
+
+    v = (np.arange(height) + 0.5) / height
+    scan = np.sin(v * opts["SCAN_DENSITY"]) * 0.5 + 0.5
+    modulation = opts["SCAN_DARK_LEVEL"] + (opts["SCAN_BRIGHT_LEVEL"] - opts["SCAN_DARK_LEVEL"]) * scan
+    expected = 0.5 * ((1.0 - opts["SCAN_STRENGTH"]) + modulation * opts["SCAN_STRENGTH"])
+    assert np.allclose(out, expected[:, None, None], atol=1e-5)